@@ -0,0 +1,7 @@
+"""
+Benchmarks für PyLife.
+
+Ausführen aus dem Verzeichnis oberhalb von ``PyLife``, z.B.::
+
+    python -m PyLife.benchmarks.bench_food_grid
+"""
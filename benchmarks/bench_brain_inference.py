@@ -0,0 +1,50 @@
+"""
+Benchmark: Auswertung der Gehirne ohne Visualisierungsdaten.
+
+Vergleicht pro Kreatur ``Brain.forward`` (speichert Eingaben, Schichten und
+``neuron_values`` für die Anzeige) mit dem schlanken ``Brain.infer`` auf
+vorallokierten Puffern sowie die gebatchte Auswertung mit ``BrainBatch``.
+
+    python -m PyLife.benchmarks.bench_brain_inference [--brains 2000] [--ticks 50]
+"""
+import argparse
+import time
+import numpy as np
+from PyLife.brain import Brain, BrainBatch
+
+
+def measure(step, ticks):
+    """Mittlere Zeit pro Tick in Millisekunden"""
+    step()  # Aufwärmen
+    start = time.perf_counter()
+    for _ in range(ticks):
+        step()
+    return (time.perf_counter() - start) / ticks * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--brains", type=int, default=2000)
+    parser.add_argument("--ticks", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    brains = Brain.create_many(args.brains, 8, 16, 2)
+    inputs = np.random.uniform(-1, 1, (args.brains, 8))
+    rows = [inputs[i:i + 1] for i in range(args.brains)]
+    batch = BrainBatch(brains)
+
+    for brain, row in zip(brains, rows):
+        assert np.allclose(brain.infer(row), brain.forward(row))
+
+    forward = measure(lambda: [brain.forward(row) for brain, row in zip(brains, rows)], args.ticks)
+    infer = measure(lambda: [brain.infer(row) for brain, row in zip(brains, rows)], args.ticks)
+    batched = measure(lambda: batch.forward(inputs), args.ticks)
+
+    print(f"{args.brains} Gehirne, Zeit pro Tick:")
+    print(f"  forward (mit Aufzeichnung): {forward:8.2f} ms")
+    print(f"  infer (Puffer):             {infer:8.2f} ms")
+    print(f"  BrainBatch.forward:         {batched:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
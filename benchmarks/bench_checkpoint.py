@@ -0,0 +1,60 @@
+"""
+Benchmark: Schreiben und Laden von Checkpoints.
+
+Misst ``save_checkpoint`` und ``load_checkpoint`` für eine Welt mit vielen
+Entities (Standard: 10.000) samt Nahrung und Abfall sowie die Dateigröße.
+
+    python -m PyLife.benchmarks.bench_checkpoint [--entities 10000] [--repeat 3]
+"""
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+from PyLife.simulation import Simulation
+from PyLife.checkpoint import save_checkpoint, load_checkpoint
+
+
+def build_world(entities):
+    """Erstellt eine Welt mit ``entities`` Kreaturen, halb so viel Nahrung und etwas Abfall"""
+    side = int(200 * np.sqrt(entities))
+    sim = Simulation(side, side)
+    sim.spawn_entities(entities)
+    for _ in range(entities // 2):
+        sim.spawn_food()
+    for x, y in np.random.uniform(20, side - 20, (entities // 4, 2)):
+        sim.spawn_waste(x, y, 0.5, 0.5)
+    sim.update(1 / 60)
+    return sim
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    sim = build_world(args.entities)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "welt.npz")
+
+        save_times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            save_checkpoint(sim, path)
+            save_times.append(time.perf_counter() - start)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+
+        start = time.perf_counter()
+        loaded = load_checkpoint(path)
+        load_time = time.perf_counter() - start
+        assert len(loaded.entities) == args.entities
+
+    print(f"{args.entities} Entities, {len(sim.food)} Nahrung, {len(sim.waste)} Abfall")
+    print(f"  Schreiben: {min(save_times) * 1000:8.1f} ms (bestes von {args.repeat})")
+    print(f"  Laden:     {load_time * 1000:8.1f} ms")
+    print(f"  Datei:     {size_mb:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: Zeichnen von 1.000 Kreaturen pro Frame.
+
+Vergleicht das frühere Drehen der Textur in jedem Frame
+(``pygame.transform.rotate``) mit dem Cache vorgedrehter Texturen und misst
+zusätzlich den kompletten ``Entity.draw``-Pfad sowie ``Simulation.draw``
+mit Viewport-Culling.
+
+    python -m PyLife.benchmarks.bench_entity_draw [--entities 1000] [--frames 30] [--rotation-mb 64]
+
+Die Winkel sind pro Frame zufällig, also der ungünstigste Fall für das
+Speicherbudget der gedrehten Varianten (``--rotation-mb``).
+"""
+import argparse
+import os
+import time
+import numpy as np
+import pygame
+from PyLife.simulation import Simulation
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--rotation-mb", type=float, default=None,
+                        help="Speicherbudget der gedrehten Varianten (Standard: Renderer-Vorgabe)")
+    args = parser.parse_args(argv)
+
+    # Display (ggf. ohne Fenster) initialisieren, damit convert_alpha greift
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 800))
+
+    sim = Simulation(1200, 800)
+    for _ in range(args.entities):
+        sim.spawn_entity()
+    entities = sim.entities
+    renderer = entities[0].renderer
+    if args.rotation_mb is not None:
+        renderer.rotation_bytes = int(args.rotation_mb * 1024 * 1024)
+    textures = [entity.texture for entity in entities]
+    angles = np.random.uniform(0, 2 * np.pi, (args.frames, len(entities)))
+
+    def run(draw_frame):
+        start = time.perf_counter()
+        for frame in range(args.frames):
+            screen.fill((240, 240, 245))
+            draw_frame(frame)
+        return (time.perf_counter() - start) / args.frames
+
+    def rotate_every_frame(frame):
+        for entity, texture, angle in zip(entities, textures, angles[frame]):
+            rotated = pygame.transform.rotate(texture, -angle * 180 / np.pi)
+            pos = entity.body.position
+            screen.blit(rotated, (pos.x - rotated.get_width() / 2, pos.y - rotated.get_height() / 2))
+
+    def rotation_cache(frame):
+        for entity, angle in zip(entities, angles[frame]):
+            rotated = renderer.get_rotated(entity._dna_dict, angle, key=entity._texture_key)
+            pos = entity.body.position
+            screen.blit(rotated, (pos.x - rotated.get_width() / 2, pos.y - rotated.get_height() / 2))
+
+    def full_draw(frame):
+        for entity, angle in zip(entities, angles[frame]):
+            entity.body.angle = angle
+            entity.draw(screen)
+
+    # Alle Winkelstufen einmal aufbauen (entspricht einem eingeschwungenen Lauf)
+    for angle in np.linspace(0, 2 * np.pi, renderer.rotation_buckets, endpoint=False):
+        for entity in entities:
+            renderer.get_rotated(entity._dna_dict, angle, key=entity._texture_key)
+
+    before = run(rotate_every_frame)
+    after = run(rotation_cache)
+    draw = run(full_draw)
+
+    print(f"{len(entities)} Kreaturen, {args.frames} Frames")
+    print(f"  Drehen pro Frame:        {before * 1000:7.1f} ms/Frame ({1 / before:6.1f} FPS)")
+    print(f"  Vorgedrehter Cache:      {after * 1000:7.1f} ms/Frame ({1 / after:6.1f} FPS)")
+    print(f"  Entity.draw komplett:    {draw * 1000:7.1f} ms/Frame ({1 / draw:6.1f} FPS)")
+    rotated_bytes = renderer.cache_stats()['rotation_bytes']
+    print(f"  Cache: {renderer.cache_stats()}")
+    print(f"  Speicher gedrehter Texturen: {rotated_bytes / 1024 / 1024:.1f} MB")
+
+    # Simulation.draw mit Viewport-Culling bei 2-fachem Zoom (ein Viertel der Welt sichtbar)
+    sim.zoom = 2.0
+    sim.draw(screen)  # Aufwärmen: gedrehte Texturen für die neue Zoomstufe
+    culled = run(lambda frame: sim.draw(screen))
+    print(f"  Simulation.draw (Zoom 2): {culled * 1000:7.1f} ms/Frame ({1 / culled:6.1f} FPS)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: Zeichnen von Nahrung.
+
+Vergleicht das frühere Zeichnen (Glow-Surface und 3-11 Kreise pro Stück und
+Frame) mit dem ``FoodAtlas``, der vorgerenderte Sprites mit einem einzigen
+``Surface.blits``-Aufruf zeichnet.
+
+    python -m PyLife.benchmarks.bench_food_draw [--counts 500 2000 5000] [--frames 20]
+"""
+import argparse
+import random
+import os
+import time
+import pygame
+import pymunk
+from PyLife.world_food import Food, FoodAtlas, _render_food
+
+WIDTH, HEIGHT = 1200, 800
+
+
+def build_food(count):
+    """Erstellt ``count`` zufällige Nahrungsobjekte im Bild"""
+    random.seed(0)
+    space = pymunk.Space()
+    return [Food(space, random.uniform(0, WIDTH), random.uniform(0, HEIGHT)) for _ in range(count)]
+
+
+def draw_legacy(foods, screen):
+    """Früheres Zeichnen: jedes Stück wird in jedem Frame neu gerendert"""
+    for food in foods:
+        pos = (int(food.body.position.x), int(food.body.position.y))
+        _render_food(screen, pos, food.radius, food.quality)
+
+
+def measure(draw, screen, frames):
+    """Mittlere Zeit pro Frame in Millisekunden"""
+    draw(screen)  # Aufwärmen (füllt u.a. den Atlas)
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw(screen)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.Surface((WIDTH, HEIGHT))
+
+    print(f"{'Nahrung':>8} {'Vorher [ms]':>12} {'Atlas [ms]':>11} {'Sprites':>8}")
+    for count in args.counts:
+        foods = build_food(count)
+        atlas = FoodAtlas()
+        legacy = measure(lambda s: draw_legacy(foods, s), screen, args.frames)
+        batched = measure(lambda s: atlas.draw(s, foods), screen, args.frames)
+        print(f"{count:>8} {legacy:>12.2f} {batched:>11.2f} {len(atlas):>8}")
+
+
+if __name__ == "__main__":
+    main()
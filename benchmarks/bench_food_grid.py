@@ -0,0 +1,76 @@
+"""
+Benchmark: Tickzeit und Kollisionsprüfung Entity/Nahrung gegen die Weltgröße.
+
+Vergleicht die Nahrungs-Kollisionsprüfung per Gitter mit der Prüfung aller
+Paare und misst die gesamte Tickzeit von ``Simulation.update`` (in der die
+Nahrungsaufnahme inzwischen über Pymunk-Kollisionshandler läuft).
+"""
+import time
+import numpy as np
+from PyLife.simulation import Simulation
+
+# (Entities, Nahrung) pro Messpunkt
+POPULATIONS = [(100, 500), (250, 1250), (500, 2500), (1000, 5000)]
+TICKS = 5
+
+# Größter möglicher Nahrungsradius (siehe Food: 5 + 10 * size, size <= 1)
+MAX_FOOD_RADIUS = 15
+
+
+def build_world(entities, food):
+    """Erstellt eine Welt, deren Fläche mit der Population wächst"""
+    side = int(200 * np.sqrt(entities))
+    sim = Simulation(side, side)
+    for _ in range(entities):
+        sim.spawn_entity()
+    for _ in range(food):
+        sim.spawn_food()
+    return sim
+
+
+def collisions_brute_force(sim):
+    """Frühere Prüfung: jede Entity gegen jede Nahrung"""
+    hits = 0
+    for entity in sim.entities:
+        for food in sim.food:
+            if (entity.body.position - food.body.position).length < entity.radius + food.radius:
+                hits += 1
+    return hits
+
+
+def collisions_grid(sim):
+    """Prüfung über das Nahrungsgitter"""
+    hits = 0
+    for entity in sim.entities:
+        pos = entity.body.position
+        for food in sim.food_grid.query(pos.x, pos.y, entity.radius + MAX_FOOD_RADIUS):
+            if (pos - food.body.position).length < entity.radius + food.radius:
+                hits += 1
+    return hits
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(f"{'Entities':>8} {'Nahrung':>8} {'Paare [ms]':>11} {'Gitter [ms]':>12} {'Tick [ms]':>10}")
+    for entities, food in POPULATIONS:
+        sim = build_world(entities, food)
+        brute_hits, brute_time = timed(collisions_brute_force, sim)
+        grid_hits, grid_time = timed(collisions_grid, sim)
+        assert brute_hits == grid_hits
+
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            sim.update(1.0 / 60)
+        tick_time = (time.perf_counter() - start) / TICKS
+
+        print(f"{entities:>8} {food:>8} {brute_time * 1000:>11.1f} "
+              f"{grid_time * 1000:>12.1f} {tick_time * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
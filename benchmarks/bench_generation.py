@@ -0,0 +1,75 @@
+"""
+Benchmark: Kosten eines Generationswechsels gegen die Populationsgröße.
+
+Misst Selektion und Mutation auf der Genommatrix getrennt vom Aufbau der
+neuen Entities sowie den kompletten ``Simulation.next_generation``-Aufruf.
+Zum Vergleich läuft die frühere Variante (Sortieren nach ``fitness``,
+``DNA.copy`` und ``mutate`` je Nachkomme) auf derselben Population.
+
+    python -m PyLife.benchmarks.bench_generation [--sizes 500 2000 5000]
+"""
+import argparse
+import random
+import time
+import numpy as np
+from PyLife.simulation import Simulation
+
+
+def build_world(size):
+    """Erstellt eine Simulation mit ``size`` Entities und gestreuter Fitness"""
+    side = int(200 * np.sqrt(size))
+    sim = Simulation(side, side)
+    sim.population_size = size
+    for _ in range(size):
+        sim.spawn_entity()
+    for entity in sim.entities:
+        entity.food_eaten = random.randint(0, 10)
+        entity.distance_traveled = random.uniform(0, 1000)
+    return sim
+
+
+def breed_sequential(sim):
+    """Frühere Variante ohne den Aufbau der Entities"""
+    entities = sorted(sim.entities, key=lambda x: x.fitness, reverse=True)
+    survivors = entities[:max(2, int(len(entities) * 0.2))]
+    children = []
+    while len(survivors) + len(children) < sim.population_size:
+        parent = random.choice(survivors)
+        child_dna = parent.dna.copy()
+        child_dna.mutate(parent.dna['reproduction']['mutation_rate'])
+        children.append(child_dna)
+    return children
+
+
+def breed_vectorized(sim):
+    """Selektion per argpartition und Mutation auf der Genommatrix"""
+    entities = sim.entities
+    count = max(2, int(len(entities) * 0.2))
+    fitness = sim.population_fitness(entities)
+    top = np.argpartition(-fitness, count - 1)[:count]
+    survivors = [entities[i] for i in top]
+    return sim._breed_genomes(survivors, sim.population_size - count)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 5000])
+    args = parser.parse_args(argv)
+
+    print(f"{'Entities':>8} {'Sequentiell [ms]':>17} {'Genommatrix [ms]':>17} {'next_generation [ms]':>21}")
+    for size in args.sizes:
+        sim = build_world(size)
+        sequential = timed(breed_sequential, sim)
+        vectorized = timed(breed_vectorized, sim)
+        full = timed(sim.next_generation)
+        print(f"{size:>8} {sequential * 1000:>17.1f} {vectorized * 1000:>17.1f} {full * 1000:>21.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark: Physikkosten über viele Generationswechsel.
+
+Führt viele kurze Generationen aus und gibt in regelmäßigen Abständen die
+Anzahl der Körper im Space sowie die Dauer von ``space.step`` aus. Ohne
+Leck bleiben beide über alle Generationen konstant.
+
+    python -m PyLife.benchmarks.bench_lifecycle [--generations 1000]
+"""
+import argparse
+import time
+from PyLife.headless import HeadlessRunner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--generations", type=int, default=1000)
+    parser.add_argument("--ticks-per-generation", type=int, default=5)
+    parser.add_argument("--population", type=int, default=20)
+    parser.add_argument("--every", type=int, default=100, help="Ausgabe alle N Generationen")
+    args = parser.parse_args(argv)
+
+    runner = HeadlessRunner(population=args.population, food=30,
+                            ticks_per_generation=args.ticks_per_generation)
+    sim = runner.simulation
+    sim.population_size = args.population
+
+    def measure_step(steps=50):
+        start = time.perf_counter()
+        for _ in range(steps):
+            sim.space.step(runner.dt)
+        return (time.perf_counter() - start) / steps
+
+    print(f"{'Generation':>10} {'Körper':>7} {'Erwartet':>9} {'step [ms]':>10}")
+    for done in range(0, args.generations + 1, args.every):
+        if done:
+            runner.run(generations=args.every)
+        counts = sim.lifecycle.counts()
+        print(f"{done:>10} {counts['bodies']:>7} {sim.lifecycle.expected_bodies():>9} "
+              f"{measure_step() * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: Nachbarschaftsabfragen für das Hormonsystem.
+
+Vergleicht die frühere lineare Suche in ``get_nearby_entities`` mit der
+Abfrage über das Entity-Gitter und der vektorisierten Zählung aller Paare
+(``Simulation.count_nearby_entities``). Die Weltfläche wächst mit der
+Population, die Dichte bleibt also gleich.
+
+    python -m PyLife.benchmarks.bench_neighbors [--sizes 500 2000 10000]
+"""
+import argparse
+import time
+import numpy as np
+from PyLife.simulation import Simulation
+
+# Für große Populationen wird die lineare Suche nur für eine Stichprobe
+# gemessen und auf die ganze Population hochgerechnet
+LINEAR_SAMPLE = 200
+
+
+def build_world(entities):
+    """Erstellt eine Welt, deren Fläche mit der Population wächst"""
+    side = int(200 * np.sqrt(entities))
+    sim = Simulation(side, side)
+    for _ in range(entities):
+        sim.spawn_entity()
+    return sim
+
+
+def nearby_linear(entity, entities):
+    """Frühere Suche: Abstand zu jeder anderen Entity"""
+    nearby = []
+    for other in entities:
+        if other != entity:
+            distance = (other.body.position - entity.body.position).length
+            if distance <= entity.sensor_range:
+                nearby.append(other)
+    return nearby
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 10000])
+    args = parser.parse_args(argv)
+
+    print(f"{'Entities':>8} {'Linear [ms]':>12} {'Gitter [ms]':>12} {'Vektor [ms]':>12}")
+    for size in args.sizes:
+        sim = build_world(size)
+        entities = sim.entities
+
+        # Lineare Suche (ggf. Stichprobe, hochgerechnet)
+        sample = entities[:min(size, LINEAR_SAMPLE)]
+        start = time.perf_counter()
+        linear_counts = [len(nearby_linear(entity, entities)) for entity in sample]
+        linear_time = (time.perf_counter() - start) * size / len(sample)
+
+        # Abfrage je Entity über das Gitter
+        start = time.perf_counter()
+        grid_counts = [len(entity.get_nearby_entities()) for entity in entities]
+        grid_time = time.perf_counter() - start
+
+        # Vektorisierte Zählung für die ganze Population
+        start = time.perf_counter()
+        vector_counts = sim.count_nearby_entities()
+        vector_time = time.perf_counter() - start
+
+        assert grid_counts[:len(sample)] == linear_counts
+        assert list(vector_counts) == grid_counts
+
+        print(f"{size:>8} {linear_time * 1000:>12.1f} {grid_time * 1000:>12.1f} "
+              f"{vector_time * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: NeuralNetwork-Backends im Vergleich.
+
+Misst die Latenz von ``predict`` und den Speicherbedarf von 1.000 Netzen
+für das NumPy-Backend und (falls installiert) das TensorFlow-Backend.
+
+    python -m PyLife.benchmarks.bench_neural_network [--networks 1000] [--calls 200]
+"""
+import argparse
+import importlib.util
+import resource
+import time
+import numpy as np
+from PyLife.neural_network import NeuralNetwork
+
+
+def max_rss_mb():
+    """Maximaler Resident Set Size des Prozesses in MB (Linux: ru_maxrss in KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bench_backend(backend, networks, calls):
+    """Misst Import/Erstellung, predict-Latenz und Speicher für ein Backend"""
+    rss_before = max_rss_mb()
+    start = time.perf_counter()
+    nets = [NeuralNetwork(backend=backend) for _ in range(networks)]
+    create_time = time.perf_counter() - start
+    rss_after = max_rss_mb()
+
+    inputs = np.random.uniform(-1, 1, 8)
+    net = nets[0]
+    net.predict(inputs)  # Aufwärmen
+    start = time.perf_counter()
+    for _ in range(calls):
+        net.predict(inputs)
+    latency = (time.perf_counter() - start) / calls
+
+    weight_bytes = sum(w.nbytes for n in nets for w in n.get_weights())
+    return {
+        'create_s': create_time,
+        'predict_us': latency * 1e6,
+        'weights_mb': weight_bytes / 1024 / 1024,
+        'rss_growth_mb': rss_after - rss_before,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--networks", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    backends = ['numpy']
+    if importlib.util.find_spec('tensorflow') is not None:
+        backends.append('tensorflow')
+    else:
+        print("tensorflow nicht installiert - nur NumPy-Backend wird gemessen")
+
+    print(f"{'Backend':>10} {'Erstellen [s]':>14} {'predict [µs]':>13} "
+          f"{'Gewichte [MB]':>14} {'RSS-Zuwachs [MB]':>17}")
+    for backend in backends:
+        result = bench_backend(backend, args.networks, args.calls)
+        print(f"{backend:>10} {result['create_s']:>14.2f} {result['predict_us']:>13.1f} "
+              f"{result['weights_mb']:>14.2f} {result['rss_growth_mb']:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: Nahrung erzeugen und entfernen mit und ohne Objekt-Pool.
+
+Simuliert eine belebte Welt, in der pro Runde ein Teil der Nahrung
+gefressen und neu gespawnt wird. Verglichen werden die frühere Variante
+(neuer Körper pro Spawn, ``list.remove``) und der Pool mit Swap-Remove.
+
+    python -m PyLife.benchmarks.bench_pools [--food 5000] [--churn 1000] [--rounds 20]
+"""
+import argparse
+import random
+import time
+import pymunk
+from PyLife.simulation import Simulation
+from PyLife.world_food import Food
+
+
+def churn_plain(food_count, churn, rounds):
+    """Frühere Variante: jedes Mal neue Körper, lineares Entfernen"""
+    space = pymunk.Space()
+    food = [Food(space, random.uniform(0, 2000), random.uniform(0, 2000)) for _ in range(food_count)]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in random.sample(food, churn):
+            space.remove(item.body, item.shape)
+            food.remove(item)
+        for _ in range(churn):
+            food.append(Food(space, random.uniform(0, 2000), random.uniform(0, 2000)))
+    return time.perf_counter() - start
+
+
+def churn_pooled(food_count, churn, rounds):
+    """Pool mit Swap-Remove über den Lifecycle-Manager der Simulation"""
+    sim = Simulation(2000, 2000)
+    for _ in range(food_count):
+        sim.spawn_food()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in random.sample(sim.food, churn):
+            sim.remove_food(item)
+        for _ in range(churn):
+            sim.spawn_food()
+    return time.perf_counter() - start, sim.lifecycle.pool_stats()['food']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--food", type=int, default=5000)
+    parser.add_argument("--churn", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    plain = churn_plain(args.food, args.churn, args.rounds)
+    pooled, stats = churn_pooled(args.food, args.churn, args.rounds)
+    print(f"{args.food} Nahrung, {args.churn} Wechsel pro Runde, {args.rounds} Runden")
+    print(f"  Ohne Pool:  {plain * 1000:8.1f} ms")
+    print(f"  Mit Pool:   {pooled * 1000:8.1f} ms")
+    print(f"  Pool: {stats['hit_rate'] * 100:.1f}% Treffer, {stats['allocations']} Allokationen, "
+          f"{stats['hits']} Wiederverwendungen")
+
+
+if __name__ == "__main__":
+    main()
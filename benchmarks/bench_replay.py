@@ -0,0 +1,76 @@
+"""
+Benchmark: Aufzeichnungskosten und Sprungzeit von Replays.
+
+Misst den Anteil der Phase ``recording`` an der Tick-Zeit (über den
+Phasen-Profiler) sowie die Zeit, um im ``ReplayPlayer`` zu einem beliebigen Tick zu springen
+und ihn darzustellen.
+
+    python -m PyLife.benchmarks.bench_replay [--entities 200 1000] [--ticks 200]
+"""
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+
+
+def build_world(entities):
+    """Erstellt eine Welt mit ``entities`` Kreaturen und ebenso viel Nahrung"""
+    from PyLife.simulation import Simulation
+    side = int(200 * np.sqrt(entities))
+    sim = Simulation(side, side)
+    sim.spawn_entities(entities)
+    for _ in range(entities):
+        sim.spawn_food()
+    sim.update(1 / 60)
+    return sim
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from PyLife.replay import ReplayPlayer
+
+    with tempfile.TemporaryDirectory() as directory:
+        for entities in args.entities:
+            path = os.path.join(directory, f"lauf_{entities}.replay")
+
+            # Anteil der Aufzeichnung an der Tick-Zeit über den Phasen-Profiler
+            sim = build_world(entities)
+            sim.enable_profiling(window=args.ticks)
+            sim.start_recording(path)
+            for _ in range(args.ticks):
+                sim.update(1 / 60)
+            sim.stop_recording()
+            stats = sim.profile_stats()
+            total = stats['total']['mean']
+            recording = stats['recording']['mean']
+
+            player = ReplayPlayer(path)
+            surface = pygame.Surface((1280, 720))
+            ticks = np.random.randint(0, len(player), 50).tolist()
+            start = time.perf_counter()
+            for tick in ticks:
+                player.show(tick)
+            show_time = (time.perf_counter() - start) / len(ticks)
+            start = time.perf_counter()
+            for tick in ticks:
+                player.draw(surface, tick=tick)
+            draw_time = (time.perf_counter() - start) / len(ticks)
+            size_mb = os.path.getsize(path) / 1024 / 1024
+
+            print(f"{entities} Entities, {len(sim.food)} Nahrung, {len(sim.waste)} Abfall")
+            print(f"  Tick gesamt:       {total:8.3f} ms")
+            print(f"  davon Aufzeichnung:{recording:8.3f} ms ({recording / total * 100:.1f} %)")
+            print(f"  Sprung (show):     {show_time * 1000:8.3f} ms")
+            print(f"  Sprung + Zeichnen: {draw_time * 1000:8.3f} ms")
+            print(f"  Datei:             {size_mb:8.2f} MB ({len(player)} Ticks)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: Besiedeln einer Welt mit vielen Entities.
+
+Vergleicht ``spawn_entity`` in einer Schleife mit dem Bulk-Pfad
+``Simulation.spawn_entities`` (Genome und Gehirngewichte als Blöcke,
+ein ``space.add`` für alle Körper).
+
+    python -m PyLife.benchmarks.bench_spawn [--sizes 1000 5000] [--repeat 3]
+"""
+import argparse
+import time
+from PyLife.simulation import Simulation
+
+
+def seed_loop(size):
+    """Bisheriger Weg: eine Entity nach der anderen"""
+    sim = Simulation(4000, 4000)
+    for _ in range(size):
+        sim.spawn_entity()
+    return sim
+
+
+def seed_bulk(size):
+    """Bulk-Pfad"""
+    sim = Simulation(4000, 4000)
+    sim.spawn_entities(size)
+    return sim
+
+
+def measure(seed, size, repeat):
+    """Beste Laufzeit aus ``repeat`` Durchläufen in Millisekunden"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        sim = seed(size)
+        best = min(best, time.perf_counter() - start)
+        assert len(sim.entities) == size and sim.lifecycle.is_consistent()
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'Entities':>8} {'Schleife [ms]':>14} {'Bulk [ms]':>10} {'Faktor':>7}")
+    for size in args.sizes:
+        loop = measure(seed_loop, size, args.repeat)
+        bulk = measure(seed_bulk, size, args.repeat)
+        print(f"{size:>8} {loop:>14.1f} {bulk:>10.1f} {loop / bulk:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
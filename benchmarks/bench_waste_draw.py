@@ -0,0 +1,77 @@
+"""
+Benchmark: Zeichnen von Abfall.
+
+Vergleicht das frühere Zeichnen (ein Kreis plus ``int(radius * 2)``
+zufällige Punkte pro Stück und Frame) mit ``WasteField.draw``, das
+vorgerenderte Sprites mit einem einzigen ``Surface.blits``-Aufruf zeichnet.
+
+    python -m PyLife.benchmarks.bench_waste_draw [--counts 500 2000 5000] [--frames 20]
+"""
+import argparse
+import os
+import time
+import numpy as np
+import pygame
+from PyLife.world_waste import WasteField
+
+WIDTH, HEIGHT = 1200, 800
+
+
+def build_field(count, seed=0):
+    """Erstellt ein Abfallfeld mit ``count`` Stücken im Bild"""
+    rng = np.random.RandomState(seed)
+    field = WasteField()
+    for _ in range(count):
+        field.add(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), rng.uniform(0.5, 3.0), 0.5)
+    return field
+
+
+def draw_legacy(field, screen):
+    """Früheres Zeichnen: Punktmuster wird in jedem Frame neu gewürfelt"""
+    base_r, base_g, base_b = field.BASE_COLOR
+    for row in range(len(field)):
+        variation = field.shade[row]
+        color = (min(255, max(0, int(base_r + variation))),
+                 min(255, max(0, int(base_g + variation))),
+                 min(255, max(0, int(base_b + variation))))
+        pattern_color = tuple(max(0, c - 20) for c in color)
+        pos = (int(field.x[row]), int(field.y[row]))
+        radius = 3 * field.size[row]
+        pygame.draw.circle(screen, color, pos, int(radius))
+        for _ in range(int(radius * 2)):
+            angle = np.random.uniform(0, 2 * np.pi)
+            distance = np.random.uniform(0, radius * 0.8)
+            dot_pos = (int(pos[0] + np.cos(angle) * distance),
+                       int(pos[1] + np.sin(angle) * distance))
+            pygame.draw.circle(screen, pattern_color, dot_pos, max(1, int(radius * 0.1)))
+
+
+def measure(draw, screen, frames):
+    """Mittlere Zeit pro Frame in Millisekunden"""
+    draw(screen)  # Aufwärmen (füllt u.a. den Sprite-Cache)
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw(screen)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.Surface((WIDTH, HEIGHT))
+
+    print(f"{'Abfall':>8} {'Vorher [ms]':>12} {'Sprites [ms]':>13} {'Sprites':>8}")
+    for count in args.counts:
+        field = build_field(count)
+        legacy = measure(lambda s: draw_legacy(field, s), screen, args.frames)
+        batched = measure(field.draw, screen, args.frames)
+        print(f"{count:>8} {legacy:>12.2f} {batched:>13.2f} {len(field._sprites):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,10 @@ class Brain:
         # Eingabewerte speichern für die Visualisierung
         self.input_values = np.zeros(input_size)
         
+        # Vorallokierte Puffer für ``infer``
+        self._hidden = np.zeros(hidden_size)
+        self._output = np.zeros((1, output_size))
+        
         # Namen der Eingabeneuronen für die Visualisierung
         self.input_names = [
             "Energie", "Gesundheit", "Hunger", "Alter", 
@@ -37,8 +41,45 @@ class Brain:
         # Namen der Ausgabeneuronen für die Visualisierung
         self.output_names = ["Vorwärts", "Drehung"]
         
+    @classmethod
+    def create_many(cls, count, input_size, hidden_size, output_size):
+        """Erstellt ``count`` zufällig initialisierte Netze
+        
+        Die Gewichte aller Netze werden mit je einem Zufallsaufruf als
+        zusammenhängende Blöcke erzeugt; jedes Brain erhält Sichten darauf.
+        """
+        weights_ih = np.random.uniform(-1.0, 1.0, (count, hidden_size, input_size))
+        weights_ho = np.random.uniform(-1.0, 1.0, (count, output_size, hidden_size))
+        bias_h = np.random.uniform(-1.0, 1.0, (count, hidden_size))
+        bias_o = np.random.uniform(-1.0, 1.0, (count, output_size))
+        return [
+            cls(input_size, hidden_size, output_size, values={
+                'weights_ih': weights_ih[i],
+                'weights_ho': weights_ho[i],
+                'bias_h': bias_h[i],
+                'bias_o': bias_o[i],
+            })
+            for i in range(count)
+        ]
+    
+    def infer(self, inputs):
+        """Vorwärtsdurchlauf ohne Visualisierungsdaten
+        
+        Liefert dasselbe wie ``forward``, schreibt aber nur in vorallokierte
+        Puffer und speichert keine Aktivierungen. Die Rückgabe (1×output_size)
+        ist ein Puffer, der beim nächsten Aufruf überschrieben wird.
+        """
+        hidden = self._hidden
+        np.dot(self.weights_ih, inputs.reshape(-1), out=hidden)
+        hidden += self.bias_h
+        np.tanh(hidden, out=hidden)
+        output = self._output
+        np.dot(self.weights_ho, hidden, out=output[0])
+        output += self.bias_o
+        return output
+    
     def forward(self, inputs):
-        """Führt einen Vorwärtsdurchlauf durch"""
+        """Führt einen Vorwärtsdurchlauf durch und speichert die Aktivierungen für ``draw``"""
         # Eingabewerte für die Visualisierung speichern
         self.input_values = inputs.flatten()
         
@@ -368,4 +409,49 @@ class Brain:
         t_text_x = rect.x + 3 * rect.width // 4 - t_text.get_width() // 2
         
         surface.blit(f_text, (f_text_x, output_text_y))
-        surface.blit(t_text, (t_text_x, output_text_y)) 
\ No newline at end of file
+        surface.blit(t_text, (t_text_x, output_text_y)) 
+
+
+class BrainBatch:
+    """Wertet die Netze einer ganzen Population in einer Tensoroperation aus
+
+    Die Gewichte aller Brains werden gestapelt (N×hidden×input und
+    N×output×hidden), sodass ein Vorwärtsdurchlauf für N Kreaturen nur
+    zwei gebatchte Matrixprodukte statt N kleiner ``np.dot``-Aufrufe kostet.
+    """
+    
+    def __init__(self, brains):
+        """Stapelt die Gewichte der übergebenen Brains"""
+        self.brains = list(brains)
+        if self.brains:
+            self.weights_ih = np.stack([b.weights_ih for b in self.brains])
+            self.weights_ho = np.stack([b.weights_ho for b in self.brains])
+            self.bias_h = np.stack([b.bias_h for b in self.brains])
+            self.bias_o = np.stack([b.bias_o for b in self.brains])
+            
+            # Vorallokierte Puffer für die Aktivierungen (N×hidden×1, N×output×1)
+            self._hidden = np.zeros(self.bias_h.shape + (1,))
+            self._output = np.zeros(self.bias_o.shape + (1,))
+        else:
+            self.weights_ih = self.weights_ho = self.bias_h = self.bias_o = None
+    
+    def __len__(self):
+        return len(self.brains)
+    
+    def forward(self, inputs):
+        """Führt den Vorwärtsdurchlauf für alle Netze aus
+        
+        ``inputs`` hat die Form (N, input_size), die Rückgabe (N, output_size).
+        Wie ``Brain.forward`` wird die Ausgabe vor der tanh-Aktivierung geliefert.
+        Die Rückgabe ist ein Puffer, der beim nächsten Aufruf überschrieben wird.
+        """
+        if not self.brains:
+            return np.zeros((0, 0))
+        hidden = self._hidden
+        np.matmul(self.weights_ih, inputs[:, :, None], out=hidden)
+        hidden[:, :, 0] += self.bias_h
+        np.tanh(hidden, out=hidden)
+        output = self._output
+        np.matmul(self.weights_ho, hidden, out=output)
+        output[:, :, 0] += self.bias_o
+        return output[:, :, 0]
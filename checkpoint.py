@@ -0,0 +1,238 @@
+"""
+Checkpoints einer laufenden Simulation.
+
+Der Weltzustand wird spaltenweise in ein NumPy-Archiv (``np.savez``,
+unkomprimiert) geschrieben: ein Array pro Größe und Objektart statt eines
+Objekts pro Kreatur. Beim Laden wird eine neue ``Simulation`` samt
+``pymunk.Space`` aufgebaut.
+
+    save_checkpoint(sim, "welt.npz")
+    sim = load_checkpoint("welt.npz")
+"""
+import os
+import random
+from operator import attrgetter
+import numpy as np
+from PyLife.brain import Brain
+from PyLife.creature import Entity
+from PyLife.creature_dna import DNA
+from PyLife.entity_state import EntityStateStore
+from PyLife.simulation import Simulation
+from PyLife.world_waste import WasteField
+
+CHECKPOINT_VERSION = 1
+
+# Skalare Simulationswerte
+SIMULATION_FIELDS = ('width', 'height', 'generation', 'time', 'population_size')
+
+# Zustandsspalten der Entities (ohne die pro Tick neu gefüllten Hilfsspalten)
+STATE_COLUMNS = EntityStateStore.VITALS + EntityStateStore.CONSTANTS
+
+# Python-Attribute der Entities, die sich nach dem Erstellen ändern können
+# (Zähler, Timer und durch Hormone veränderte Werte)
+ENTITY_FIELDS = (
+    'food_eaten', 'children', 'radius', 'mass', 'digestion_rate', 'digestion_efficiency',
+    'digestion_cooldown', 'sensor_range', 'reproduction_cost', 'reproduction_rate',
+    'turn_rate', 'mouth_size', 'aggression', 'movement_timer', 'direction_change_time',
+    'current_direction',
+)
+
+# Zustand der Physikkörper
+BODY_FIELDS = ('x', 'y', 'angle', 'vx', 'vy', 'angular_velocity')
+
+BRAIN_WEIGHTS = ('weights_ih', 'weights_ho', 'bias_h', 'bias_o')
+
+
+def _body_state(bodies):
+    """Gibt den Zustand der Körper als (N×6)-Array zurück (Reihenfolge ``BODY_FIELDS``)"""
+    state = np.empty((len(bodies), len(BODY_FIELDS)))
+    for i, body in enumerate(bodies):
+        position = body.position
+        velocity = body.velocity
+        state[i] = (position.x, position.y, body.angle,
+                    velocity.x, velocity.y, body.angular_velocity)
+    return state
+
+
+def _restore_bodies(bodies, state):
+    """Setzt Winkel und Geschwindigkeiten der Körper (Positionen sind bereits gesetzt)"""
+    for body, (_, _, angle, vx, vy, angular_velocity) in zip(bodies, state.tolist()):
+        body.angle = angle
+        body.velocity = (vx, vy)
+        body.angular_velocity = angular_velocity
+
+
+def _mt_state(state, prefix):
+    """Zerlegt den Zustand eines Mersenne-Twisters (``RandomState.get_state()``) in Arrays"""
+    _, keys, pos, has_gauss, cached_gaussian = state
+    return {
+        f'{prefix}_keys': keys,
+        f'{prefix}_params': np.array([pos, has_gauss, cached_gaussian], dtype=float),
+    }
+
+
+def _load_mt_state(data, prefix):
+    """Setzt einen mit ``_mt_state`` zerlegten Zustand wieder zusammen"""
+    pos, has_gauss, cached_gaussian = data[f'{prefix}_params'].tolist()
+    return ('MT19937', data[f'{prefix}_keys'], int(pos), int(has_gauss), cached_gaussian)
+
+
+def checkpoint_arrays(simulation) -> dict:
+    """Sammelt den Zustand der Simulation als Dict ``Name -> Array``"""
+    sim = simulation
+    entities = sim.entities
+    n = len(entities)
+    arrays = {'version': np.array(CHECKPOINT_VERSION)}
+    for name in SIMULATION_FIELDS:
+        arrays[name] = np.array(getattr(sim, name))
+    arrays['batched_inference'] = np.array(sim.batched_inference)
+
+    # Zufallsgeneratoren (Simulation, NumPy global, Python global)
+    arrays.update(_mt_state(sim.rng.get_state(), 'rng'))
+    arrays.update(_mt_state(np.random.get_state(), 'np_random'))
+    version, internal, gauss_next = random.getstate()
+    arrays['py_random_state'] = np.array(internal, dtype=np.uint32)
+    arrays['py_random_params'] = np.array([version, np.nan if gauss_next is None else gauss_next])
+
+    # Entities: Zustandsspalten in der Reihenfolge von ``entities``
+    rows = np.array([entity._row for entity in entities], dtype=np.intp)
+    store = sim.entity_state
+    for name in STATE_COLUMNS:
+        arrays[f'entity_{name}'] = getattr(store, name)[rows]
+    fields = np.array(list(map(attrgetter(*ENTITY_FIELDS), entities)), dtype=float)
+    fields = fields.reshape(n, len(ENTITY_FIELDS))
+    for column, name in enumerate(ENTITY_FIELDS):
+        arrays[f'entity_{name}'] = fields[:, column]
+    arrays['entity_body'] = _body_state([entity.body for entity in entities])
+    arrays['entity_brain_output'] = np.array([
+        np.ravel(getattr(entity, 'brain_output', (np.nan, np.nan)))[:2] for entity in entities
+    ]).reshape(n, 2)
+
+    # DNA und Gehirne als gestapelte Blöcke
+    arrays['dna_genes'] = np.array([entity.dna.genes for entity in entities]).reshape(n, len(DNA.TRAITS))
+    arrays['dna_hormones'] = np.array(
+        [entity.dna.hormone_levels for entity in entities]
+    ).reshape(n, len(DNA.HORMONES))
+    input_size, hidden_size, output_size = Entity.BRAIN_SIZE
+    shapes = {
+        'weights_ih': (hidden_size, input_size),
+        'weights_ho': (output_size, hidden_size),
+        'bias_h': (hidden_size,),
+        'bias_o': (output_size,),
+    }
+    for name in BRAIN_WEIGHTS:
+        arrays[f'brain_{name}'] = np.array(
+            [getattr(entity.brain, name) for entity in entities]
+        ).reshape((n,) + shapes[name])
+
+    # Verdauung: eine Zeile pro Nahrungsstück im Magen, ``digest_owner`` = Entity-Index
+    digest = [
+        (index, item['food']['size'], item['food']['quality'], item['food']['energy'],
+         item['ticks_remaining'])
+        for index, entity in enumerate(entities)
+        for item in entity.digesting_food
+    ]
+    digest = np.array(digest, dtype=float).reshape(len(digest), 5)
+    arrays['digest_owner'] = digest[:, 0].astype(np.int64)
+    for column, name in enumerate(('size', 'quality', 'energy', 'ticks'), start=1):
+        arrays[f'digest_{name}'] = digest[:, column]
+
+    # Nahrung
+    food = sim.food
+    arrays['food_body'] = _body_state([item.body for item in food])
+    arrays['food_size'] = np.array([item.size for item in food], dtype=float)
+    arrays['food_quality'] = np.array([item.quality for item in food], dtype=float)
+
+    # Abfall
+    for name, column in sim.waste.to_arrays().items():
+        arrays[f'waste_{name}'] = column
+    return arrays
+
+
+def save_checkpoint(simulation, path) -> None:
+    """Schreibt einen Checkpoint der Simulation nach ``path``
+
+    Die Datei wird zunächst unter einem temporären Namen geschrieben und dann
+    ersetzt, ein Absturz beim Schreiben lässt den alten Checkpoint also intakt.
+    """
+    path = os.fspath(path)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        np.savez(file, **checkpoint_arrays(simulation))
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path) -> Simulation:
+    """Lädt einen Checkpoint und baut daraus eine neue Simulation auf
+
+    Setzt auch die globalen Zufallsgeneratoren (``random``, ``np.random``) auf
+    den gespeicherten Stand, damit ein fortgesetzter Lauf gleich weiterläuft.
+    """
+    with np.load(os.fspath(path)) as archive:
+        data = dict(archive.items())
+    version = int(data['version'])
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(f"Nicht unterstützte Checkpoint-Version {version}")
+
+    sim = Simulation(int(data['width']), int(data['height']))
+    sim.generation = int(data['generation'])
+    sim.time = data['time'].item()
+    sim.population_size = int(data['population_size'])
+    sim.batched_inference = bool(data['batched_inference'])
+
+    # Entities mit gespeicherter DNA und gespeicherten Gehirnen
+    body = data['entity_body']
+    n = len(body)
+    input_size, hidden_size, output_size = Entity.BRAIN_SIZE
+    dnas = [DNA.from_genome(genes, hormones)
+            for genes, hormones in zip(data['dna_genes'], data['dna_hormones'])]
+    brains = [
+        Brain(input_size, hidden_size, output_size, values={
+            name: data[f'brain_{name}'][i] for name in BRAIN_WEIGHTS
+        })
+        for i in range(n)
+    ]
+    entities = sim.spawn_entities(n, dnas=dnas, positions=body[:, :2], brains=brains)
+    _restore_bodies([entity.body for entity in entities], body)
+
+    store = sim.entity_state
+    rows = np.array([entity._row for entity in entities], dtype=np.intp)
+    for name in STATE_COLUMNS:
+        getattr(store, name)[rows] = data[f'entity_{name}']
+    for name in ENTITY_FIELDS:
+        for entity, value in zip(entities, data[f'entity_{name}'].tolist()):
+            setattr(entity, name, value)
+    for entity in entities:
+        entity.food_eaten = int(entity.food_eaten)
+        entity.children = int(entity.children)
+    for entity, output in zip(entities, data['entity_brain_output']):
+        if not np.isnan(output).any():
+            entity.brain_output = output.reshape(1, 2).copy()
+
+    for owner, size, quality, energy, ticks in zip(
+            data['digest_owner'].tolist(), data['digest_size'].tolist(),
+            data['digest_quality'].tolist(), data['digest_energy'].tolist(),
+            data['digest_ticks'].tolist()):
+        entities[owner].digesting_food.append({
+            'food': {'size': size, 'quality': quality, 'energy': energy},
+            'ticks_remaining': ticks,
+        })
+
+    # Nahrung
+    food = [
+        sim.spawn_food(x, y, size=size, quality=quality)
+        for (x, y), size, quality in zip(data['food_body'][:, :2].tolist(),
+                                         data['food_size'].tolist(), data['food_quality'].tolist())
+    ]
+    _restore_bodies([item.body for item in food], data['food_body'])
+
+    # Abfall
+    sim.waste = WasteField.from_arrays({name: data[f'waste_{name}'] for name in WasteField.COLUMNS})
+
+    # Zufallsgeneratoren zuletzt, da der Aufbau oben Zufallszahlen zieht
+    sim.rng.set_state(_load_mt_state(data, 'rng'))
+    np.random.set_state(_load_mt_state(data, 'np_random'))
+    py_version, gauss_next = data['py_random_params'].tolist()
+    random.setstate((int(py_version), tuple(data['py_random_state'].tolist()),
+                     None if np.isnan(gauss_next) else gauss_next))
+    return sim
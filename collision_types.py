@@ -0,0 +1,9 @@
+"""
+Kollisionstypen der Pymunk-Shapes.
+
+Jede Shape trägt zusätzlich eine Referenz ``owner`` auf ihr Spielobjekt,
+damit Kollisionshandler vom Arbiter direkt zum Objekt gelangen.
+"""
+
+ENTITY = 1
+FOOD = 2
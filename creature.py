@@ -1,10 +1,11 @@
 import pymunk
 import pygame
 import numpy as np
-from PyLife.neural_network import NeuralNetwork
+from PyLife import collision_types
 from PyLife.brain import Brain
 from PyLife.creature_dna import DNA
 from PyLife.creature_renderer import CreatureRenderer
+from PyLife.entity_state import EntityStateStore, StoreColumn
 import random
 import math
 
@@ -12,11 +13,43 @@ class Entity:
     # Statischer CreatureRenderer für alle Entities
     renderer = CreatureRenderer()
     
-    def __init__(self, space, x, y, dna=None, simulation=None):
-        """Initialisiert eine neue Entity"""
+    # Vitalwerte und DNA-Konstanten liegen spaltenweise im EntityStateStore
+    energy = StoreColumn()
+    hunger = StoreColumn()
+    health = StoreColumn()
+    age = StoreColumn()
+    reproduction_cooldown = StoreColumn()
+    distance_traveled = StoreColumn()
+    base_speed = StoreColumn()
+    max_energy = StoreColumn()
+    max_health = StoreColumn()
+    max_hunger = StoreColumn()
+    metabolism_rate = StoreColumn()
+    size_factor = StoreColumn()
+    
+    # Größe des Netzes: Eingaben, versteckte Neuronen, Ausgaben
+    BRAIN_SIZE = (8, 16, 2)
+    
+    def __init__(self, space, x, y, dna=None, simulation=None, brain=None, add_to_space=True,
+                 store=None):
+        """Initialisiert eine neue Entity
+        
+        ``brain`` übernimmt ein fertiges Netz (z.B. aus ``Brain.create_many``).
+        Mit ``add_to_space=False`` wird der Körper nicht dem Space hinzugefügt;
+        das übernimmt dann der Aufrufer (siehe ``Simulation.spawn_entities``).
+        ``store`` ist ein Zwischenspeicher für die Werte, den sich viele neue
+        Entities teilen können (Standard: ein eigener pro Entity).
+        """
         self.space = space
         self.simulation = simulation  # Referenz zur Simulation hinzugefügt
         
+        # Eigener Zustandsspeicher, bis die Welt die Entity aufnimmt
+        # (``WorldLifecycle`` verschiebt sie dann in den gemeinsamen Speicher)
+        if store is None:
+            store = EntityStateStore(capacity=1)
+        self._store = store
+        self._row = store.allocate(self)
+        
         # DNA initialisieren oder kopieren
         if dna is None:
             self.dna = DNA()
@@ -34,49 +67,22 @@ class Entity:
         self.shape = pymunk.Circle(self.body, self.radius)
         self.shape.friction = 0.7
         self.shape.elasticity = 0.5
-        self.space.add(self.body, self.shape)
-        
-        # Renderer für die Vorschau
-        self.renderer = CreatureRenderer()
-        
-        # Neuronales Netzwerk initialisieren
-        self.brain = Brain(input_size=8, hidden_size=16, output_size=2)  # 8 Inputs, 16 versteckte Neuronen, 2 Outputs
-        
-        # Basis-Eigenschaften
-        self.base_speed = 100 * self.dna['movement']['movement_forward_organ_size']  # Geschwindigkeit basierend auf DNA
-        self.max_health = 100 * self.dna['physical']['health']
-        self.max_energy = 100 * self.dna['feeding']['metabolism']
-        self.max_hunger = 100
+        self.shape.collision_type = collision_types.ENTITY
+        self.shape.owner = self
+        if add_to_space:
+            self.space.add(self.body, self.shape)
         
-        # Aktuelle Werte
-        self.health = self.max_health
-        self.energy = self.max_energy
-        self.hunger = 0
-        self.age = 0
-        self.food_eaten = 0
-        self.children = 0
-        self.distance_traveled = 0
-        
-        # Verdauungssystem
-        self.digesting_food = []
-        self.digestion_rate = 0.1 * self.dna['feeding']['metabolism']  # Verdauungsrate basierend auf DNA
-        
-        # Fortpflanzung
-        self.reproduction_cost = 50  # Energiekosten für Fortpflanzung
-        self.reproduction_cooldown = 0  # Abklingzeit für Fortpflanzung
-        
-        # Sensoren
-        self.sensor_range = 150 * self.dna['sensors']['sensor_range']  # Sensorreichweite basierend auf DNA
+        # Basis-, Verdauungs-, Sensor- und Fortpflanzungswerte setzt ``_apply_dna``
         
         # Bewegung
         self.movement_target = None
         self.last_position = self.body.position
         
-        # Zufallsgenerator für konsistente Ergebnisse
-        self.rng = np.random.RandomState()
+        # Zufallsgenerator für konsistente Ergebnisse (erst bei Bedarf erzeugt)
+        self._rng = None
         
-        # Wende die DNA an (initialisiert max_health, max_energy, etc.)
-        self._apply_dna()
+        # Wende die DNA an (initialisiert max_health, max_energy, Gehirn etc.)
+        self._apply_dna(brain)
         
         # Initialisiere Grundwerte
         self.energy = self.max_energy * 0.8  # Starte mit 80% Energie
@@ -96,9 +102,51 @@ class Entity:
         self.direction_change_time = np.random.uniform(1, 3)  # Zeit bis zur Richtungsänderung
         self.current_direction = np.random.uniform(-1, 1)  # Aktuelle Drehrichtung
         
-        # Kreatur-Textur erstellen
-        self.texture = self.renderer.render_creature(self.dna.to_dict())
-        self.texture_rect = self.texture.get_rect()
+    @property
+    def rng(self):
+        """Eigener Zufallsgenerator der Entity (das Seeden ist teuer, daher lazy)"""
+        if self._rng is None:
+            self._rng = np.random.RandomState()
+        return self._rng
+    
+    @property
+    def _dna_dict(self):
+        """Effektive DNA-Werte als Dictionary für den Renderer (lazy)"""
+        if self._dna_dict_cache is None:
+            self._dna_dict_cache = self.dna.to_dict()
+        return self._dna_dict_cache
+    
+    @property
+    def _dna_fingerprint(self):
+        """Fingerabdruck der DNA für den Textur-Cache (lazy)"""
+        if self._dna_fingerprint_cache is None:
+            self._dna_fingerprint_cache = self.renderer.dna_fingerprint(self._dna_dict)
+        return self._dna_fingerprint_cache
+    
+    @property
+    def texture(self):
+        """Gibt die Kreatur-Textur zurück (wird erst beim ersten Zugriff gerendert)"""
+        if self._texture is None:
+            self._refresh_texture(self.energy / self.max_energy)
+        return self._texture
+    
+    @texture.setter
+    def texture(self, value):
+        """Setzt die Kreatur-Textur"""
+        self._texture = value
+    
+    @property
+    def texture_rect(self):
+        """Gibt das Rechteck der Kreatur-Textur zurück"""
+        return self.texture.get_rect()
+    
+    def _refresh_texture(self, energy_percentage):
+        """Holt die Textur aus dem Renderer-Cache, wenn sich ihr Schlüssel geändert hat"""
+        key = self.renderer.texture_key(self._dna_fingerprint, energy_percentage)
+        if key != self._texture_key or self._texture is None:
+            self._texture = self.renderer.get_texture(self._dna_dict, energy_percentage, key=key)
+            self._texture_key = key
+        return self._texture
     
     def _generate_dna(self):
         """Generiert zufällige DNA"""
@@ -123,8 +171,8 @@ class Entity:
             'energy_efficiency': random.uniform(0.0, 1.0)
         }
     
-    def _apply_dna(self):
-        """Wendet die DNA-Werte auf die Entity an"""
+    def _apply_dna(self, brain=None):
+        """Wendet die DNA-Werte auf die Entity an (``brain``: vorhandenes Netz statt eines neuen)"""
         # Basis-Eigenschaften
         self.base_speed = 100 + self.dna['movement']['movement_forward_organ_size'] * 150  # Basis-Geschwindigkeit
         self.max_health = 100 + self.dna['physical']['health'] * 100  # Maximale Gesundheit
@@ -151,11 +199,10 @@ class Entity:
         self.distance_traveled = 0
         self.digesting_food = []
         
-        # Renderer für die Vorschau
-        self.renderer = CreatureRenderer()
-        
         # Neuronales Netzwerk initialisieren
-        self.brain = Brain(input_size=8, hidden_size=16, output_size=2)  # 8 Inputs, 16 versteckte Neuronen, 2 Outputs
+        if brain is None:
+            brain = Brain(*self.BRAIN_SIZE)
+        self.brain = brain
         
         # Sinne und Interaktion
         self.turn_rate = 2.0 + self.dna['movement']['movement_forward_organ_size'] * 2.0  # Wendegeschwindigkeit
@@ -165,6 +212,9 @@ class Entity:
         self.digestion_efficiency = 0.3 + self.dna['feeding']['digestion'] * 0.7  # Verdauungseffizienz
         self.metabolism_rate = 0.3 + self.dna['feeding']['metabolism'] * 0.7  # Stoffwechselrate
         
+        # Körpergröße für den Energieverbrauch
+        self.size_factor = self.dna['physical']['size']
+        
         # Verhalten
         self.aggression = self.dna['offense']['aggression']  # Aggressivität
         self.reproduction_rate = self.dna['reproduction']['reproduction']  # Reproduktionsrate
@@ -188,9 +238,14 @@ class Entity:
         self.reproduction_cooldown = max(20, 60 - self.dna['reproduction']['reproduction'] * 40)
         self.reproduction_cost = 20 + self.dna['physical']['size'] * 20  # Größere Kreaturen brauchen mehr Energie
         
-        # Kreatur-Textur aktualisieren
-        self.texture = self.renderer.render_creature(self.dna.to_dict())
-        self.texture_rect = self.texture.get_rect()
+        # Effektive DNA-Werte und Fingerabdruck für den Textur-Cache (erst beim Zeichnen berechnet)
+        self._dna_dict_cache = None
+        self._dna_fingerprint_cache = None
+        
+        # Kreatur-Textur verwerfen, sie wird beim nächsten Zeichnen neu erstellt
+        # (so bleiben Headless-Läufe frei von Rendering-Kosten)
+        self._texture = None
+        self._texture_key = None
     
     def move(self, dt):
         """Bewegt die Entity"""
@@ -273,8 +328,12 @@ class Entity:
         # Kraft auf die Entity anwenden
         self.body.apply_force_at_local_point((force_x, force_y), (0, 0))
     
-    def update(self, dt):
-        """Aktualisiert den Zustand der Entity"""
+    def update(self, dt, brain_output=None):
+        """Aktualisiert den Zustand der Entity
+        
+        Ist ``brain_output`` gesetzt (gebatchte Auswertung durch die Simulation),
+        wird das eigene Netz nicht erneut ausgewertet.
+        """
         # Alter erhöhen
         self.age += dt
         
@@ -282,7 +341,10 @@ class Entity:
         old_position = self.body.position
         
         # Neuronales Netzwerk aktualisieren
-        self._update_brain(dt)
+        if brain_output is None:
+            self._update_brain(dt)
+        else:
+            self.brain_output = brain_output
         
         # Bewegung basierend auf Netzwerk-Output
         self._apply_movement(dt)
@@ -333,17 +395,19 @@ class Entity:
             return True
         return False
     
-    def draw(self, screen, debug_mode=False):
-        """Zeichnet die Entity auf den Bildschirm"""
-        # Textur basierend auf aktuellem Zustand aktualisieren
-        self.texture = self.renderer.render_creature(
-            self.dna.to_dict(),
-            health_percentage=self.health / self.max_health,
-            energy_percentage=self.energy / self.max_energy
-        )
-        
-        # Position aus der Physik-Engine holen
-        pos = self.body.position
+    def draw(self, screen, debug_mode=False, offset=(0, 0), zoom=1.0):
+        """Zeichnet die Entity auf den Bildschirm
+        
+        ``offset`` und ``zoom`` bilden Weltkoordinaten direkt auf
+        Bildschirmkoordinaten ab (``screen = world * zoom + offset``).
+        """
+        # Textur nur neu holen, wenn sich DNA oder sichtbarer Zustand geändert haben
+        energy_percentage = self.energy / self.max_energy
+        self._refresh_texture(energy_percentage)
+        
+        # Position aus der Physik-Engine holen und in Bildschirmkoordinaten umrechnen
+        world_pos = self.body.position
+        pos = pymunk.Vec2d(world_pos.x * zoom + offset[0], world_pos.y * zoom + offset[1])
         angle = self.body.angle
         
         # Debug-Informationen zuerst zeichnen (unter der Kreatur)
@@ -353,12 +417,12 @@ class Entity:
                 screen, 
                 (100, 100, 255),  # Hellblau
                 (int(pos.x), int(pos.y)), 
-                int(self.sensor_range),
+                int(self.sensor_range * zoom),
                 1  # Nur Umriss
             )
             
             # Visuelle Reichweite (etwas kleiner als Sensor-Reichweite)
-            visual_range = self.sensor_range * 0.8
+            visual_range = self.sensor_range * 0.8 * zoom
             pygame.draw.circle(
                 screen, 
                 (100, 255, 100),  # Hellgrün
@@ -423,8 +487,10 @@ class Entity:
                 2
             )
         
-        # Textur rotieren
-        rotated_texture = pygame.transform.rotate(self.texture, -angle * 180 / np.pi)
+        # Vorgedrehte Textur aus dem Cache holen
+        rotated_texture = self.renderer.get_rotated(
+            self._dna_dict, angle, energy_percentage, key=self._texture_key, zoom=zoom
+        )
         rotated_rect = rotated_texture.get_rect()
         
         # Position zentrieren
@@ -435,11 +501,11 @@ class Entity:
         screen.blit(rotated_texture, pos)
         
         # Statusbalken-Einstellungen
-        bar_width = 40
-        bar_height = 4
-        bar_spacing = 6
+        bar_width = max(4, int(40 * zoom))
+        bar_height = max(1, int(4 * zoom))
+        bar_spacing = max(2, int(6 * zoom))
         bar_pos = (int(pos[0] + rotated_rect.width/2 - bar_width/2), 
-                  int(pos[1] - 15))
+                  int(pos[1] - 15 * zoom))
         
         def draw_status_bar(pos_y, value, max_value, color, background_color=(60, 60, 60)):
             """Zeichnet einen schönen Statusbalken"""
@@ -484,7 +550,7 @@ class Entity:
                 turn = self.brain_output[0][1]     # Links/Rechts (-1 bis 1)
                 
                 # Pfeillänge
-                arrow_length = self.radius * 1.5
+                arrow_length = self.radius * 1.5 * zoom
                 
                 # Basisposition für den Pfeil
                 arrow_base_x = pos[0] + rotated_rect.width/2
@@ -513,11 +579,7 @@ class Entity:
     def draw_preview(self, surface, debug_mode=False):
         """Zeichnet eine große Vorschau der Entity"""
         # Textur basierend auf aktuellem Zustand aktualisieren
-        preview_texture = self.renderer.render_creature(
-            self.dna.to_dict(),
-            health_percentage=self.health / self.max_health,
-            energy_percentage=self.energy / self.max_energy
-        )
+        preview_texture = self._refresh_texture(self.energy / self.max_energy)
         
         # Hintergrund füllen
         surface.fill((240, 240, 245))  # Hellgrauer Hintergrund
@@ -618,17 +680,16 @@ class Entity:
                 self.digesting_food.remove(food)
         return waste_list 
 
-    def draw_highlight(self, surface):
+    def draw_highlight(self, surface, offset=(0, 0), zoom=1.0):
         """Zeichnet einen Hervorhebungsring um die Entity"""
         pos = self.body.position
         pygame.draw.circle(surface, (0, 255, 255), 
-                         (int(pos.x), int(pos.y)), 
-                         int(self.radius + 2), 2) 
+                         (int(pos.x * zoom + offset[0]), int(pos.y * zoom + offset[1])), 
+                         int((self.radius + 2) * zoom), 2) 
 
-    def _update_brain(self, dt):
-        """Aktualisiert das neuronale Netzwerk"""
-        # Eingabewerte vorbereiten
-        inputs = np.array([
+    def brain_input_values(self):
+        """Gibt die Eingabewerte für das Gehirn als Tupel zurück"""
+        return (
             self.energy / self.max_energy,  # Energielevel
             self.health / self.max_health,  # Gesundheitslevel
             self.hunger / self.max_hunger,  # Hungerlevel
@@ -637,10 +698,18 @@ class Entity:
             self.age / 1000,  # Alter
             self.aggression,  # Aggressivität
             self.reproduction_rate  # Reproduktionsrate
-        ]).reshape(1, -1)
+        )
+    
+    def _update_brain(self, dt):
+        """Aktualisiert das neuronale Netzwerk"""
+        # Eingabewerte vorbereiten
+        inputs = np.array(self.brain_input_values()).reshape(1, -1)
         
-        # Netzwerk ausführen
-        self.brain_output = self.brain.forward(inputs)
+        # Netzwerk ausführen (Aktivierungen nur für die ausgewählte Entity speichern)
+        if self.simulation is not None and self.simulation.selected_entity is self:
+            self.brain_output = self.brain.forward(inputs)
+        else:
+            self.brain_output = self.brain.infer(inputs)
     
     def _apply_movement(self, dt):
         """Wendet die vom Gehirn berechnete Bewegung an"""
@@ -666,38 +735,17 @@ class Entity:
         self.body.angle += turn * self.turn_rate * dt
     
     def _update_energy(self, dt):
-        """Aktualisiert den Energiehaushalt"""
-        # Basisverbrauch basierend auf Körpergröße
-        base_consumption = 0.08 * dt * self.dna['physical']['size']
-        
-        # Aktivitätsbasierter Verbrauch
-        velocity = np.linalg.norm(self.body.velocity)
-        velocity_factor = velocity / self.base_speed
-        movement_consumption = 0.1 * dt * velocity_factor * self.dna['physical']['size']
-        
-        # Verdauungsenergie
-        digestion_consumption = len(self.digesting_food) * 0.02 * dt
-        
-        # Hungermodifikator
-        hunger_factor = 1.0 + (self.hunger / self.max_hunger)
-        
-        # Gesamtverbrauch
-        total_consumption = (base_consumption + movement_consumption + digestion_consumption) * hunger_factor
-        
-        # Energie reduzieren
-        self.energy = max(0, self.energy - total_consumption)
-        
-        # Hunger erhöhen
-        hunger_increase = (0.15 * dt * self.dna['physical']['size'] +  # Basisanstieg
-                         0.225 * dt * velocity_factor)                 # Bewegungsabhängiger Anstieg
-        self.hunger = min(self.max_hunger, self.hunger + hunger_increase)
+        """Aktualisiert den Energiehaushalt (Kernel des Zustandsspeichers für eine Zeile)"""
+        store = self._store
+        row = self._row
+        store.speed[row] = np.linalg.norm(self.body.velocity)
+        store.digesting[row] = len(self.digesting_food)
+        store.update_energy(dt, slice(row, row + 1))
     
     def _update_health(self, dt):
         """Aktualisiert den Gesundheitszustand"""
-        if self.energy <= 0:
-            # Gesundheit nimmt ab wenn keine Energie vorhanden
-            self.health -= 0.5 * dt
-            self.health = max(0, self.health)
+        # Gesundheit nimmt ab wenn keine Energie vorhanden
+        self._store.update_health(dt, slice(self._row, self._row + 1))
     
     def _update_digestion(self, dt):
         """Aktualisiert das Verdauungssystem"""
@@ -730,19 +778,15 @@ class Entity:
         if not self.simulation:
             return []
             
-        nearby = []
-        for entity in self.simulation.entities:
-            if entity != self:
-                distance = (entity.body.position - self.body.position).length
-                if distance <= self.sensor_range:
-                    nearby.append(entity)
-        return nearby
+        # Abfrage über das Entity-Gitter der Simulation
+        pos = self.body.position
+        return self.simulation.query_entities(pos.x, pos.y, self.sensor_range, exclude=self)
     
     def _update_hormones(self, dt):
         """Aktualisiert die Hormoneffekte"""
         # Adrenalin (bei niedriger Gesundheit)
         if self.health < self.max_health * 0.3:
-            self.base_speed *= (1 + self.dna['physical']['adrenaline'] * 0.5)
+            self.base_speed *= (1 + self.dna.hormones['adrenaline'] * 0.5)
             self.sensor_range *= (1 + self.dna['sensors']['sensor_range'] * 0.3)
         
         # Testosteron (bei hoher Energie)
@@ -764,42 +808,10 @@ class Entity:
 
     @property
     def fitness(self) -> float:
-        """Berechnet die Fitness der Kreatur basierend auf verschiedenen Faktoren"""
-        # Basis-Fitness
-        base_fitness = 1.0
-        
-        # Gesundheit und Energie (0-1 normalisiert)
-        health_factor = self.health / self.max_health
-        energy_factor = self.energy / self.max_energy
-        
-        # Alter und Erfahrung
-        age_factor = min(1.0, self.age / 100.0)  # Normalisiert auf 100 Zeiteinheiten
-        food_factor = min(1.0, self.food_eaten / 10.0)  # Normalisiert auf 10 Nahrungseinheiten
-        
-        # Bewegung und Aktivität
-        movement_factor = min(1.0, self.distance_traveled / 1000.0)  # Normalisiert auf 1000 Einheiten
-        
-        # Fortpflanzung
-        reproduction_factor = min(1.0, self.children / 3.0)  # Normalisiert auf 3 Nachkommen
-        
-        # Gewichtung der Faktoren
-        weights = {
-            'health': 1.5,    # Gesundheit ist sehr wichtig
-            'energy': 1.2,    # Energie ist wichtig
-            'age': 0.8,      # Alter zeigt Überlebensfähigkeit
-            'food': 1.0,     # Nahrungsaufnahme ist wichtig
-            'movement': 0.5,  # Bewegung zeigt Aktivität
-            'reproduction': 1.3  # Fortpflanzung ist wichtig für Evolution
-        }
-        
-        # Gewichtete Summe aller Faktoren
-        fitness = base_fitness + (
-            health_factor * weights['health'] +
-            energy_factor * weights['energy'] +
-            age_factor * weights['age'] +
-            food_factor * weights['food'] +
-            movement_factor * weights['movement'] +
-            reproduction_factor * weights['reproduction']
-        )
+        """Berechnet die Fitness der Kreatur basierend auf verschiedenen Faktoren
         
-        return max(0.0, fitness)  # Fitness kann nicht negativ sein
\ No newline at end of file
+        Die Formel liegt im Zustandsspeicher, damit ``next_generation`` die
+        Fitness der ganzen Population vektorisiert berechnen kann.
+        """
+        row = self._row
+        return float(self._store.fitness(self.food_eaten, self.children, slice(row, row + 1))[0])
\ No newline at end of file
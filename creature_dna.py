@@ -1,8 +1,109 @@
 import random
+from collections.abc import Mapping, MutableMapping
 from typing import Dict, Any
+import numpy as np
+
+
+class _EffectiveTraits(Mapping):
+    """Schreibgeschützte Sicht auf die effektiven Werte einer Kategorie
+    
+    Liest bei jedem Zugriff aus dem (gecachten) Array der effektiven Werte,
+    sodass ``dna['physical']['size']`` kein Dictionary mehr aufbauen muss.
+    """
+    
+    __slots__ = ('_dna', '_index')
+    
+    def __init__(self, dna: 'DNA', category: str):
+        self._dna = dna
+        self._index = DNA.CATEGORY_INDEX[category]
+    
+    def __getitem__(self, trait: str) -> float:
+        dna = self._dna
+        if dna._effective is None:
+            dna.effective_values()
+        return dna._effective_list[self._index[trait]]
+    
+    def __iter__(self):
+        return iter(self._index)
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class _ArrayView(MutableMapping):
+    """Veränderbare Dict-Sicht auf einen Teil eines NumPy-Arrays
+    
+    Schreibzugriffe landen direkt im Array der DNA und verwerfen den Cache
+    der effektiven Werte. Schlüssel können nicht hinzugefügt oder entfernt
+    werden, da der Genomaufbau fest ist.
+    """
+    
+    __slots__ = ('_dna', '_attribute', '_index')
+    
+    def __init__(self, dna: 'DNA', attribute: str, index: Dict[str, int]):
+        self._dna = dna
+        self._attribute = attribute
+        self._index = index
+    
+    def __getitem__(self, key: str) -> float:
+        return float(getattr(self._dna, self._attribute)[self._index[key]])
+    
+    def __setitem__(self, key: str, value: float) -> None:
+        if key not in self._index:
+            raise KeyError(f"'{key}' ist nicht Teil des Genoms")
+        getattr(self._dna, self._attribute)[self._index[key]] = value
+        self._dna._effective = None
+    
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Einträge des Genoms können nicht entfernt werden")
+    
+    def __iter__(self):
+        return iter(self._index)
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def copy(self) -> Dict[str, float]:
+        return dict(self)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class _CategoryView(Mapping):
+    """Dict-Sicht ``category -> {trait: base}`` auf die Basiswerte (``dna.values``)"""
+    
+    __slots__ = ('_dna',)
+    
+    def __init__(self, dna: 'DNA'):
+        self._dna = dna
+    
+    def __getitem__(self, category: str) -> _ArrayView:
+        return _ArrayView(self._dna, 'genes', DNA.CATEGORY_INDEX[category])
+    
+    def __iter__(self):
+        return iter(DNA.DEFAULT_VALUES)
+    
+    def __len__(self) -> int:
+        return len(DNA.DEFAULT_VALUES)
+    
+    def __repr__(self) -> str:
+        return repr({category: dict(traits) for category, traits in self.items()})
+
 
 class DNA:
-    """Klasse zur Verwaltung der DNA und Hormone einer Entity"""
+    """Klasse zur Verwaltung der DNA und Hormone einer Entity
+    
+    Das Genom ist kompakt abgelegt: Basiswerte in ``genes`` und Hormonlevel
+    in ``hormone_levels`` (je ein float-Array mit festem Index). Die
+    Hormoneffekte sind einmalig zu einer (Hormone × Merkmale)-Matrix
+    kompiliert, die effektiven Werte ergeben sich als ein begrenztes
+    Matrix-Vektor-Produkt. ``values``, ``hormones`` und ``dna[category]``
+    bleiben als Dict-Sichten erhalten.
+    """
     
     # Basiswerte für die DNA
     # DONT TOUCH  
@@ -83,92 +184,143 @@ class DNA:
     def __init__(self, values: Dict[str, Dict[str, float]] = None):
         """Initialisiert die DNA mit Basis- und Hormonwerten"""
         # Basiswerte initialisieren
-        self.values = values or {
-            category: {
-                trait: val + random.uniform(-0.1, 0.1)
-                for trait, val in traits.items()
-            }
-            for category, traits in self.DEFAULT_VALUES.items()
-        }
+        if values:
+            self.genes = np.zeros(len(self.TRAITS))
+            self.values = values
+        else:
+            self.genes = self.DEFAULT_GENES + np.array(
+                [random.uniform(-0.1, 0.1) for _ in self.TRAITS]
+            )
         
         # Hormone initialisieren
-        self.hormones = {
-            hormone: random.uniform(0.0, 1.0)
-            for hormone in self.HORMONE_EFFECTS
-        }
+        self.hormone_levels = np.array([random.uniform(0.0, 1.0) for _ in self.HORMONES])
         
-        # Effektive Werte Cache
-        self._effective_values_cache = {}
+        # Effektive Werte (Cache als Array und als Liste, None = neu berechnen)
+        self._effective = None
+        self._effective_list = None
+        self._effective_views = {}
+
+    @property
+    def values(self) -> Mapping:
+        """Basiswerte als Dict-Sicht ``category -> {trait: value}`` (beschreibbar)"""
+        return _CategoryView(self)
+
+    @values.setter
+    def values(self, values: Dict[str, Dict[str, float]]) -> None:
+        """Übernimmt Basiswerte aus einem verschachtelten Dictionary
+        
+        Fehlende Merkmale werden 0, unbekannte Merkmale ignoriert.
+        """
+        genes = np.zeros(len(self.TRAITS))
+        for category, traits in values.items():
+            for trait, value in traits.items():
+                index = self.TRAIT_INDEX.get((category, trait))
+                if index is not None:
+                    genes[index] = value
+        self.genes = genes
+        self._effective = None
+
+    @property
+    def hormones(self) -> MutableMapping:
+        """Hormonlevel als Dict-Sicht ``hormone -> level`` (beschreibbar)"""
+        return _ArrayView(self, 'hormone_levels', self.HORMONE_INDEX)
+
+    @hormones.setter
+    def hormones(self, hormones: Dict[str, float]) -> None:
+        """Übernimmt Hormonlevel aus einem Dictionary"""
+        levels = np.zeros(len(self.HORMONES))
+        for hormone, level in hormones.items():
+            index = self.HORMONE_INDEX.get(hormone)
+            if index is not None:
+                levels[index] = level
+        self.hormone_levels = levels
+        self._effective = None
+
+    def effective_values(self) -> np.ndarray:
+        """Gibt alle effektiven Werte als Array (Reihenfolge ``TRAITS``) zurück"""
+        effective = self._effective
+        if effective is None:
+            effective = np.clip(self.genes + self.hormone_levels @ self.HORMONE_MATRIX, 0.0, 1.0)
+            self._effective = effective
+            self._effective_list = effective.tolist()
+        return effective
 
     def get_effective_trait(self, category: str, trait: str) -> float:
         """Berechnet den effektiven Wert eines Merkmals unter Berücksichtigung der Hormone"""
-        # Cache überprüfen
-        cache_key = f"{category}.{trait}"
-        if cache_key in self._effective_values_cache:
-            return self._effective_values_cache[cache_key]
-        
-        # Basiswert
-        base = self.values.get(category, {}).get(trait, 0.0)
+        index = self.TRAIT_INDEX.get((category, trait))
+        if index is not None:
+            if self._effective is None:
+                self.effective_values()
+            return self._effective_list[index]
         
-        # Hormonmodifikationen
+        # Merkmal außerhalb des Genoms: Basiswert 0, nur Hormonmodifikationen
         mod = sum(
-            self.hormones[h] * effect
+            self.hormone_levels[self.HORMONE_INDEX[h]] * effects[trait]
             for h, effects in self.HORMONE_EFFECTS.items()
             if trait in effects
-            for effect in [effects[trait]]
         )
-        
-        # Wert begrenzen und cachen
-        result = max(0.0, min(1.0, base + mod))
-        self._effective_values_cache[cache_key] = result
-        return result
+        return max(0.0, min(1.0, float(mod)))
 
     def mutate(self, rate: float = 0.1) -> None:
         """Mutiert sowohl DNA-Werte als auch Hormonlevel"""
         # DNA-Werte mutieren
-        for category in self.values:
-            for trait in self.values[category]:
-                if random.random() < rate:
-                    mutation = random.uniform(-0.05, 0.05)
-                    self.values[category][trait] = max(0.0, min(1.0, self.values[category][trait] + mutation))
+        mask = np.random.random(len(self.genes)) < rate
+        if mask.any():
+            mutation = np.random.uniform(-0.05, 0.05, mask.sum())
+            self.genes[mask] = np.clip(self.genes[mask] + mutation, 0.0, 1.0)
         
         # Hormone mutieren
-        for hormone in self.hormones:
-            if random.random() < rate:
-                mutation = random.uniform(-0.05, 0.05)
-                self.hormones[hormone] = max(0.0, min(1.0, self.hormones[hormone] + mutation))
+        mask = np.random.random(len(self.hormone_levels)) < rate
+        if mask.any():
+            mutation = np.random.uniform(-0.05, 0.05, mask.sum())
+            self.hormone_levels[mask] = np.clip(self.hormone_levels[mask] + mutation, 0.0, 1.0)
         
         # Cache zurücksetzen
-        self._effective_values_cache.clear()
+        self._effective = None
 
     def copy(self) -> 'DNA':
         """Erstellt eine Kopie der DNA mit allen Werten"""
-        new_dna = DNA()
-        new_dna.values = {
-            category: traits.copy()
-            for category, traits in self.values.items()
-        }
-        new_dna.hormones = self.hormones.copy()
+        new_dna = DNA.from_genome(self.genes.copy(), self.hormone_levels.copy())
+        new_dna._effective = self._effective
+        new_dna._effective_list = self._effective_list
         return new_dna
 
+    @classmethod
+    def random_genomes(cls, count: int):
+        """Erzeugt ``count`` zufällige Genome wie ``DNA()`` als (N×Merkmale)- und (N×Hormone)-Array"""
+        genes = cls.DEFAULT_GENES + np.random.uniform(-0.1, 0.1, (count, len(cls.TRAITS)))
+        hormone_levels = np.random.uniform(0.0, 1.0, (count, len(cls.HORMONES)))
+        return genes, hormone_levels
+
+    @classmethod
+    def from_genome(cls, genes: np.ndarray, hormone_levels: np.ndarray) -> 'DNA':
+        """Erstellt eine DNA direkt aus Genom-Arrays (ohne Zufallswerte, ohne Kopie)"""
+        dna = cls.__new__(cls)
+        dna.genes = genes
+        dna.hormone_levels = hormone_levels
+        dna._effective = None
+        dna._effective_list = None
+        dna._effective_views = {}
+        return dna
+
     def to_dict(self) -> Dict[str, Dict[str, float]]:
         """Konvertiert die effektiven Werte in ein Dictionary"""
+        if self._effective is None:
+            self.effective_values()
+        effective = self._effective_list
         return {
-            category: {
-                trait: self.get_effective_trait(category, trait)
-                for trait in traits
-            }
+            category: dict(zip(traits, effective[self.CATEGORY_SLICES[category]]))
             for category, traits in self.DEFAULT_VALUES.items()
         }
 
-    def __getitem__(self, key: str) -> Dict[str, float]:
+    def __getitem__(self, key: str) -> Mapping:
         """Ermöglicht den Zugriff auf effektive Werte über []"""
-        if key in self.values:
-            return {
-                trait: self.get_effective_trait(key, trait)
-                for trait in self.values[key]
-            }
-        raise KeyError(f"Category '{key}' not found in DNA")
+        view = self._effective_views.get(key)
+        if view is None:
+            if key not in self.DEFAULT_VALUES:
+                raise KeyError(f"Category '{key}' not found in DNA")
+            view = self._effective_views[key] = _EffectiveTraits(self, key)
+        return view
 
     def __str__(self) -> str:
         """String-Repräsentation der DNA mit Basis- und Hormonwerten"""
@@ -181,8 +333,45 @@ class DNA:
         base_str += "\n".join(f"  {k}: {v:.2f}" for k, v in self.hormones.items())
         
         base_str += "\n\nEffektive Werte:\n"
-        for category, traits in self.DEFAULT_VALUES.items():
+        for category, traits in self.to_dict().items():
             base_str += f"\n{category}:\n"
-            base_str += "\n".join(f"  {k}: {self.get_effective_trait(category, k):.2f}" for k in traits)
+            base_str += "\n".join(f"  {k}: {v:.2f}" for k, v in traits.items())
         
-        return base_str 
\ No newline at end of file
+        return base_str
+
+
+def _compile_genome(cls) -> None:
+    """Leitet Merkmalsindex, Standardgenom und Hormonmatrix aus den Tabellen ab"""
+    cls.TRAITS = tuple(
+        (category, trait)
+        for category, traits in cls.DEFAULT_VALUES.items()
+        for trait in traits
+    )
+    cls.TRAIT_INDEX = {key: i for i, key in enumerate(cls.TRAITS)}
+    cls.CATEGORY_INDEX = {
+        category: {trait: cls.TRAIT_INDEX[(category, trait)] for trait in traits}
+        for category, traits in cls.DEFAULT_VALUES.items()
+    }
+    cls.CATEGORY_SLICES = {
+        category: slice(min(index.values()), max(index.values()) + 1)
+        for category, index in cls.CATEGORY_INDEX.items()
+    }
+    cls.DEFAULT_GENES = np.array([
+        cls.DEFAULT_VALUES[category][trait] for category, trait in cls.TRAITS
+    ], dtype=float)
+    
+    cls.HORMONES = tuple(cls.HORMONE_EFFECTS)
+    cls.HORMONE_INDEX = {hormone: i for i, hormone in enumerate(cls.HORMONES)}
+    
+    # Effekte wirken auf alle Merkmale gleichen Namens; virtuelle Merkmale ohne
+    # Basiswert (z.B. energy_efficiency) haben keine Spalte
+    matrix = np.zeros((len(cls.HORMONES), len(cls.TRAITS)))
+    for hormone, effects in cls.HORMONE_EFFECTS.items():
+        for i, (category, trait) in enumerate(cls.TRAITS):
+            if trait in effects:
+                matrix[cls.HORMONE_INDEX[hormone], i] = effects[trait]
+    matrix.setflags(write=False)
+    cls.HORMONE_MATRIX = matrix
+
+
+_compile_genome(DNA)
@@ -1,5 +1,6 @@
 import pygame
 import numpy as np
+from collections import OrderedDict
 from typing import Dict, Tuple
 
 # Basis-Farben
@@ -18,11 +19,207 @@ SIDE_FIN_SPACING = 0.2
 TAIL_WIDTH_FACTOR = 0.4
 SIDE_FIN_WIDTH_FACTOR = 0.15
 
+# Textur-Cache
+TEXTURE_CACHE_SIZE = 1024  # Maximale Anzahl gecachter Texturen
+STATE_BUCKETS = 4  # Quantisierungsstufen für die Energie
+ROTATION_BUCKETS = 64  # Anzahl vorgedrehter Winkelstufen pro Textur (~1,3 MB pro voll gedrehter Textur)
+ROTATION_CACHE_BYTES = 64 * 1024 * 1024  # Speicherbudget aller gedrehten Varianten zusammen
+
+# Merkmale, die das Aussehen bestimmen, und deren Quantisierung im Cache-Schlüssel
+VISUAL_TRAITS = (
+    ('physical', 'size'),
+    ('movement', 'movement_forward_organ_size'),
+    ('movement', 'movement_side_organ_size'),
+    ('sensors', 'eye_size'),
+    ('feeding', 'mouth_size'),
+    ('feeding', 'mouth_teeth'),
+)
+VISUAL_TRAIT_QUANTUM = 0.05
+
+class _CacheEntry:
+    """Gecachte Textur samt ihrer lazily erzeugten gedrehten Varianten"""
+    __slots__ = ('key', 'texture', 'rotations', 'zoom')
+    
+    def __init__(self, key, texture):
+        self.key = key
+        self.texture = texture
+        self.rotations = {}  # Winkelstufe -> gedrehte (und skalierte) Surface
+        self.zoom = 1.0  # Zoomstufe, für die die gedrehten Varianten gelten
+
 class CreatureRenderer:
-    def __init__(self):
+    def __init__(self, cache_size: int = TEXTURE_CACHE_SIZE, state_buckets: int = STATE_BUCKETS,
+                 rotation_buckets: int = ROTATION_BUCKETS, rotation_bytes: int = ROTATION_CACHE_BYTES):
         self.default_width = 68  # Basis-Breite
         self.default_length = 48  # Basis-Länge (größer für längliche Form)
         
+        # LRU-Cache: Schlüssel -> _CacheEntry (zuletzt benutzte am Ende)
+        self.cache_size = cache_size
+        self.state_buckets = state_buckets
+        self.rotation_buckets = rotation_buckets
+        self._texture_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+        self.rotation_hits = 0
+        self.rotation_misses = 0
+        
+        # LRU über einzelne gedrehte Varianten: (Schlüssel, Winkelstufe) -> Bytes
+        self.rotation_bytes = rotation_bytes
+        self._rotation_lru = OrderedDict()
+        self._rotation_total = 0
+        self.rotation_evictions = 0
+    
+    @staticmethod
+    def dna_fingerprint(dna: Dict) -> Tuple:
+        """Erstellt einen hashbaren Fingerabdruck der sichtbaren DNA-Werte
+        
+        Nur Merkmale, die das Aussehen bestimmen, fließen (quantisiert) ein,
+        sodass sich ähnlich aussehende Kreaturen eine Textur teilen.
+        """
+        return tuple(
+            int(round(dna.get(category, {}).get(trait, 0.0) / VISUAL_TRAIT_QUANTUM))
+            for category, trait in VISUAL_TRAITS
+        )
+    
+    def _bucket(self, percentage: float) -> int:
+        """Quantisiert einen Anteil (0..1) auf eine der sichtbaren Stufen"""
+        return int(round(max(0.0, min(1.0, percentage)) * self.state_buckets))
+    
+    def texture_key(self, fingerprint: Tuple, energy_percentage: float = 1.0) -> Tuple:
+        """Berechnet den Cache-Schlüssel aus DNA-Fingerabdruck und Energiestufe
+        
+        Die Gesundheit fließt nicht ein, da sie das Aussehen nicht verändert.
+        """
+        return (fingerprint, self._bucket(energy_percentage))
+    
+    @staticmethod
+    def representative_dna(dna: Dict, fingerprint: Tuple) -> Dict:
+        """Gibt die DNA-Werte zurück, für die eine Textur mit diesem Fingerabdruck steht
+        
+        Die sichtbaren Merkmale werden auf ihre Quantisierungsstufe gesetzt,
+        alle übrigen Werte bleiben unverändert.
+        """
+        result = dict(dna)
+        for (category, trait), step in zip(VISUAL_TRAITS, fingerprint):
+            values = dna.get(category)
+            if values is None or trait not in values:
+                continue
+            if result[category] is values:
+                result[category] = dict(values)
+            result[category][trait] = step * VISUAL_TRAIT_QUANTUM
+        return result
+    
+    def _get_entry(self, dna: Dict, energy_percentage: float, key: Tuple) -> _CacheEntry:
+        """Gibt den Cache-Eintrag zurück und rendert die Textur bei Bedarf"""
+        if key is None:
+            key = self.texture_key(self.dna_fingerprint(dna), energy_percentage)
+        
+        cache = self._texture_cache
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+            return entry
+        
+        # Aus den Werten der Stufe rendern, nicht aus denen der ersten Kreatur darin:
+        # so sieht die Textur bei Treffer und Fehlschlag gleich aus
+        self.cache_misses += 1
+        fingerprint, bucket = key
+        texture = self.render_creature(self.representative_dna(dna, fingerprint),
+                                       energy_percentage=bucket / self.state_buckets)
+        entry = _CacheEntry(key, texture)
+        cache[key] = entry
+        if len(cache) > self.cache_size:
+            # Gedrehte Varianten werden zusammen mit der Basistextur verdrängt
+            _, evicted = cache.popitem(last=False)
+            self._drop_rotations(evicted)
+            self.cache_evictions += 1
+        return entry
+    
+    def _drop_rotations(self, entry: _CacheEntry) -> None:
+        """Entfernt alle gedrehten Varianten eines Eintrags samt ihrer Bytes im LRU"""
+        lru = self._rotation_lru
+        for bucket in entry.rotations:
+            self._rotation_total -= lru.pop((entry.key, bucket), 0)
+        entry.rotations.clear()
+    
+    def _store_rotation(self, entry: _CacheEntry, bucket: int, rotated: pygame.Surface) -> None:
+        """Legt eine gedrehte Variante ab und verdrängt bei Überschreiten des Budgets die ältesten"""
+        size = rotated.get_pitch() * rotated.get_height()
+        entry.rotations[bucket] = rotated
+        lru = self._rotation_lru
+        lru[(entry.key, bucket)] = size
+        self._rotation_total += size
+        cache = self._texture_cache
+        while self._rotation_total > self.rotation_bytes and len(lru) > 1:
+            (key, old_bucket), old_size = lru.popitem(last=False)
+            self._rotation_total -= old_size
+            owner = cache.get(key)
+            if owner is not None:
+                owner.rotations.pop(old_bucket, None)
+            self.rotation_evictions += 1
+    
+    def get_texture(self, dna: Dict, energy_percentage: float = 1.0,
+                    key: Tuple = None) -> pygame.Surface:
+        """Gibt die Textur einer Kreatur aus dem Cache zurück (rendert nur bei Bedarf)"""
+        return self._get_entry(dna, energy_percentage, key).texture
+    
+    def rotation_bucket(self, angle: float) -> int:
+        """Ordnet einen Winkel (Bogenmaß) der nächstgelegenen Winkelstufe zu"""
+        return int(round(angle / (2 * np.pi) * self.rotation_buckets)) % self.rotation_buckets
+    
+    def get_rotated(self, dna: Dict, angle: float, energy_percentage: float = 1.0,
+                    key: Tuple = None, zoom: float = 1.0) -> pygame.Surface:
+        """Gibt die um ``angle`` (Bogenmaß, Physik-Konvention) gedrehte Textur zurück
+        
+        Die Drehung wird auf ``rotation_buckets`` Stufen gerundet und pro Stufe
+        nur einmal berechnet. Bei ``zoom != 1`` wird zusätzlich skaliert; ein
+        Wechsel der Zoomstufe verwirft die gedrehten Varianten des Eintrags.
+        Alle gedrehten Varianten zusammen belegen höchstens ``rotation_bytes``;
+        darüber werden die am längsten nicht benutzten einzeln verdrängt.
+        """
+        entry = self._get_entry(dna, energy_percentage, key)
+        if entry.zoom != zoom:
+            self._drop_rotations(entry)
+            entry.zoom = zoom
+        bucket = self.rotation_bucket(angle)
+        rotated = entry.rotations.get(bucket)
+        if rotated is not None:
+            self._rotation_lru.move_to_end((entry.key, bucket))
+            self.rotation_hits += 1
+            return rotated
+        
+        self.rotation_misses += 1
+        # Pygame dreht gegen den Uhrzeigersinn, die Physik im Uhrzeigersinn (y nach unten)
+        rotation = -bucket * 360.0 / self.rotation_buckets
+        if zoom == 1.0:
+            rotated = pygame.transform.rotate(entry.texture, rotation)
+        else:
+            rotated = pygame.transform.rotozoom(entry.texture, rotation, zoom)
+        self._store_rotation(entry, bucket, rotated)
+        return rotated
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """Gibt die Zähler des Textur-Caches zurück"""
+        return {
+            'size': len(self._texture_cache),
+            'capacity': self.cache_size,
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'evictions': self.cache_evictions,
+            'rotations': sum(len(entry.rotations) for entry in self._texture_cache.values()),
+            'rotation_hits': self.rotation_hits,
+            'rotation_misses': self.rotation_misses,
+            'rotation_bytes': self._rotation_total,
+            'rotation_evictions': self.rotation_evictions,
+        }
+    
+    def clear_cache(self) -> None:
+        """Leert den Textur-Cache"""
+        self._texture_cache.clear()
+        self._rotation_lru.clear()
+        self._rotation_total = 0
+        
     def _create_body_surface(self, width: int, height: int) -> pygame.Surface:
         """Erstellt die Grundform des Körpers als längliches Oval"""
         surface = pygame.Surface((width, height), pygame.SRCALPHA)
@@ -43,6 +240,9 @@ class CreatureRenderer:
             height - padding * 2 - 2
         ))
         
+        # Ohne Display (z.B. Headless-Läufe) ist keine Pixelformat-Konvertierung möglich
+        if pygame.display.get_surface() is None:
+            return surface
         return surface.convert_alpha()
     
     def _add_mouth(self, surface: pygame.Surface, dna: Dict) -> None:
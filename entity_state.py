@@ -0,0 +1,213 @@
+import numpy as np
+
+
+class EntityStateStore:
+    """Spaltenorientierter Speicher für die Vitalwerte aller Entities
+
+    Jede Entity belegt eine Zeile; pro Vitalwert und pro DNA-abgeleiteter
+    Konstante gibt es ein NumPy-Array. Energie-, Hunger- und
+    Gesundheitsupdates laufen so als vektorisierte Kernel über die ganze
+    Population. Entfernte Zeilen werden durch die letzte Zeile ersetzt
+    (Swap-Remove), die aktiven Zeilen sind also immer ``[0, count)``.
+    """
+
+    # Vitalwerte, die sich jeden Tick ändern
+    VITALS = ('energy', 'hunger', 'health', 'age', 'reproduction_cooldown', 'distance_traveled')
+
+    # Aus der DNA abgeleitete Konstanten pro Entity
+    CONSTANTS = ('base_speed', 'max_energy', 'max_health', 'max_hunger',
+                 'metabolism_rate', 'size_factor')
+
+    # Hilfsspalten, die vor den Kerneln pro Tick gefüllt werden
+    SCRATCH = ('speed', 'digesting')
+
+    COLUMNS = VITALS + CONSTANTS + SCRATCH
+
+    def __init__(self, capacity=64):
+        """Initialisiert einen leeren Speicher"""
+        self.capacity = max(1, capacity)
+        self.count = 0
+        self.owners = []  # Zeile -> Entity
+        for name in self.COLUMNS:
+            setattr(self, name, np.zeros(self.capacity))
+
+    def _grow(self):
+        """Verdoppelt die Kapazität aller Spalten"""
+        new_capacity = self.capacity * 2
+        for name in self.COLUMNS:
+            column = np.zeros(new_capacity)
+            column[:self.capacity] = getattr(self, name)
+            setattr(self, name, column)
+        self.capacity = new_capacity
+
+    def allocate(self, owner) -> int:
+        """Reserviert eine neue (genullte) Zeile für eine Entity"""
+        if self.count >= self.capacity:
+            self._grow()
+        row = self.count
+        for name in self.COLUMNS:
+            getattr(self, name)[row] = 0.0
+        self.owners.append(owner)
+        self.count += 1
+        return row
+
+    def attach(self, owner) -> int:
+        """Übernimmt eine Entity samt ihrer bisherigen Werte in eine neue Zeile
+
+        Gegenstück zu ``release``: die Werte werden aus dem bisherigen
+        (privaten) Speicher der Entity kopiert. Gehört die Entity bereits zu
+        diesem Speicher, bleibt ihre Zeile unverändert.
+        """
+        source, source_row = owner._store, owner._row
+        if source is self:
+            return source_row
+        if self.count >= self.capacity:
+            self._grow()
+        row = self.count
+        for name in self.COLUMNS:
+            getattr(self, name)[row] = getattr(source, name)[source_row]
+        self.owners.append(owner)
+        self.count += 1
+        owner._store = self
+        owner._row = row
+        return row
+
+    def release(self, owner) -> None:
+        """Gibt die Zeile einer Entity frei
+
+        Die Entity erhält eine private Kopie ihrer Werte, sodass sie (z.B. als
+        ausgewählte Kreatur) weiter gelesen werden kann.
+        """
+        row = owner._row
+        if row < 0 or row >= self.count or self.owners[row] is not owner:
+            return
+
+        detached = EntityStateStore(capacity=1)
+        detached.allocate(owner)
+        for name in self.COLUMNS:
+            getattr(detached, name)[0] = getattr(self, name)[row]
+        owner._store = detached
+        owner._row = 0
+
+        # Letzte Zeile in die freie Zeile verschieben
+        last = self.count - 1
+        if row != last:
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            moved = self.owners[last]
+            self.owners[row] = moved
+            moved._row = row
+        self.owners.pop()
+        self.count -= 1
+
+    def __len__(self):
+        return self.count
+
+    # --- Vektorisierte Kernel -------------------------------------------------
+    # ``index`` ist ein Slice über die betroffenen Zeilen (Standard: alle aktiven)
+
+    def _index(self, index):
+        return slice(0, self.count) if index is None else index
+
+    def advance_age(self, dt, index=None):
+        """Erhöht das Alter"""
+        self.age[self._index(index)] += dt
+
+    def update_energy(self, dt, index=None):
+        """Aktualisiert Energieverbrauch und Hungeranstieg
+
+        Erwartet, dass ``speed`` (Betrag der Geschwindigkeit) und ``digesting``
+        (Anzahl verdauter Nahrungsstücke) für den Tick gesetzt sind.
+        """
+        i = self._index(index)
+        size = self.size_factor[i]
+        hunger = self.hunger[i]
+        max_hunger = self.max_hunger[i]
+
+        # Basisverbrauch basierend auf Körpergröße
+        base_consumption = 0.08 * dt * size
+
+        # Aktivitätsbasierter Verbrauch
+        velocity_factor = self.speed[i] / self.base_speed[i]
+        movement_consumption = 0.1 * dt * velocity_factor * size
+
+        # Verdauungsenergie
+        digestion_consumption = self.digesting[i] * 0.02 * dt
+
+        # Hungermodifikator
+        hunger_factor = 1.0 + hunger / max_hunger
+
+        # Energie reduzieren
+        total_consumption = (base_consumption + movement_consumption + digestion_consumption) * hunger_factor
+        self.energy[i] = np.maximum(0, self.energy[i] - total_consumption)
+
+        # Hunger erhöhen (Basisanstieg + bewegungsabhängiger Anstieg)
+        hunger_increase = 0.15 * dt * size + 0.225 * dt * velocity_factor
+        self.hunger[i] = np.minimum(max_hunger, hunger + hunger_increase)
+
+    def update_health(self, dt, index=None):
+        """Reduziert die Gesundheit von Entities ohne Energie"""
+        i = self._index(index)
+        health = self.health[i]
+        starving = self.energy[i] <= 0
+        health[starving] = np.maximum(0, health[starving] - 0.5 * dt)
+
+    def tick_cooldowns(self, dt, index=None):
+        """Reduziert laufende Fortpflanzungs-Cooldowns"""
+        cooldown = self.reproduction_cooldown[self._index(index)]
+        active = cooldown > 0
+        cooldown[active] -= dt
+
+    def fitness(self, food_eaten, children, index=None):
+        """Berechnet die Fitness der Zeilen ``index`` (Slice oder Zeilen-Array)
+        
+        ``food_eaten`` und ``children`` liegen nicht im Speicher und werden
+        passend zu ``index`` übergeben.
+        """
+        i = self._index(index)
+        
+        # Gesundheit und Energie (0-1 normalisiert)
+        health_factor = self.health[i] / self.max_health[i]
+        energy_factor = self.energy[i] / self.max_energy[i]
+        
+        # Alter und Erfahrung
+        age_factor = np.minimum(1.0, self.age[i] / 100.0)  # Normalisiert auf 100 Zeiteinheiten
+        food_factor = np.minimum(1.0, np.asarray(food_eaten, dtype=float) / 10.0)  # Normalisiert auf 10 Nahrungseinheiten
+        
+        # Bewegung und Aktivität
+        movement_factor = np.minimum(1.0, self.distance_traveled[i] / 1000.0)  # Normalisiert auf 1000 Einheiten
+        
+        # Fortpflanzung
+        reproduction_factor = np.minimum(1.0, np.asarray(children, dtype=float) / 3.0)  # Normalisiert auf 3 Nachkommen
+        
+        # Gewichtete Summe aller Faktoren
+        fitness = 1.0 + (
+            health_factor * 1.5 +        # Gesundheit ist sehr wichtig
+            energy_factor * 1.2 +        # Energie ist wichtig
+            age_factor * 0.8 +           # Alter zeigt Überlebensfähigkeit
+            food_factor * 1.0 +          # Nahrungsaufnahme ist wichtig
+            movement_factor * 0.5 +      # Bewegung zeigt Aktivität
+            reproduction_factor * 1.3    # Fortpflanzung ist wichtig für Evolution
+        )
+        return np.maximum(0.0, fitness)  # Fitness kann nicht negativ sein
+    
+    def dead_rows(self):
+        """Gibt die Zeilen aller Entities ohne Gesundheit oder Energie zurück"""
+        n = self.count
+        return np.flatnonzero((self.health[:n] <= 0) | (self.energy[:n] <= 0))
+
+
+class StoreColumn:
+    """Deskriptor, der ein Entity-Attribut auf ihre Zeile im Speicher abbildet"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj._store, self.name)[obj._row]
+
+    def __set__(self, obj, value):
+        getattr(obj._store, self.name)[obj._row] = value
@@ -0,0 +1,248 @@
+"""
+Headless-Runner für lange Evolutionsläufe ohne Display.
+
+Treibt ``Simulation.update`` und ``Simulation.next_generation`` ohne
+Fenster und ohne Zeichencode an und misst dabei die erreichte Tickrate.
+
+Aufruf (aus dem Verzeichnis oberhalb von ``PyLife``)::
+
+    python -m PyLife.headless --generations 50 --ticks-per-generation 1000
+
+Mit ``--checkpoint welt.npz`` wird der Weltzustand regelmäßig gesichert,
+mit ``--resume welt.npz`` ein abgebrochener Lauf fortgesetzt.
+``--metrics verlauf.jsonl`` (oder ``.csv``) schreibt Kennzahlen pro Generation.
+"""
+import argparse
+import time
+from PyLife.simulation import Simulation
+from PyLife.checkpoint import save_checkpoint, load_checkpoint
+
+
+class HeadlessReport:
+    """Ergebnis eines Headless-Laufs"""
+
+    def __init__(self):
+        self.ticks = 0
+        self.generations = 0
+        self.wall_time = 0.0
+        self.generation_times = []  # Wandzeit pro abgeschlossener Generation
+        self.generation_ticks = []  # Ticks pro abgeschlossener Generation
+        self.pool_stats = {}  # Kennzahlen der Objekt-Pools am Ende des Laufs
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Gibt die durchschnittlich erreichten Ticks pro Sekunde zurück"""
+        if self.wall_time <= 0:
+            return 0.0
+        return self.ticks / self.wall_time
+
+    def __str__(self) -> str:
+        """Kurze Zusammenfassung des Laufs"""
+        lines = [
+            f"Ticks: {self.ticks}",
+            f"Generationen: {self.generations}",
+            f"Wandzeit: {self.wall_time:.2f} s",
+            f"Ticks/s: {self.ticks_per_second:.1f}",
+        ]
+        if self.generation_times:
+            mean_time = sum(self.generation_times) / len(self.generation_times)
+            lines.append(f"Zeit pro Generation: {mean_time:.3f} s (Mittel), "
+                         f"{max(self.generation_times):.3f} s (Max)")
+        stats = self.pool_stats.get('food')
+        if stats:
+            lines.append(f"Pool Nahrung: {stats['hit_rate'] * 100:.1f}% Treffer, "
+                         f"{stats['allocations']} Allokationen")
+        return "\n".join(lines)
+
+
+class HeadlessRunner:
+    """Führt eine Simulation ohne Display aus"""
+
+    def __init__(self, simulation=None, width=1200, height=800,
+                 population=10, food=30, dt=1.0 / 60, ticks_per_generation=1000,
+                 checkpoint=None, checkpoint_interval=300.0,
+                 metrics=None, metrics_interval=None):
+        """Initialisiert den Runner und erstellt bei Bedarf eine neue Welt
+        
+        Ist ``checkpoint`` gesetzt, wird die Welt nach einem Generationswechsel
+        dorthin gesichert, sofern seit der letzten Sicherung mindestens
+        ``checkpoint_interval`` Sekunden vergangen sind, und am Ende des Laufs.
+        Ist ``metrics`` gesetzt, werden während ``run`` Kennzahlen pro
+        Generation (und alle ``metrics_interval`` Ticks) dorthin geschrieben.
+        """
+        self.dt = dt
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.metrics = metrics
+        self.metrics_interval = metrics_interval
+        self.ticks_per_generation = ticks_per_generation
+        self.initial_population = population
+        self.food_count = food
+
+        if simulation is None:
+            simulation = Simulation(width, height)
+            simulation.population_size = population
+            simulation.spawn_entities(population)
+            for _ in range(food):
+                simulation.spawn_food()
+        self.simulation = simulation
+
+        # Ticks seit dem letzten Generationswechsel
+        self._generation_tick = 0
+
+    def _refill_food(self):
+        """Füllt die Nahrung wieder auf die Startmenge auf"""
+        for _ in range(self.food_count - len(self.simulation.food)):
+            self.simulation.spawn_food()
+
+    def _advance_generation(self):
+        """Wechselt zur nächsten Generation (oder besiedelt die Welt neu, falls alle tot sind)"""
+        sim = self.simulation
+        if sim.entities:
+            sim.next_generation()
+        else:
+            # Population ausgestorben: neue zufällige Population erzeugen
+            if sim.metrics is not None:
+                sim.metrics.generation(sim)
+            sim.spawn_entities(sim.population_size)
+            sim.generation += 1
+        self._refill_food()
+        self._generation_tick = 0
+
+    def run_for(self, seconds) -> int:
+        """Führt so viele Ticks aus, wie in ``seconds`` Sekunden Wandzeit passen
+
+        Mindestens ein Tick läuft immer. Generationswechsel wie in ``run``.
+        Gibt die Anzahl der ausgeführten Ticks zurück.
+        """
+        sim = self.simulation
+        deadline = time.perf_counter() + seconds
+        ticks = 0
+        while True:
+            sim.update(self.dt)
+            ticks += 1
+            self._generation_tick += 1
+            if self._generation_tick >= self.ticks_per_generation:
+                self._advance_generation()
+            if time.perf_counter() >= deadline:
+                return ticks
+
+    def run(self, ticks=None, generations=None, progress=None) -> HeadlessReport:
+        """Führt die Simulation für eine Anzahl Ticks oder Generationen aus
+
+        Genau einer der Parameter ``ticks`` oder ``generations`` muss gesetzt sein.
+        ``progress`` wird (falls gesetzt) nach jeder Generation mit
+        ``(generation, ticks, seconds)`` aufgerufen.
+        """
+        if (ticks is None) == (generations is None):
+            raise ValueError("Genau einer von 'ticks' oder 'generations' muss angegeben werden")
+
+        report = HeadlessReport()
+        sim = self.simulation
+        if self.metrics is not None:
+            sim.start_metrics(self.metrics, sample_interval=self.metrics_interval)
+            try:
+                self._run(report, ticks, generations, progress)
+            finally:
+                sim.stop_metrics()
+        else:
+            self._run(report, ticks, generations, progress)
+        return report
+
+    def _run(self, report, ticks, generations, progress):
+        """Hauptschleife von ``run``"""
+        sim = self.simulation
+        start_time = time.perf_counter()
+        last_checkpoint = start_time
+        generation_start = start_time
+        generation_start_tick = 0
+
+        while True:
+            if ticks is not None and report.ticks >= ticks:
+                break
+            if generations is not None and report.generations >= generations:
+                break
+
+            sim.update(self.dt)
+            report.ticks += 1
+            self._generation_tick += 1
+
+            if self._generation_tick >= self.ticks_per_generation:
+                self._advance_generation()
+
+                now = time.perf_counter()
+                generation_time = now - generation_start
+                generation_ticks = report.ticks - generation_start_tick
+                report.generations += 1
+                report.generation_times.append(generation_time)
+                report.generation_ticks.append(generation_ticks)
+                if progress is not None:
+                    progress(sim.generation, generation_ticks, generation_time)
+                generation_start = now
+                generation_start_tick = report.ticks
+
+                if self.checkpoint is not None and now - last_checkpoint >= self.checkpoint_interval:
+                    save_checkpoint(sim, self.checkpoint)
+                    last_checkpoint = time.perf_counter()
+
+        report.wall_time = time.perf_counter() - start_time
+        report.pool_stats = sim.lifecycle.pool_stats()
+        if self.checkpoint is not None:
+            save_checkpoint(sim, self.checkpoint)
+
+
+def run_headless(ticks=None, generations=None, **kwargs) -> HeadlessReport:
+    """Bequemer Einstiegspunkt: erstellt einen Runner und führt ihn aus"""
+    progress = kwargs.pop('progress', None)
+    runner = HeadlessRunner(**kwargs)
+    return runner.run(ticks=ticks, generations=generations, progress=progress)
+
+
+def main(argv=None):
+    """Kommandozeilen-Einstiegspunkt"""
+    parser = argparse.ArgumentParser(description="PyLife ohne Display ausführen")
+    limit = parser.add_mutually_exclusive_group(required=True)
+    limit.add_argument("--ticks", type=int, help="Anzahl der Simulationsticks")
+    limit.add_argument("--generations", type=int, help="Anzahl der Generationen")
+    parser.add_argument("--ticks-per-generation", type=int, default=1000,
+                        help="Ticks bis zum automatischen Generationswechsel")
+    parser.add_argument("--width", type=int, default=1200)
+    parser.add_argument("--height", type=int, default=800)
+    parser.add_argument("--population", type=int, default=10, help="Startpopulation")
+    parser.add_argument("--food", type=int, default=30, help="Nahrungsmenge pro Generation")
+    parser.add_argument("--dt", type=float, default=1.0 / 60, help="Zeitschritt pro Tick")
+    parser.add_argument("--checkpoint", help="Datei, in die die Welt regelmäßig gesichert wird")
+    parser.add_argument("--checkpoint-interval", type=float, default=300.0,
+                        help="Mindestabstand zwischen zwei Sicherungen in Sekunden")
+    parser.add_argument("--resume", help="Checkpoint, von dem aus der Lauf fortgesetzt wird")
+    parser.add_argument("--metrics", help="JSONL- oder CSV-Datei für Kennzahlen pro Generation")
+    parser.add_argument("--metrics-interval", type=int,
+                        help="Zusätzlich alle N Ticks einen Stichproben-Datensatz schreiben")
+    args = parser.parse_args(argv)
+
+    def print_progress(generation, ticks, seconds):
+        rate = ticks / seconds if seconds > 0 else 0.0
+        print(f"Generation {generation}: {ticks} Ticks in {seconds:.2f} s ({rate:.1f} Ticks/s)")
+
+    report = run_headless(
+        ticks=args.ticks,
+        generations=args.generations,
+        width=args.width,
+        height=args.height,
+        population=args.population,
+        food=args.food,
+        dt=args.dt,
+        ticks_per_generation=args.ticks_per_generation,
+        checkpoint=args.checkpoint,
+        checkpoint_interval=args.checkpoint_interval,
+        metrics=args.metrics,
+        metrics_interval=args.metrics_interval,
+        simulation=load_checkpoint(args.resume) if args.resume else None,
+        progress=print_progress,
+    )
+    print(report)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+from PyLife.entity_state import EntityStateStore
+from PyLife.world_food import Food
+
+
+class ObjectPool:
+    """Pool wiederverwendbarer Weltobjekte
+    
+    ``acquire`` gibt ein freies Objekt nach ``reset(*args)`` zurück oder
+    erzeugt über ``factory(*args)`` ein neues. Zählt Treffer und Allokationen.
+    """
+    
+    def __init__(self, factory, max_size=None):
+        """Initialisiert einen leeren Pool (``max_size`` begrenzt die freien Objekte)"""
+        self.factory = factory
+        self.max_size = max_size
+        self._free = []
+        self.hits = 0          # Aus dem Pool wiederverwendet
+        self.allocations = 0   # Neu erzeugt
+        self.releases = 0      # Zurückgegeben
+    
+    def acquire(self, *args, **kwargs):
+        """Holt ein Objekt aus dem Pool oder erzeugt ein neues"""
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.allocations += 1
+        return obj
+    
+    def release(self, obj):
+        """Gibt ein nicht mehr benötigtes Objekt an den Pool zurück"""
+        self.releases += 1
+        if self.max_size is None or len(self._free) < self.max_size:
+            self._free.append(obj)
+    
+    @property
+    def hit_rate(self) -> float:
+        """Anteil der Anforderungen, die aus dem Pool bedient wurden"""
+        requests = self.hits + self.allocations
+        return self.hits / requests if requests else 0.0
+    
+    def stats(self) -> dict:
+        """Gibt die Kennzahlen des Pools zurück"""
+        return {
+            'free': len(self._free),
+            'hits': self.hits,
+            'allocations': self.allocations,
+            'releases': self.releases,
+            'hit_rate': self.hit_rate,
+        }
+    
+    def __len__(self):
+        return len(self._free)
+
+
+def _append_indexed(items, obj):
+    """Hängt ein Objekt an und merkt sich seinen Listenindex"""
+    obj._list_index = len(items)
+    items.append(obj)
+
+
+def _swap_remove(items, obj):
+    """Entfernt ein Objekt in O(1): das letzte Element rückt an seine Stelle"""
+    index = obj._list_index
+    if index >= len(items) or items[index] is not obj:
+        raise ValueError("Objekt ist nicht in der Liste")
+    last = items.pop()
+    if last is not obj:
+        items[index] = last
+        last._list_index = index
+
+
+class WorldLifecycle:
+    """Verwaltet, welche Objekte in der Welt und in der Physik-Engine existieren
+
+    Entities und Nahrung werden ausschließlich über diese Klasse
+    hinzugefügt und entfernt. Sie hält die Listen der Simulation und sorgt
+    dafür, dass genau deren Körper und Shapes im ``pymunk.Space`` liegen –
+    entfernte oder ersetzte Objekte hinterlassen keine Körper mehr.
+    
+    Nahrung stammt aus einem Objekt-Pool und wird beim Entfernen per
+    Swap-Remove (O(1), Reihenfolge ändert sich) aus ihrer Liste genommen.
+    Abfall liegt nicht in der Physik (siehe ``WasteField``).
+    
+    Aufgenommene Entities belegen eine Zeile im gemeinsamen
+    ``EntityStateStore``; beim Entfernen erhalten sie wieder einen privaten
+    Speicher. Die Vektor-Kernel erfassen so genau die Population.
+    """
+
+    KINDS = ('entities', 'food')
+
+    def __init__(self, space, entity_state=None):
+        """Initialisiert leere Listen für den angegebenen Space und Zustandsspeicher"""
+        self.space = space
+        self.entity_state = entity_state if entity_state is not None else EntityStateStore()
+        self.entities = []
+        self.food = []
+        self.static = []  # Feste Körper (z.B. Wände) als (body, shape)
+        self.version = 0  # Wird bei jeder Änderung der Entities oder der Nahrung erhöht
+        
+        # Pool für kurzlebige Objekte
+        self.food_pool = ObjectPool(lambda x, y, size=None, quality=None: Food(space, x, y, size, quality))
+
+    # --- Physik-Mitgliedschaft --------------------------------------------------
+
+    def _attach(self, obj):
+        """Fügt Körper und Shape eines Objekts dem Space hinzu (falls noch nicht geschehen)"""
+        if obj.body.space is None:
+            self.space.add(obj.body, obj.shape)
+
+    def _detach(self, obj):
+        """Entfernt Körper und Shape eines Objekts aus dem Space (falls vorhanden)"""
+        if obj.body.space is self.space:
+            self.space.remove(obj.body, obj.shape)
+
+    def add_static(self, body, shape):
+        """Fügt einen festen Körper (z.B. eine Wand) hinzu"""
+        self.space.add(body, shape)
+        self.static.append((body, shape))
+
+    # --- Entities, Nahrung, Abfall ------------------------------------------------
+
+    def add_entity(self, entity):
+        """Fügt eine Entity der Welt und der Physik hinzu"""
+        self._attach(entity)
+        self.entity_state.attach(entity)
+        self.entities.append(entity)
+        self.version += 1
+
+    def add_entities(self, entities):
+        """Fügt mehrere Entities hinzu (alle Körper mit einem ``space.add``-Aufruf)"""
+        objects = []
+        for entity in entities:
+            if entity.body.space is None:
+                objects.append(entity.body)
+                objects.append(entity.shape)
+        if objects:
+            self.space.add(*objects)
+        attach = self.entity_state.attach
+        for entity in entities:
+            attach(entity)
+        self.entities.extend(entities)
+        self.version += 1
+
+    def remove_entity(self, entity):
+        """Entfernt eine Entity aus der Welt und der Physik"""
+        self._detach(entity)
+        self.entities.remove(entity)
+        self.entity_state.release(entity)
+        self.version += 1
+
+    def replace_entities(self, entities):
+        """Ersetzt die Population; nicht übernommene Entities verlassen Physik und Speicher"""
+        store = self.entity_state
+        keep = set(entities)
+        for entity in self.entities:
+            if entity not in keep:
+                self._detach(entity)
+                store.release(entity)
+        for entity in entities:
+            self._attach(entity)
+            store.attach(entity)
+        self.entities[:] = entities
+        self.version += 1
+
+    def spawn_food(self, x, y, size=None, quality=None):
+        """Erstellt Nahrung (aus dem Pool) und fügt sie der Welt hinzu"""
+        food = self.food_pool.acquire(x, y, size, quality)
+        self.add_food(food)
+        return food
+
+    def add_food(self, food):
+        """Fügt Nahrung der Welt und der Physik hinzu"""
+        self._attach(food)
+        _append_indexed(self.food, food)
+        self.version += 1
+
+    def remove_food(self, food):
+        """Entfernt Nahrung (Swap-Remove) und gibt sie an den Pool zurück"""
+        self._detach(food)
+        _swap_remove(self.food, food)
+        self.food_pool.release(food)
+        self.version += 1
+
+    # --- Diagnose ---------------------------------------------------------------
+
+    def pool_stats(self) -> dict:
+        """Gibt Trefferquote und Allokationen der Pools zurück"""
+        return {'food': self.food_pool.stats()}
+
+    def counts(self) -> dict:
+        """Gibt die Anzahl der Objekte pro Art sowie der Körper/Shapes im Space zurück"""
+        return {
+            'entities': len(self.entities),
+            'food': len(self.food),
+            'static': len(self.static),
+            'bodies': len(self.space.bodies),
+            'shapes': len(self.space.shapes),
+        }
+
+    def expected_bodies(self) -> int:
+        """Anzahl der Körper, die im Space liegen sollten"""
+        return len(self.entities) + len(self.food) + len(self.static)
+
+    def is_consistent(self) -> bool:
+        """Prüft, ob der Space genau die Körper der verwalteten Objekte enthält"""
+        space = self.space
+        if len(space.bodies) != self.expected_bodies():
+            return False
+        if len(space.shapes) != self.expected_bodies():
+            return False
+        return all(
+            obj.body.space is space and obj.shape.space is space
+            for kind in self.KINDS
+            for obj in getattr(self, kind)
+        )
@@ -1,14 +1,18 @@
+import time
 import pygame
 import sys
 from PyLife.simulation import Simulation
+from PyLife.headless import HeadlessRunner
 
 # Globale Variablen für das Scrolling
 stats_scroll_position = 0
 debug_mode = False  # Debug-Modus für erweiterte Kreatur-Informationen
 nn_detail_view = False  # Detailansicht für neuronales Netzwerk
+profiler_overlay = False  # Zeitmessung der Tick-Phasen anzeigen
+turbo_mode = False  # Schnelllauf: Ticks nach Zeitbudget, selten zeichnen
 
 def main():
-    global stats_scroll_position, debug_mode, nn_detail_view
+    global stats_scroll_position, debug_mode, nn_detail_view, profiler_overlay, turbo_mode
     
     # Initialize Pygame
     pygame.init()
@@ -33,6 +37,11 @@ def main():
     TICK_RATES = [0.25, 0.5, 1.0, 2.0, 4.0]  # Verschiedene Tickraten
     current_tick_rate_index = 2  # Start bei 1.0
     
+    # Turbo-Einstellungen: Ticks pro Frame nach Zeitbudget, Bild nur mit TURBO_RENDER_FPS
+    TURBO_TICK_BUDGET = 0.05  # Sekunden Simulationsarbeit zwischen zwei Event-Abfragen
+    TURBO_RENDER_FPS = 5
+    TURBO_TICKS_PER_GENERATION = 1000  # Automatischer Generationswechsel im Turbo
+    
     # Scrolling-Einstellungen für Statistikbereich
     global stats_scroll_position
     stats_scroll_speed = 20
@@ -52,13 +61,19 @@ def main():
     sim = Simulation(SIMULATION_WIDTH, HEIGHT)
     
     # Erste Generation von Entities erstellen
-    for _ in range(10):
-        sim.spawn_entity()
+    sim.spawn_entities(10)
     
     # Nahrung erstellen
     for _ in range(30):
         sim.spawn_food()
     
+    # Im Turbo übernimmt der Headless-Runner Ticks, Generationswechsel und Nahrung
+    turbo_runner = HeadlessRunner(simulation=sim, food=30, dt=sim.fixed_timestep,
+                                  ticks_per_generation=TURBO_TICKS_PER_GENERATION)
+    turbo_ticks = 0  # Ticks seit dem letzten Turbo-Bild
+    turbo_since = 0.0  # Zeitpunkt des letzten Turbo-Bilds
+    turbo_rate = 0.0  # Simulierte Sekunden pro Sekunde Wandzeit
+    
     # Spielschleife
     clock = pygame.time.Clock()
     running = True
@@ -103,6 +118,8 @@ def main():
             "F: Nahrung hinzufügen",
             "D: Debug-Info ein/aus",
             "N: Neuronales Netzwerk",
+            "P: Profiler ein/aus",
+            "T: Turbo ein/aus",
             "Leertaste: Nächste Generation",
             "Linksklick: Entity auswählen"
         ]
@@ -117,6 +134,44 @@ def main():
             else:
                 text_surface = info_font.render(text, True, TEXT_COLOR)
             ui_surface.blit(text_surface, (control_panel.x + 8, control_panel.y + 8 + i * 20))  # Abstände angepasst
+        
+        if profiler_overlay:
+            draw_profiler_overlay()
+    
+    def draw_profiler_overlay():
+        """Zeichnet die Phasenzeiten des Profilers (unten links)"""
+        stats = sim.profile_stats()
+        rows = [(phase, values) for phase, values in stats.items()]
+        profiler_panel = pygame.Rect(10, HEIGHT - 10 - (len(rows) + 2) * 18 - 12, 290,
+                                     (len(rows) + 2) * 18 + 12)
+        draw_panel(ui_surface, profiler_panel)
+        
+        x = profiler_panel.x + 8
+        y = profiler_panel.y + 8
+        ui_surface.blit(title_font.render("Profiler (ms)", True, TEXT_COLOR), (x, y))
+        y += 18
+        header = info_font.render("Phase", True, TEXT_COLOR)
+        ui_surface.blit(header, (x, y))
+        for column, label in enumerate(("Mittel", "p95", "Max")):
+            ui_surface.blit(info_font.render(label, True, TEXT_COLOR), (x + 130 + column * 50, y))
+        for phase, values in rows:
+            y += 18
+            ui_surface.blit(info_font.render(phase, True, TEXT_COLOR), (x, y))
+            for column, key in enumerate(('mean', 'p95', 'max')):
+                value_text = info_font.render(f"{values[key]:.2f}", True, TEXT_COLOR)
+                ui_surface.blit(value_text, (x + 130 + column * 50, y))
+    
+    def draw_turbo_panel():
+        """Zeichnet die Turbo-Anzeige direkt auf den Bildschirm (UI-Panels bleiben eingefroren)"""
+        turbo_panel = pygame.Rect(SIMULATION_WIDTH - 200, 100, 190, 80)
+        draw_panel(screen, turbo_panel)
+        lines = [
+            ("Turbo", title_font),
+            (f"Generation: {sim.generation}", info_font),
+            (f"{turbo_rate:.1f} Sim-s pro s", info_font),
+        ]
+        for i, (text, font) in enumerate(lines):
+            screen.blit(font.render(text, True, TEXT_COLOR), (turbo_panel.x + 10, turbo_panel.y + 8 + i * 22))
     
     def draw_stats_area():
         """Zeichnet den permanenten Statistikbereich"""
@@ -385,6 +440,20 @@ def main():
                     # Neuronales Netzwerk Detailansicht umschalten
                     if sim.selected_entity:
                         nn_detail_view = not nn_detail_view
+                elif event.key == pygame.K_p:
+                    # Profiler-Overlay umschalten (Messung nur, solange es sichtbar ist)
+                    profiler_overlay = not profiler_overlay
+                    if profiler_overlay:
+                        sim.enable_profiling()
+                    else:
+                        sim.disable_profiling()
+                elif event.key == pygame.K_t:
+                    # Turbo umschalten
+                    turbo_mode = not turbo_mode
+                    turbo_ticks = 0
+                    turbo_since = time.perf_counter()
+                    turbo_rate = 0.0
+                    sim.accumulator = 0.0
                 elif event.key == pygame.K_PLUS or event.key == pygame.K_KP_PLUS:
                     # Tickrate erhöhen
                     current_tick_rate_index = min(len(TICK_RATES) - 1, current_tick_rate_index + 1)
@@ -397,10 +466,28 @@ def main():
                 elif event.key == pygame.K_DOWN:
                     stats_scroll_position += stats_scroll_speed
         
-        # Simulation aktualisieren, wenn keine Detailansicht aktiv ist
+        if turbo_mode and not nn_detail_view:
+            # Turbo: Ticks nach Zeitbudget, nur gelegentlich ein Bild (ohne Stats/UI neu zu zeichnen)
+            turbo_ticks += turbo_runner.run_for(TURBO_TICK_BUDGET)
+            now = time.perf_counter()
+            if now - turbo_since >= 1.0 / TURBO_RENDER_FPS:
+                turbo_rate = turbo_ticks * sim.fixed_timestep / (now - turbo_since)
+                turbo_ticks = 0
+                turbo_since = now
+                sim_surface.fill(BACKGROUND_COLOR)
+                sim.draw(sim_surface, debug_mode)
+                screen.blit(sim_surface, (0, 0))
+                screen.blit(ui_surface, (0, 0))
+                draw_turbo_panel()
+                pygame.display.flip()
+            clock.tick()
+            continue
+        
+        # Simulation in festen Zeitschritten voranbringen, wenn keine Detailansicht aktiv ist
+        # (gemessene Framezeit × Tickrate, unabhängig von der Bildrate)
         if not nn_detail_view:
-            dt = 1.0 / FPS
-            sim.update(dt * TICK_RATES[current_tick_rate_index])
+            frame_time = clock.get_time() / 1000.0
+            sim.advance(frame_time, TICK_RATES[current_tick_rate_index])
         
         # Simulation zeichnen
         sim_surface.fill(BACKGROUND_COLOR)
@@ -0,0 +1,184 @@
+"""
+Kennzahlen des Evolutionsverlaufs als Datenstrom.
+
+Der ``MetricsCollector`` erzeugt pro Generation (aus ``next_generation``)
+und optional alle ``sample_interval`` Ticks einen flachen Datensatz:
+Populationsgröße, Verteilung der Fitness, Mittelwert und Varianz jedes
+DNA-Merkmals, Nahrung, Abfall und Tick-Zeiten. Die Datensätze gehen an eine
+Generator-Senke (``jsonl_sink``/``csv_sink``), die sie puffert und nur
+blockweise schreibt.
+
+    sim.start_metrics("verlauf.jsonl", sample_interval=600)
+    ...
+    sim.stop_metrics()
+"""
+import csv
+import json
+import os
+import numpy as np
+from PyLife.creature_dna import DNA
+
+# Anzahl gepufferter Datensätze, bevor die Senke schreibt
+BUFFER_SIZE = 64
+
+# Spaltennamen der Merkmale, z.B. ``physical.size``
+TRAIT_NAMES = tuple(f'{category}.{trait}' for category, trait in DNA.TRAITS)
+
+FITNESS_FIELDS = ('mean', 'std', 'min', 'p25', 'median', 'p75', 'max')
+
+
+def jsonl_sink(file, buffer_size=BUFFER_SIZE):
+    """Generator-Senke für JSON Lines: nimmt Datensätze per ``send`` entgegen
+
+    Geschrieben wird erst, wenn ``buffer_size`` Zeilen gesammelt sind, und
+    beim Schließen des Generators (``close``).
+    """
+    lines = []
+    try:
+        while True:
+            record = yield
+            lines.append(json.dumps(record, allow_nan=False) + '\n')
+            if len(lines) >= buffer_size:
+                file.writelines(lines)
+                lines.clear()
+    finally:
+        file.writelines(lines)
+        file.flush()
+
+
+def csv_sink(file, buffer_size=BUFFER_SIZE):
+    """Generator-Senke für CSV (Kopfzeile aus den Feldern des ersten Datensatzes)"""
+    rows = []
+    writer = None
+    try:
+        while True:
+            record = yield
+            if writer is None:
+                writer = csv.DictWriter(file, fieldnames=list(record), extrasaction='ignore')
+                writer.writeheader()
+            rows.append(record)
+            if len(rows) >= buffer_size:
+                writer.writerows(rows)
+                rows.clear()
+    finally:
+        if writer is not None:
+            writer.writerows(rows)
+        file.flush()
+
+
+def open_sink(path, buffer_size=BUFFER_SIZE):
+    """Öffnet ``path`` und gibt die passende, gestartete Senke samt Datei zurück
+
+    Das Format richtet sich nach der Dateiendung (``.csv``, sonst JSON Lines).
+    """
+    path = os.fspath(path)
+    if path.endswith('.csv'):
+        file = open(path, 'w', newline='')
+        sink = csv_sink(file, buffer_size)
+    else:
+        file = open(path, 'w')
+        sink = jsonl_sink(file, buffer_size)
+    next(sink)
+    return sink, file
+
+
+class MetricsCollector:
+    """Sammelt Kennzahlen der Simulation und gibt sie an eine Senke weiter
+
+    ``tick`` wird am Ende jedes ``Simulation.update`` mit der Dauer des Ticks
+    aufgerufen, ``generation`` in ``next_generation`` vor dem Wechsel. Die
+    Tick-Zeiten eines Datensatzes beziehen sich auf die Ticks seit dem
+    vorherigen Datensatz derselben Art.
+    """
+
+    def __init__(self, sink, sample_interval=None, file=None):
+        """Initialisiert den Collector für eine gestartete Senke
+
+        ``file`` wird (falls gesetzt) beim Schließen mitgeschlossen.
+        """
+        self.sink = sink
+        self.sample_interval = sample_interval
+        self.file = file
+        self.ticks = 0
+        self.records = 0
+
+        # Tick-Zeiten seit dem letzten Datensatz, getrennt nach Art
+        self._timing = {kind: [0, 0.0, 0.0] for kind in ('generation', 'sample')}
+
+    @classmethod
+    def open(cls, path, sample_interval=None, buffer_size=BUFFER_SIZE) -> 'MetricsCollector':
+        """Erstellt einen Collector, der in die Datei ``path`` schreibt"""
+        sink, file = open_sink(path, buffer_size)
+        return cls(sink, sample_interval=sample_interval, file=file)
+
+    def tick(self, simulation, seconds):
+        """Verbucht einen Tick und erzeugt bei Bedarf einen Stichproben-Datensatz"""
+        self.ticks += 1
+        for timing in self._timing.values():
+            timing[0] += 1
+            timing[1] += seconds
+            if seconds > timing[2]:
+                timing[2] = seconds
+        interval = self.sample_interval
+        if interval and self.ticks % interval == 0:
+            self.emit(self.snapshot(simulation, 'sample'))
+
+    def generation(self, simulation, fitness=None):
+        """Erzeugt den Datensatz der zu Ende gehenden Generation"""
+        self.emit(self.snapshot(simulation, 'generation', fitness))
+
+    def snapshot(self, simulation, kind, fitness=None) -> dict:
+        """Berechnet einen Datensatz für den aktuellen Zustand der Simulation"""
+        entities = simulation.entities
+        if fitness is None:
+            fitness = simulation.population_fitness(entities)
+
+        timing = self._timing[kind]
+        ticks, seconds, slowest = timing
+        timing[:] = [0, 0.0, 0.0]
+
+        record = {
+            'kind': kind,
+            'generation': simulation.generation,
+            'tick': self.ticks,
+            'population': len(entities),
+            'food': len(simulation.food),
+            'waste': len(simulation.waste),
+            'ticks': ticks,
+            'tick_ms_mean': seconds / ticks * 1000.0 if ticks else 0.0,
+            'tick_ms_max': slowest * 1000.0,
+        }
+
+        # Fitnessverteilung (ohne Population ``None``, in JSON ``null``)
+        if len(fitness):
+            p25, median, p75 = np.percentile(fitness, (25, 50, 75)).tolist()
+            values = [float(value) for value in (fitness.mean(), fitness.std(), fitness.min(),
+                                                 p25, median, p75, fitness.max())]
+        else:
+            values = [None] * len(FITNESS_FIELDS)
+        for name, value in zip(FITNESS_FIELDS, values):
+            record[f'fitness_{name}'] = value
+
+        # Merkmale der DNA (Gene, ohne Hormoneinfluss; ohne Population ``None``)
+        if entities:
+            genes = np.array([entity.dna.genes for entity in entities])
+            means = genes.mean(axis=0).tolist()
+            variances = genes.var(axis=0).tolist()
+        else:
+            means = variances = [None] * len(TRAIT_NAMES)
+        for name, mean, variance in zip(TRAIT_NAMES, means, variances):
+            record[f'{name}.mean'] = mean
+            record[f'{name}.var'] = variance
+        return record
+
+    def emit(self, record):
+        """Gibt einen Datensatz an die Senke weiter"""
+        self.sink.send(record)
+        self.records += 1
+
+    def close(self):
+        """Schreibt gepufferte Datensätze und schließt die Senke (und die Datei)"""
+        self.sink.close()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
@@ -1,53 +1,118 @@
 import numpy as np
-import tensorflow as tf
 import pygame
 
+# Verfügbare Backends: "numpy" (Standard, ohne Abhängigkeiten) und
+# "tensorflow" (wird erst bei Bedarf importiert)
+BACKENDS = ('numpy', 'tensorflow')
+DEFAULT_BACKEND = 'numpy'
+
+# Schichtgrößen: Eingabe, versteckt, Ausgabe
+LAYER_SIZES = (8, 16, 4)
+
+
+def _load_tensorflow():
+    """Importiert TensorFlow erst, wenn das Backend tatsächlich benutzt wird"""
+    try:
+        import tensorflow as tf
+    except ImportError as exc:
+        raise ImportError(
+            "Das Backend 'tensorflow' benötigt das Paket tensorflow "
+            "(python -m pip install tensorflow)"
+        ) from exc
+    return tf
+
+
+def _glorot_uniform(fan_in, fan_out):
+    """Initialisiert Gewichte wie der Keras-Standard (glorot_uniform)"""
+    limit = np.sqrt(6.0 / (fan_in + fan_out))
+    return np.random.uniform(-limit, limit, (fan_in, fan_out))
+
+
 class NeuralNetwork:
-    def __init__(self):
+    def __init__(self, backend=None, weights=None):
         # Einfaches neuronales Netz mit:
         # - 8 Eingabeneuronen (für Sensoren)
         # - 16 versteckte Neuronen
         # - 4 Ausgabeneuronen (für Bewegungssteuerung)
-        self.model = tf.keras.Sequential([
-            tf.keras.layers.Dense(16, activation='relu', input_shape=(8,)),
-            tf.keras.layers.Dense(4, activation='tanh')
-        ])
+        #
+        # Die Gewichte liegen im Keras-Layout vor:
+        # [kernel (8×16), bias (16), kernel (16×4), bias (4)]
+        self.backend = backend or DEFAULT_BACKEND
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Unbekanntes Backend '{self.backend}', erlaubt: {', '.join(BACKENDS)}")
         
-        # Optimizer und Loss-Funktion
-        self.model.compile(
-            optimizer='adam',
-            loss='mse'
-        )
+        self.model = None
+        if self.backend == 'tensorflow':
+            tf = _load_tensorflow()
+            self.model = tf.keras.Sequential([
+                tf.keras.layers.Input(shape=(LAYER_SIZES[0],)),
+                tf.keras.layers.Dense(LAYER_SIZES[1], activation='relu'),
+                tf.keras.layers.Dense(LAYER_SIZES[2], activation='tanh')
+            ])
+            
+            # Optimizer und Loss-Funktion
+            self.model.compile(
+                optimizer='adam',
+                loss='mse'
+            )
+            if weights is not None:
+                self.model.set_weights(weights)
+        else:
+            if weights is None:
+                weights = [
+                    _glorot_uniform(LAYER_SIZES[0], LAYER_SIZES[1]),
+                    np.zeros(LAYER_SIZES[1]),
+                    _glorot_uniform(LAYER_SIZES[1], LAYER_SIZES[2]),
+                    np.zeros(LAYER_SIZES[2])
+                ]
+            self.weights = [np.asarray(w, dtype=np.float64) for w in weights]
+    
+    def get_weights(self):
+        """Gibt die Gewichte im Keras-Layout zurück"""
+        if self.model is not None:
+            return self.model.get_weights()
+        return [w.copy() for w in self.weights]
+    
+    def set_weights(self, weights):
+        """Setzt die Gewichte im Keras-Layout"""
+        if self.model is not None:
+            self.model.set_weights(weights)
+        else:
+            self.weights = [np.asarray(w, dtype=np.float64) for w in weights]
         
     def predict(self, inputs):
         """Gibt Vorhersagen basierend auf den Eingaben zurück"""
         # Eingaben normalisieren
         inputs = np.array(inputs).reshape(1, -1)
-        return self.model.predict(inputs, verbose=0)[0]
+        if self.model is not None:
+            return self.model.predict(inputs, verbose=0)[0]
+        
+        kernel_h, bias_h, kernel_o, bias_o = self.weights
+        hidden = np.maximum(0.0, inputs @ kernel_h + bias_h)  # ReLU
+        return np.tanh(hidden @ kernel_o + bias_o)[0]
     
     def mutate(self, mutation_rate=0.1):
         """Mutiert die Gewichte des neuronalen Netzes"""
-        weights = self.model.get_weights()
+        weights = self.get_weights()
         for i in range(len(weights)):
             mask = np.random.random(weights[i].shape) < mutation_rate
             mutation = np.random.normal(0, 0.1, weights[i].shape)
             weights[i] = np.where(mask, weights[i] + mutation, weights[i])
-        self.model.set_weights(weights)
+        self.set_weights(weights)
     
     def crossover(self, other):
         """Kreuzt dieses Netz mit einem anderen"""
-        new_network = NeuralNetwork()
-        weights1 = self.model.get_weights()
-        weights2 = other.model.get_weights()
+        weights1 = self.get_weights()
+        weights2 = other.get_weights()
         
         new_weights = []
         for w1, w2 in zip(weights1, weights2):
             mask = np.random.random(w1.shape) < 0.5
             new_w = np.where(mask, w1, w2)
             new_weights.append(new_w)
-            
-        new_network.model.set_weights(new_weights)
-        return new_network
+        
+        # Das Kind wird direkt mit den gekreuzten Gewichten erstellt
+        return NeuralNetwork(backend=self.backend, weights=new_weights)
         
     def draw(self, surface, rect):
         """Visualisiert das neuronale Netzwerk"""
@@ -57,7 +122,7 @@ class NeuralNetwork:
         INACTIVE_COLOR = (200, 100, 100)  # Rot für inaktive Verbindungen
         
         # Schichten definieren
-        layers = [8, 16, 4]  # Eingabe, versteckt, Ausgabe
+        layers = list(LAYER_SIZES)  # Eingabe, versteckt, Ausgabe
         
         # Abstand und Größe berechnen
         padding = 20
@@ -67,7 +132,7 @@ class NeuralNetwork:
         )
         
         # Gewichte des Netzwerks holen
-        weights = self.model.get_weights()
+        weights = self.get_weights()
         
         # Positionen für alle Neuronen berechnen
         positions = []
@@ -0,0 +1,84 @@
+import time
+from collections import deque
+import numpy as np
+
+
+class TickProfiler:
+    """Misst die Dauer der einzelnen Phasen von ``Simulation.update``
+
+    Die Messung arbeitet wie eine Stoppuhr mit Rundenzeiten: ``begin`` startet
+    den Tick, jedes ``lap(phase)`` schreibt die seit der letzten Marke
+    vergangene Zeit der Phase gut, ``end`` schließt den Tick ab. Die letzten
+    ``window`` Ticks werden pro Phase in einem Ringpuffer gehalten.
+    """
+
+    # Phasen in der Reihenfolge, in der sie in ``Simulation.update`` auftreten
+    PHASES = (
+        'physics',         # space.step (inkl. Fressen im Kontakt-Handler für Nahrung)
+        'brains',          # Alter und Auswertung der Gehirne
+        'movement',        # Bewegung anwenden
+        'energy',          # Energie-, Gesundheits- und Cooldown-Kernel
+        'digestion',       # Verdauung
+        'hormones',        # Hormoneffekte
+        'waste_spawn',     # Abfall aus der Verdauung erzeugen
+        'deaths',          # Tote Entities entfernen
+        'waste_decay',     # Abfall altern lassen und entfernen
+        'recording',       # Replay-Aufzeichnung (falls aktiv)
+    )
+
+    def __init__(self, window=300):
+        """Initialisiert den Profiler mit einem Fenster von ``window`` Ticks"""
+        self.window = window
+        self._samples = {phase: deque(maxlen=window) for phase in self.PHASES + ('total',)}
+        self._current = dict.fromkeys(self.PHASES, 0.0)
+        self._start = 0.0
+        self._mark = 0.0
+
+    def begin(self):
+        """Startet die Messung eines Ticks"""
+        self._start = self._mark = time.perf_counter()
+        current = self._current
+        for phase in current:
+            current[phase] = 0.0
+
+    def lap(self, phase):
+        """Schreibt die Zeit seit der letzten Marke der Phase ``phase`` gut"""
+        now = time.perf_counter()
+        self._current[phase] += now - self._mark
+        self._mark = now
+
+    def end(self):
+        """Schließt den Tick ab und legt die Messwerte im Ringpuffer ab"""
+        now = time.perf_counter()
+        samples = self._samples
+        for phase, seconds in self._current.items():
+            samples[phase].append(seconds)
+        samples['total'].append(now - self._start)
+
+    @property
+    def ticks(self) -> int:
+        """Anzahl der Ticks im aktuellen Fenster"""
+        return len(self._samples['total'])
+
+    def stats(self) -> dict:
+        """Gibt pro Phase Mittelwert, 95. Perzentil und Maximum in Millisekunden zurück
+
+        Die Reihenfolge entspricht ``PHASES``, zuletzt folgt ``'total'``.
+        Bei leerem Fenster wird ein leeres Dict zurückgegeben.
+        """
+        if not self.ticks:
+            return {}
+        result = {}
+        for phase, samples in self._samples.items():
+            values = np.fromiter(samples, dtype=float, count=len(samples)) * 1000.0
+            result[phase] = {
+                'mean': float(values.mean()),
+                'p95': float(np.percentile(values, 95)),
+                'max': float(values.max()),
+            }
+        return result
+
+    def reset(self):
+        """Verwirft alle gesammelten Messwerte"""
+        for samples in self._samples.values():
+            samples.clear()
@@ -0,0 +1,341 @@
+"""
+Aufzeichnung und Wiedergabe von Simulationsläufen.
+
+Der ``ReplayRecorder`` hängt nach jedem ``Simulation.update`` einen Datensatz
+an die Replay-Datei an: Position, Winkel, Energie und Gesundheit aller
+Entities sowie Nahrung und Abfall des Ticks. Ein Datensatz ist genau so groß
+wie die Welt des Ticks. Pro Tick kommt ein Eintrag fester Größe mit Offset
+und Anzahlen in die Indexdatei (``<pfad>.idx``). Die DNA jeder Entity wird
+einmalig beim ersten Auftauchen in eine Begleitdatei (``<pfad>.dna``)
+geschrieben.
+
+Über den Index springt der ``ReplayPlayer`` in O(1) zu jedem Tick und
+zeichnet ihn über ``Simulation.draw``, ohne Physik oder Gehirne auszuführen.
+
+    sim.start_recording("lauf.replay")
+    ...
+    sim.stop_recording()
+    player = ReplayPlayer("lauf.replay")
+    player.draw(surface, tick=1234)
+"""
+import os
+import numpy as np
+from pymunk.batch import Buffer, BodyFields, get_space_bodies
+from PyLife.creature import Entity
+from PyLife.creature_dna import DNA
+from PyLife.world_waste import WasteField
+
+REPLAY_MAGIC = b'PYLIFERP'
+REPLAY_VERSION = 2
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('width', '<u4'),
+    ('height', '<u4'),
+    ('ticks', '<u8'),  # Anzahl vollständig geschriebener Ticks
+])
+
+# Indexeintrag pro Tick: Position des Datensatzes in der Replay-Datei und seine Anzahlen
+INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('entity_count', '<u4'),
+    ('food_count', '<u4'),
+    ('waste_count', '<u4'),
+])
+
+ENTITY_DTYPE = np.dtype([
+    ('id', '<i4'),  # Replay-ID (Index in der DNA-Datei)
+    ('x', '<f4'), ('y', '<f4'), ('angle', '<f4'),
+    ('energy', '<f4'), ('health', '<f4'),
+])
+FOOD_DTYPE = np.dtype([('x', '<f4'), ('y', '<f4'), ('size', '<f4'), ('quality', '<f4')])
+WASTE_DTYPE = np.dtype([('x', '<f4'), ('y', '<f4'), ('size', '<f4'), ('shade', '<f4'), ('variant', '<f4')])
+
+DNA_DTYPE = np.dtype([
+    ('id', '<i4'),
+    ('tick', '<i8'),  # Tick des ersten Auftauchens
+    ('genes', '<f8', (len(DNA.TRAITS),)),
+    ('hormones', '<f8', (len(DNA.HORMONES),)),
+])
+
+
+def frame_dtype(entity_count, food_count, waste_count) -> np.dtype:
+    """Layout eines Tick-Datensatzes mit den angegebenen Anzahlen"""
+    return np.dtype([
+        ('tick', '<i8'),
+        ('generation', '<i4'),
+        ('entity_count', '<i4'),
+        ('food_count', '<i4'),
+        ('waste_count', '<i4'),
+        ('entities', ENTITY_DTYPE, (entity_count,)),
+        ('food', FOOD_DTYPE, (food_count,)),
+        ('waste', WASTE_DTYPE, (waste_count,)),
+    ])
+
+
+class ReplayRecorder:
+    """Schreibt pro Tick einen Datensatz und einen Indexeintrag in eine Replay-Datei
+
+    Positionen kommen gebündelt aus ``pymunk.batch``; die Zuordnung
+    Körper -> Objekt wird nur neu aufgebaut, wenn sich die Objekte der Welt
+    geändert haben (``WorldLifecycle.version``).
+    """
+
+    def __init__(self, path, simulation):
+        """Legt die Replay-Datei (samt Index- und DNA-Begleitdatei) neu an"""
+        self.path = os.fspath(path)
+        self.ticks = 0
+
+        header = np.zeros((), dtype=HEADER_DTYPE)
+        header['magic'] = REPLAY_MAGIC
+        header['version'] = REPLAY_VERSION
+        header['width'] = simulation.width
+        header['height'] = simulation.height
+        with open(self.path, 'wb') as file:
+            file.write(header.tobytes())
+        self._header = np.memmap(self.path, dtype=HEADER_DTYPE, mode='r+', shape=(1,))
+        self._file = open(self.path, 'ab')
+        self._offset = HEADER_DTYPE.itemsize  # Position des nächsten Datensatzes
+        self._index_file = open(self.path + '.idx', 'wb')
+        self._dna_file = open(self.path + '.dna', 'wb')
+
+        # Zuordnung der Objekte (neu aufgebaut bei Änderungen der Welt)
+        self._version = None
+        self._ids = {}  # Entity -> (Replay-ID, Körper-ID)
+        self._food_body_ids = {}  # Nahrung -> Körper-ID (bleibt bei Wiederverwendung aus dem Pool gleich)
+        self._next_id = 0
+        self._buffer = Buffer()
+
+    # --- Datei ------------------------------------------------------------------
+
+    def flush(self):
+        """Schreibt die Datensätze auf die Platte und aktualisiert die Tickzahl im Kopf
+
+        Die Tickzahl wird zuletzt geschrieben, sodass ein gleichzeitig
+        geöffneter ``ReplayPlayer`` nur vollständige Ticks sieht.
+        """
+        self._file.flush()
+        self._index_file.flush()
+        self._dna_file.flush()
+        self._header['ticks'][0] = self.ticks
+        self._header.flush()
+
+    def close(self):
+        """Schließt die Aufzeichnung"""
+        if self._file.closed:
+            return
+        self.flush()
+        self._header = None
+        for file in (self._file, self._index_file, self._dna_file):
+            file.close()
+
+    # --- Aufzeichnung -----------------------------------------------------------
+
+    def _rebuild(self, simulation):
+        """Baut die Zuordnung Körper-ID -> Slot neu auf und schreibt neue DNA"""
+        entities = simulation.entities
+        food = simulation.food
+        # Pro Objekt zwischengespeichert, da ``body.id`` über cffi vergleichsweise teuer ist
+        known = self._ids
+        ids = {}
+        new_entities = []
+        for entity in entities:
+            info = known.get(entity)
+            if info is None:
+                info = (self._next_id, entity.body.id)
+                self._next_id += 1
+                new_entities.append((info[0], entity))
+            ids[entity] = info
+        self._ids = ids
+        # Größe und Qualität werden immer neu gelesen: Nahrung aus dem Pool wird mit
+        # neuen Werten zurückgesetzt, nur der Körper (und seine ID) bleibt erhalten
+        known = self._food_body_ids
+        food_body_ids = {}
+        for item in food:
+            body_id = known.get(item)
+            if body_id is None:
+                body_id = item.body.id
+            food_body_ids[item] = body_id
+        self._food_body_ids = food_body_ids
+
+        if new_entities:
+            records = np.zeros(len(new_entities), dtype=DNA_DTYPE)
+            for record, (replay_id, entity) in zip(records, new_entities):
+                record['id'] = replay_id
+                record['tick'] = self.ticks
+                record['genes'] = entity.dna.genes
+                record['hormones'] = entity.dna.hormone_levels
+            self._dna_file.write(records.tobytes())
+
+        # Slots: erst die Entities, dann die Nahrung (jeweils in Listenreihenfolge)
+        entity_info = np.array(list(ids.values()), dtype=np.int64).reshape(len(ids), 2)
+        food_ids = np.fromiter(food_body_ids.values(), dtype=np.int64, count=len(food_body_ids))
+        body_ids = np.concatenate([entity_info[:, 1], food_ids])
+        order = np.argsort(body_ids)
+        self._sorted_body_ids = body_ids[order]
+        self._sorted_slots = order
+        self._entity_ids = entity_info[:, 0].astype(np.int32)
+        self._entity_rows = np.array([entity._row for entity in entities], dtype=np.intp)
+        self._food_size = np.fromiter((item.size for item in food), dtype=np.float32, count=len(food))
+        self._food_quality = np.fromiter((item.quality for item in food), dtype=np.float32, count=len(food))
+        self._version = simulation.lifecycle.version
+
+    def _body_states(self, space, count):
+        """Gibt x, y und Winkel aller Entity- und Nahrungskörper in Slot-Reihenfolge zurück"""
+        buffer = self._buffer
+        buffer.clear()
+        get_space_bodies(space, BodyFields.BODY_ID | BodyFields.POSITION | BodyFields.ANGLE, buffer)
+        body_ids = np.frombuffer(buffer.int_buf(), dtype=np.int64)
+        values = np.frombuffer(buffer.float_buf(), dtype=np.float64).reshape(-1, 3)
+
+        # Statische Körper (Wände) und unbekannte Körper werden verworfen
+        sorted_ids = self._sorted_body_ids
+        states = np.zeros((count, 3))
+        if len(sorted_ids):
+            index = np.minimum(np.searchsorted(sorted_ids, body_ids), len(sorted_ids) - 1)
+            known = sorted_ids[index] == body_ids
+            states[self._sorted_slots[index[known]]] = values[known]
+        return states
+
+    def record(self, simulation):
+        """Hängt den aktuellen Zustand der Simulation als neuen Tick an"""
+        if self._version != simulation.lifecycle.version:
+            self._rebuild(simulation)
+
+        entity_count = len(self._entity_ids)
+        food_count = len(self._food_size)
+        waste = simulation.waste
+        waste_count = len(waste)
+        states = self._body_states(simulation.space, entity_count + food_count)
+
+        frame = np.zeros((), dtype=frame_dtype(entity_count, food_count, waste_count))
+        frame['tick'] = self.ticks
+        frame['generation'] = simulation.generation
+        frame['entity_count'] = entity_count
+        frame['food_count'] = food_count
+        frame['waste_count'] = waste_count
+
+        # Entities
+        items = frame['entities']
+        items['id'] = self._entity_ids
+        items['x'] = states[:entity_count, 0]
+        items['y'] = states[:entity_count, 1]
+        items['angle'] = states[:entity_count, 2]
+        store = simulation.entity_state
+        items['energy'] = store.energy[self._entity_rows]
+        items['health'] = store.health[self._entity_rows]
+
+        # Nahrung
+        items = frame['food']
+        items['x'] = states[entity_count:, 0]
+        items['y'] = states[entity_count:, 1]
+        items['size'] = self._food_size
+        items['quality'] = self._food_quality
+
+        # Abfall
+        items = frame['waste']
+        for name in WASTE_DTYPE.names:
+            items[name] = getattr(waste, name)[:waste_count]
+
+        entry = np.array((self._offset, entity_count, food_count, waste_count), dtype=INDEX_DTYPE)
+        self._file.write(frame.tobytes())
+        self._index_file.write(entry.tobytes())
+        self._offset += frame.dtype.itemsize
+        self.ticks += 1
+
+
+class ReplayPlayer:
+    """Spielt eine Replay-Datei ab
+
+    ``frame(tick)`` liefert den Datensatz eines Ticks über den Index direkt
+    aus der gemappten Datei (O(1)). ``show(tick)`` überträgt ihn in eine eigene
+    ``Simulation`` (ohne Physikschritt), ``draw`` zeichnet ihn über
+    ``Simulation.draw``.
+    """
+
+    def __init__(self, path, simulation=None):
+        """Öffnet eine Replay-Datei (auch während sie noch aufgezeichnet wird)"""
+        from PyLife.simulation import Simulation
+        self.path = os.fspath(path)
+        header = np.fromfile(self.path, dtype=HEADER_DTYPE, count=1)
+        if len(header) == 0 or header[0]['magic'] != REPLAY_MAGIC:
+            raise ValueError(f"'{self.path}' ist keine Replay-Datei")
+        header = header[0]
+        if int(header['version']) != REPLAY_VERSION:
+            raise ValueError(f"Nicht unterstützte Replay-Version {int(header['version'])}")
+        self.header = header
+        self.index = np.fromfile(self.path + '.idx', dtype=INDEX_DTYPE, count=int(header['ticks']))
+        self.ticks = len(self.index)
+        self.data = np.memmap(self.path, dtype=np.uint8, mode='r')
+
+        # DNA aller aufgezeichneten Entities (Replay-ID = Index)
+        dna_path = self.path + '.dna'
+        count = os.path.getsize(dna_path) // DNA_DTYPE.itemsize
+        self.dna = np.fromfile(dna_path, dtype=DNA_DTYPE, count=count)
+
+        if simulation is None:
+            simulation = Simulation(int(header['width']), int(header['height']))
+        self.simulation = simulation
+        self._entities = {}  # Replay-ID -> Entity (einmal erzeugt, dann nur verschoben)
+        self.tick = None
+
+    def __len__(self):
+        return self.ticks
+
+    def frame(self, tick):
+        """Gibt den Datensatz eines Ticks zurück (ohne Kopie aus der gemappten Datei)"""
+        entry = self.index[tick]
+        dtype = frame_dtype(int(entry['entity_count']), int(entry['food_count']),
+                            int(entry['waste_count']))
+        return np.ndarray((), dtype=dtype, buffer=self.data, offset=int(entry['offset']))
+
+    def _entity(self, replay_id):
+        """Gibt die Entity zu einer Replay-ID zurück (erzeugt sie beim ersten Mal)"""
+        entity = self._entities.get(replay_id)
+        if entity is None:
+            record = self.dna[replay_id]
+            dna = DNA.from_genome(record['genes'].copy(), record['hormones'].copy())
+            entity = Entity(self.simulation.space, 0, 0, dna, self.simulation, add_to_space=False)
+            self._entities[replay_id] = entity
+        return entity
+
+    def show(self, tick):
+        """Überträgt den Zustand eines Ticks in die Simulation des Players"""
+        frame = self.frame(tick)
+        sim = self.simulation
+        sim.generation = int(frame['generation'])
+
+        # Entities
+        items = frame['entities']
+        entities = [self._entity(replay_id) for replay_id in items['id'].tolist()]
+        sim.entities = entities
+        for entity, x, y, angle, energy, health in zip(
+                entities, items['x'].tolist(), items['y'].tolist(), items['angle'].tolist(),
+                items['energy'].tolist(), items['health'].tolist()):
+            entity.body.position = (x, y)
+            entity.body.angle = angle
+            entity.energy = energy
+            entity.health = health
+
+        # Nahrung (Objekte kommen aus dem Pool der Simulation)
+        for food in sim.food[:]:
+            sim.remove_food(food)
+        items = frame['food']
+        for x, y, size, quality in zip(items['x'].tolist(), items['y'].tolist(),
+                                       items['size'].tolist(), items['quality'].tolist()):
+            sim.spawn_food(x, y, size=size, quality=quality)
+
+        # Abfall
+        items = frame['waste']
+        columns = {name: np.zeros(len(items)) for name in WasteField.COLUMNS}
+        for name in WASTE_DTYPE.names:
+            columns[name] = items[name]
+        sim.waste = WasteField.from_arrays(columns)
+        self.tick = tick
+
+    def draw(self, surface, tick=None, debug_mode=False):
+        """Zeichnet einen Tick (Standard: den zuletzt gezeigten) über ``Simulation.draw``"""
+        if tick is not None and tick != self.tick:
+            self.show(tick)
+        self.simulation.draw(surface, debug_mode)
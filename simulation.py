@@ -1,13 +1,39 @@
+import time
 import pymunk
 import pygame
 import numpy as np
+from PyLife import collision_types
 from PyLife.creature import Entity
 from PyLife.creature_renderer import CreatureRenderer
-from PyLife.world_food import Food
-from PyLife.world_waste import Waste
 from PyLife.creature_dna import DNA
-from PyLife.neural_network import NeuralNetwork
-import random
+from PyLife.spatial_grid import SpatialHashGrid, count_within_radius
+from PyLife.brain import Brain, BrainBatch
+from PyLife.entity_state import EntityStateStore
+from PyLife.profiler import TickProfiler
+from PyLife.replay import ReplayRecorder
+from PyLife.metrics import MetricsCollector
+from PyLife.lifecycle import WorldLifecycle
+from PyLife.world_food import FoodAtlas
+from PyLife.world_waste import WasteField
+
+# Zellgröße des Nahrungsgitters (etwa Entity-Radius + Nahrungsradius)
+FOOD_GRID_CELL_SIZE = 50
+
+# Zellgröße des Entity-Gitters (in der Größenordnung der Sensorreichweite)
+ENTITY_GRID_CELL_SIZE = 100
+
+# Zusätzlicher Rand (Weltkoordinaten) beim Viewport-Culling, damit Objekte,
+# die nur teilweise im Bild sind (Glow, Statusbalken), nicht abgeschnitten werden
+VIEW_CULL_MARGIN = 60
+
+# Fester Zeitschritt eines Ticks (Sekunden Simulationszeit) für ``advance``
+FIXED_TIMESTEP = 1.0 / 60
+
+# Obergrenze für Ticks pro ``advance``-Aufruf (verhindert, dass ein langsamer
+# Frame immer mehr Rückstand aufbaut)
+MAX_STEPS_PER_FRAME = 8
+
+BACKGROUND_COLOR = (240, 240, 245)
 
 class Simulation:
     def __init__(self, width, height):
@@ -15,19 +41,51 @@ class Simulation:
         self.width = width
         self.height = height
         
-        self.entities = []
-        self.food = []
-        self.waste = []  # Liste für Abfall
+        self.waste = WasteField()  # Abfall als Partikelsystem (außerhalb der Physik)
         self.generation = 1
         self.time = 0
         self.population_size = 20  # Standardgröße der Population
         
+        # Räumlicher Index für Nahrung (auch für andere Subsysteme abfragbar). Positionen
+        # werden nicht pro Tick, sondern erst bei der nächsten Abfrage abgeglichen
+        self.food_grid = SpatialHashGrid(FOOD_GRID_CELL_SIZE)
+        self._food_grid_dirty = False
+        
+        # Räumlicher Index für Entities (Nachbarschaftsabfragen, einmal pro Tick abgeglichen)
+        self.entity_grid = SpatialHashGrid(ENTITY_GRID_CELL_SIZE)
+        
+        # Spaltenorientierter Speicher für die Vitalwerte aller Entities
+        self.entity_state = EntityStateStore()
+        
+        # Gebatchte Gehirnauswertung für die gesamte Population
+        self.batched_inference = True
+        self._brain_batch = None  # Gestapelte Gewichte, neu aufgebaut bei Populationsänderung
+        
+        # Optionale Zeitmessung der Tick-Phasen (None = deaktiviert)
+        self.profiler = None
+        
+        # Optionale Aufzeichnung für Replays (None = deaktiviert)
+        self.recorder = None
+        
+        # Optionaler Export von Kennzahlen pro Generation (None = deaktiviert)
+        self.metrics = None
+        
+        # Fester Zeitschritt: Zeitspeicher für ``advance`` und Physik-Unterschritte pro Tick
+        self.fixed_timestep = FIXED_TIMESTEP
+        self.physics_substeps = 1
+        self.max_steps_per_frame = MAX_STEPS_PER_FRAME
+        self.accumulator = 0.0
+        self.dropped_time = 0.0  # Wegen ``max_steps_per_frame`` verworfene Zeit
+        
         # Ausgewählte Entity
         self.selected_entity = None
         
         # Creature Renderer für die Entities
         self.creature_renderer = CreatureRenderer()
         
+        # Vorgerenderte Nahrungs-Sprites (nach Größe/Qualität quantisiert)
+        self.food_atlas = FoodAtlas()
+        
         # Zufallsgenerator für konsistente Ergebnisse
         self.rng = np.random.RandomState(42)
         
@@ -35,12 +93,51 @@ class Simulation:
         self.space = pymunk.Space()
         self.space.gravity = (0, 0)  # Keine Schwerkraft in Top-Down
         
+        # Verwaltung der Objekte in der Welt (Listen und Physik-Mitgliedschaft)
+        self.lifecycle = WorldLifecycle(self.space, self.entity_state)
+        
         # Wände erstellen
         self._create_walls()
         
+        # Nahrungsaufnahme über Pymunk-Kollisionen (Broadphase in Chipmunk)
+        self._eaten_food = set()  # In diesem Physikschritt gefressen, Entfernen steht aus
+        self._setup_collision_handlers()
+        
         self.zoom = 1.0  # Zoom-Level
         self.camera_offset = (0, 0)  # Kamera-Offset für Panning
         
+    @property
+    def entities(self):
+        """Liste der lebenden Entities (gehört dem Lifecycle-Manager)"""
+        return self.lifecycle.entities
+    
+    @entities.setter
+    def entities(self, entities):
+        """Ersetzt die Population; entfernte Entities verlassen auch die Physik"""
+        self.lifecycle.replace_entities(entities)
+        self._brain_batch = None
+    
+    @property
+    def food(self):
+        """Liste der Nahrungsobjekte (gehört dem Lifecycle-Manager)"""
+        return self.lifecycle.food
+    
+    @property
+    def selected_entity(self):
+        """Ausgewählte Entity (oder ``None``)"""
+        return self._selected_entity
+    
+    @selected_entity.setter
+    def selected_entity(self, entity):
+        """Wählt eine Entity aus und wertet ihr Gehirn einmal für die Visualisierung aus
+        
+        So hat die Netzansicht sofort Aktivierungen, auch wenn die Simulation
+        pausiert ist oder im aktuellen Frame kein Tick läuft.
+        """
+        self._selected_entity = entity
+        if entity is not None:
+            entity.brain.forward(np.array(entity.brain_input_values()).reshape(1, -1))
+    
     def reset_camera(self):
         """Setzt die Kamera-Einstellungen auf die Standardwerte zurück"""
         self.zoom = 1.0
@@ -86,7 +183,38 @@ class Simulation:
             shape = pymunk.Segment(body, wall[0], wall[1], wall_thickness)
             shape.friction = 0.7
             shape.elasticity = 0.5
-            self.space.add(body, shape)
+            self.lifecycle.add_static(body, shape)
+    
+    def _setup_collision_handlers(self):
+        """Registriert die Kollisionshandler für Entities, Nahrung und Abfall"""
+        eating = self.space.add_collision_handler(collision_types.ENTITY, collision_types.FOOD)
+        eating.pre_solve = self._on_entity_food_contact
+    
+    def _on_entity_food_contact(self, arbiter, space, data):
+        """Kontakt zwischen Entity und Nahrung: versucht die Nahrung zu fressen
+        
+        Wird in jedem Physikschritt aufgerufen, solange sich beide berühren.
+        Die Nahrung wird erst nach dem Schritt (Post-Step-Callback) entfernt.
+        Gibt ``False`` zurück, damit gefressene Nahrung nicht mehr abprallt.
+        """
+        entity_shape, food_shape = arbiter.shapes
+        food = food_shape.owner
+        if food in self._eaten_food:
+            return False
+        if entity_shape.owner.eat_food(food):
+            self._eaten_food.add(food)
+            space.add_post_step_callback(self._remove_eaten_food, food)
+            return False
+        return True
+    
+    def _remove_eaten_food(self, space, food):
+        """Post-Step-Callback: entfernt gefressene Nahrung aus der Welt
+        
+        Wurde die Nahrung inzwischen anderweitig entfernt, hat ``remove_food``
+        sie bereits aus ``_eaten_food`` genommen.
+        """
+        if food in self._eaten_food:
+            self.remove_food(food)
     
     def spawn_entity(self, x=None, y=None, dna=None):
         """Erstellt eine neue Entity an der angegebenen Position"""
@@ -96,17 +224,129 @@ class Simulation:
             y = np.random.uniform(0, self.height)
             
         entity = Entity(self.space, x, y, dna, self)
-        self.entities.append(entity)
+        self.lifecycle.add_entity(entity)
+        self.entity_grid.insert(entity, entity.body.position.x, entity.body.position.y)
+        self._brain_batch = None
+    
+    def _create_entities(self, dnas, positions, brains=None):
+        """Erstellt Entities (noch ohne Physik), standardmäßig mit gemeinsam erzeugten Gehirnen"""
+        if brains is None:
+            brains = Brain.create_many(len(dnas), *Entity.BRAIN_SIZE)
+        # Gemeinsamer Zwischenspeicher statt eines eigenen Speichers pro Entity
+        staging = EntityStateStore(capacity=len(dnas))
+        return [
+            Entity(self.space, x, y, dna, self, brain=brain, add_to_space=False, store=staging)
+            for dna, brain, (x, y) in zip(dnas, brains, positions.tolist())
+        ]
+    
+    def spawn_entities(self, n, dnas=None, positions=None, brains=None):
+        """Erstellt ``n`` Entities in einem Durchgang und gibt sie zurück
+        
+        Schneller als ``spawn_entity`` in einer Schleife: Genome und
+        Gehirngewichte werden als Blöcke erzeugt, alle Körper mit einem Aufruf
+        in den Space gelegt. ``dnas`` ist eine Liste von ``n`` DNA-Objekten
+        (Standard: zufällig), ``positions`` ein (n×2)-Array (Standard: zufällig),
+        ``brains`` eine Liste von ``n`` Gehirnen (Standard: zufällig).
+        """
+        if dnas is None:
+            genes, hormone_levels = DNA.random_genomes(n)
+            dnas = [DNA.from_genome(g, h) for g, h in zip(genes, hormone_levels)]
+        elif len(dnas) != n:
+            raise ValueError(f"{len(dnas)} DNA-Objekte für {n} Entities")
+        if brains is not None and len(brains) != n:
+            raise ValueError(f"{len(brains)} Gehirne für {n} Entities")
+        if positions is None:
+            positions = np.random.uniform(0, 1, (n, 2)) * (self.width, self.height)
+        else:
+            positions = np.asarray(positions, dtype=float).reshape(n, 2)
+        
+        entities = self._create_entities(dnas, positions, brains)
+        self.lifecycle.add_entities(entities)
+        for entity, (x, y) in zip(entities, positions.tolist()):
+            self.entity_grid.insert(entity, x, y)
+        self._brain_batch = None
+        return entities
     
-    def spawn_food(self, x=None, y=None):
-        """Spawnt Nahrung in der Umgebung"""
+    def remove_entity(self, entity):
+        """Entfernt eine Entity aus der Welt"""
+        self.lifecycle.remove_entity(entity)
+        self.entity_grid.discard(entity)
+        self._brain_batch = None
+    
+    def spawn_food(self, x=None, y=None, size=None, quality=None):
+        """Spawnt Nahrung in der Umgebung und gibt sie zurück (Größe/Qualität standardmäßig zufällig)"""
         if x is None:
             x = np.random.randint(20, self.width - 20)
         if y is None:
             y = np.random.randint(20, self.height - 20)
         
-        food = Food(self.space, x, y)
-        self.food.append(food)
+        food = self.lifecycle.spawn_food(x, y, size, quality)
+        self.food_grid.insert(food, food.body.position.x, food.body.position.y)
+        return food
+    
+    def remove_food(self, food):
+        """Entfernt Nahrung aus der Welt"""
+        self.lifecycle.remove_food(food)
+        self.food_grid.discard(food)
+        self._eaten_food.discard(food)
+    
+    def query_food(self, x, y, radius):
+        """Gibt alle Nahrungsobjekte zurück, deren Mittelpunkt im Radius um (x, y) liegt"""
+        if self._food_grid_dirty:
+            self._sync_food_grid()
+        radius_sq = radius * radius
+        result = []
+        for food in self.food_grid.query(x, y, radius):
+            pos = food.body.position
+            dx = pos.x - x
+            dy = pos.y - y
+            if dx * dx + dy * dy <= radius_sq:
+                result.append(food)
+        return result
+    
+    def _sync_food_grid(self):
+        """Gleicht das Nahrungsgitter mit den Positionen aus der Physik ab"""
+        # Nahrung ist ein dynamischer Körper und kann weggeschoben werden
+        move = self.food_grid.move
+        for food in self.food:
+            pos = food.body.position
+            move(food, pos.x, pos.y)
+        self._food_grid_dirty = False
+    
+    def _sync_entity_grid(self):
+        """Gleicht das Entity-Gitter mit den aktuellen Positionen ab"""
+        insert = self.entity_grid.insert
+        for entity in self.entities:
+            pos = entity.body.position
+            insert(entity, pos.x, pos.y)
+    
+    def query_entities(self, x, y, radius, exclude=None):
+        """Gibt alle Entities zurück, deren Mittelpunkt im Radius um (x, y) liegt"""
+        radius_sq = radius * radius
+        result = []
+        for entity in self.entity_grid.query(x, y, radius):
+            if entity is exclude:
+                continue
+            pos = entity.body.position
+            dx = pos.x - x
+            dy = pos.y - y
+            if dx * dx + dy * dy <= radius_sq:
+                result.append(entity)
+        return result
+    
+    def count_nearby_entities(self, radius=None):
+        """Zählt für jede Entity (in der Reihenfolge von ``entities``) die Nachbarn
+        
+        Ohne ``radius`` gilt die Sensorreichweite der jeweiligen Entity. Alle
+        Paare werden in einem vektorisierten Durchlauf geprüft.
+        """
+        entities = self.entities
+        if not entities:
+            return np.zeros(0, dtype=np.int64)
+        positions = np.array([tuple(entity.body.position) for entity in entities])
+        if radius is None:
+            radius = np.array([entity.sensor_range for entity in entities])
+        return count_within_radius(positions, radius)
     
     def spawn_waste(self, x, y, size, quality):
         """Spawnt Abfall in der Umgebung"""
@@ -114,43 +354,200 @@ class Simulation:
         x = max(20, min(self.width - 20, x))
         y = max(20, min(self.height - 20, y))
         
-        waste = Waste(self.space, x, y, size, quality)
-        self.waste.append(waste)
+        self.waste.add(x, y, size, quality)
+    
+    def _evaluate_brains(self, entities):
+        """Wertet die Gehirne aller Entities in einem gebatchten Durchlauf aus"""
+        batch = self._brain_batch
+        if batch is None or len(batch) != len(entities):
+            batch = self._brain_batch = BrainBatch(entity.brain for entity in entities)
+        
+        # Eingaben aller Entities in eine (N×8)-Matrix sammeln
+        inputs = np.array([entity.brain_input_values() for entity in entities])
+        outputs = batch.forward(inputs)
+        
+        # Die ausgewählte Entity zusätzlich einzeln auswerten, damit die
+        # Visualisierung ihre Aktivierungen anzeigen kann
+        selected = self.selected_entity
+        if selected is not None:
+            for i, entity in enumerate(entities):
+                if entity is selected:
+                    selected.brain.forward(inputs[i:i + 1])
+                    break
+        return outputs
+    
+    def enable_profiling(self, window=300):
+        """Aktiviert die Zeitmessung der Phasen von ``update``"""
+        if self.profiler is None or self.profiler.window != window:
+            self.profiler = TickProfiler(window)
+        return self.profiler
+    
+    def disable_profiling(self):
+        """Deaktiviert die Zeitmessung (kein Overhead mehr in ``update``)"""
+        self.profiler = None
+    
+    def start_recording(self, path):
+        """Zeichnet ab jetzt jeden Tick in eine Replay-Datei auf (siehe ``ReplayRecorder``)"""
+        self.stop_recording()
+        self.recorder = ReplayRecorder(path, self)
+        return self.recorder
+    
+    def stop_recording(self):
+        """Beendet eine laufende Aufzeichnung und schließt die Datei"""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+    
+    def start_metrics(self, path, sample_interval=None, **kwargs):
+        """Schreibt ab jetzt Kennzahlen pro Generation (und alle ``sample_interval`` Ticks) nach ``path``"""
+        self.stop_metrics()
+        self.metrics = MetricsCollector.open(path, sample_interval=sample_interval, **kwargs)
+        return self.metrics
+    
+    def stop_metrics(self):
+        """Beendet den Kennzahlen-Export und schreibt gepufferte Datensätze"""
+        if self.metrics is not None:
+            self.metrics.close()
+            self.metrics = None
+    
+    def profile_stats(self):
+        """Gibt Mittelwert, p95 und Maximum (ms) pro Phase zurück, leer wenn deaktiviert"""
+        if self.profiler is None:
+            return {}
+        return self.profiler.stats()
+    
+    def advance(self, frame_time, speed=1.0) -> int:
+        """Schreitet um ``frame_time * speed`` Sekunden in festen Zeitschritten voran
+        
+        Die Zeit wird im ``accumulator`` gesammelt und in Ticks der Länge
+        ``fixed_timestep`` abgearbeitet, unabhängig von der Bildrate. Pro Aufruf
+        laufen höchstens ``max_steps_per_frame`` Ticks; darüber hinaus
+        aufgelaufene Zeit wird verworfen (``dropped_time``). Gibt die Anzahl der
+        ausgeführten Ticks zurück.
+        """
+        step = self.fixed_timestep
+        self.accumulator += frame_time * speed
+        # Kleine Toleranz, damit z.B. 4 × 0,25 Zeitschritte trotz Rundung einen Tick ergeben
+        steps = min(int(self.accumulator / step + 1e-9), self.max_steps_per_frame)
+        for _ in range(steps):
+            self.update(step)
+        self.accumulator = max(0.0, self.accumulator - steps * step)
+        if self.accumulator >= step:
+            # Rückstand nicht aufholen, nur den Rest unter einem Zeitschritt behalten
+            dropped = self.accumulator - self.accumulator % step
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+        return steps
     
     def update(self, dt):
-        """Aktualisiert die Simulation"""
-        # Aktualisiere die Physik-Engine
-        self.space.step(dt)
+        """Aktualisiert die Simulation um einen Tick der Länge ``dt``
         
-        # Aktualisiere alle Entities
-        for entity in self.entities[:]:  # Kopie der Liste für sichere Iteration
-            entity.update(dt)
-            
-            # Prüfe auf Nahrungsaufnahme
-            for food in self.food[:]:  # Kopie der Liste für sichere Iteration
-                if (entity.body.position - food.body.position).length < entity.radius + food.radius:
-                    if entity.eat_food(food):
-                        self.space.remove(food.body, food.shape)
-                        self.food.remove(food)
-            
-            # Prüfe auf Waste-Generierung
-            waste_list = entity.get_waste_to_create()
-            for waste_size, waste_quality in waste_list:
-                self.spawn_waste(entity.body.position.x, entity.body.position.y,
-                               waste_size, waste_quality)
-            
-            # Entferne tote Entities
-            if entity.health <= 0 or entity.energy <= 0:
-                self.space.remove(entity.body, entity.shape)
-                self.entities.remove(entity)
-                continue
+        Die Physik wird dabei in ``physics_substeps`` gleich lange Schritte
+        unterteilt.
+        """
+        profiler = self.profiler
+        if profiler:
+            profiler.begin()
+        metrics = self.metrics
+        if metrics is not None:
+            tick_start = time.perf_counter()
+        
+        # Aktualisiere die Physik-Engine (inkl. Nahrungsaufnahme per Kollisionshandler)
+        substeps = self.physics_substeps
+        if substeps > 1:
+            physics_dt = dt / substeps
+            for _ in range(substeps):
+                self.space.step(physics_dt)
+        else:
+            self.space.step(dt)
+        # Nahrung kann verschoben worden sein: Gitter erst bei der nächsten Abfrage abgleichen
+        self._food_grid_dirty = True
+        if profiler:
+            profiler.lap('physics')
+        
+        entities = self.entities[:]  # Kopie der Liste für sichere Iteration
+        store = self.entity_state
+        
+        # Alter erhöhen (vektorisiert)
+        store.advance_age(dt)
+        
+        # Neuronale Netzwerke auswerten
+        if self.batched_inference and entities:
+            brain_outputs = self._evaluate_brains(entities)
+            for i, entity in enumerate(entities):
+                entity.brain_output = brain_outputs[i:i + 1]
+        else:
+            for entity in entities:
+                entity._update_brain(dt)
+        if profiler:
+            profiler.lap('brains')
+        
+        # Bewegung anwenden und Eingaben für die Energie-Kernel sammeln
+        speed = store.speed
+        digesting = store.digesting
+        for entity in entities:
+            body = entity.body
+            old_position = body.position
+            entity._apply_movement(dt)
+            entity.distance_traveled += (body.position - old_position).length
+            speed[entity._row] = body.velocity.length
+            digesting[entity._row] = len(entity.digesting_food)
+        # Positionen stehen für diesen Tick fest: Entity-Gitter abgleichen
+        self._sync_entity_grid()
+        if profiler:
+            profiler.lap('movement')
         
-        # Aktualisiere Waste
-        for waste in self.waste[:]:
-            waste.update(dt)
-            if waste.is_depleted():
-                self.space.remove(waste.body, waste.shape)
-                self.waste.remove(waste)
+        # Energie, Hunger, Gesundheit und Cooldowns für die gesamte Population (vektorisiert)
+        store.update_energy(dt)
+        store.update_health(dt)
+        store.tick_cooldowns(dt)
+        if profiler:
+            profiler.lap('energy')
+        
+        # Verdauung
+        for entity in entities:
+            if entity.digesting_food:
+                entity._update_digestion(dt)
+        if profiler:
+            profiler.lap('digestion')
+        
+        # Hormone
+        for entity in entities:
+            entity._update_hormones(dt)
+        if profiler:
+            profiler.lap('hormones')
+        
+        # Prüfe auf Waste-Generierung
+        for entity in entities:
+            if entity.digesting_food:
+                entity_pos = entity.body.position
+                waste_list = entity.get_waste_to_create()
+                for waste_size, waste_quality in waste_list:
+                    self.spawn_waste(entity_pos.x, entity_pos.y,
+                                   waste_size, waste_quality)
+        if profiler:
+            profiler.lap('waste_spawn')
+        
+        # Entferne tote Entities (der Speicher enthält nur Mitglieder der Welt)
+        owners = store.owners
+        for entity in [owners[row] for row in store.dead_rows()]:
+            self.remove_entity(entity)
+        if profiler:
+            profiler.lap('deaths')
+        
+        # Aktualisiere Waste (vektorisiert altern und zerfallenen Abfall entfernen)
+        self.waste.update(dt)
+        if profiler:
+            profiler.lap('waste_decay')
+        
+        # Tick aufzeichnen
+        if self.recorder is not None:
+            self.recorder.record(self)
+        if profiler:
+            profiler.lap('recording')
+            profiler.end()
+        if metrics is not None:
+            metrics.tick(self, time.perf_counter() - tick_start)
     
     def handle_zoom(self, zoom_value, mouse_pos):
         """Verarbeitet Zoom-Ereignisse"""
@@ -173,78 +570,131 @@ class Simulation:
                 mouse_y - (mouse_y - self.camera_offset[1]) * zoom_factor
             )
 
+    def visible_world_rect(self, surface, margin=VIEW_CULL_MARGIN):
+        """Berechnet den sichtbaren Weltausschnitt als (x0, y0, x1, y1)
+        
+        Berücksichtigt ``zoom`` und ``camera_offset``; ``margin`` erweitert den
+        Ausschnitt in Weltkoordinaten.
+        """
+        zoom = self.zoom
+        x0 = -self.camera_offset[0] / zoom
+        y0 = -self.camera_offset[1] / zoom
+        return (x0 - margin, y0 - margin,
+                x0 + surface.get_width() / zoom + margin,
+                y0 + surface.get_height() / zoom + margin)
+    
     def draw(self, surface, debug_mode=False):
-        """Zeichnet die Simulation"""
-        # Temporäre Surface für die Simulation erstellen
-        temp_surface = pygame.Surface((self.width, self.height))
-        temp_surface.fill((240, 240, 245))  # Hintergrundfarbe
+        """Zeichnet die Simulation
+        
+        Es werden nur Objekte im sichtbaren Weltausschnitt gezeichnet, und zwar
+        direkt in Bildschirmkoordinaten auf ``surface``.
+        """
+        zoom = self.zoom
+        offset = (self.camera_offset[0], self.camera_offset[1])
+        
+        # Hintergrund der Welt (nur den sichtbaren Teil) füllen
+        world_rect = pygame.Rect(int(offset[0]), int(offset[1]),
+                                 int(self.width * zoom), int(self.height * zoom))
+        surface.fill(BACKGROUND_COLOR, world_rect.clip(surface.get_rect()))
+        
+        x0, y0, x1, y1 = self.visible_world_rect(surface)
+        
+        def visible(body):
+            pos = body.position
+            return x0 <= pos.x <= x1 and y0 <= pos.y <= y1
         
         # Entities zeichnen
         for entity in self.entities:
             # Debug-Informationen nur für die ausgewählte Entity anzeigen (Performance-Optimierung)
             is_selected = entity == self.selected_entity
-            entity.draw(temp_surface, debug_mode and is_selected)
+            if is_selected or visible(entity.body):
+                entity.draw(surface, debug_mode and is_selected, offset, zoom)
         
-        # Nahrung zeichnen
-        for food in self.food:
-            food.draw(temp_surface)
+        # Nahrung zeichnen (ein Blit-Batch aus dem Atlas)
+        self.food_atlas.draw(surface, [food for food in self.food if visible(food.body)], offset, zoom)
             
         # Abfall zeichnen
-        for waste in self.waste:
-            waste.draw(temp_surface)
+        self.waste.draw(surface, offset, zoom, (x0, y0, x1, y1))
             
         # Ausgewählte Entity hervorheben
         if self.selected_entity:
-            self.selected_entity.draw_highlight(temp_surface)
+            self.selected_entity.draw_highlight(surface, offset, zoom)
         
         # Bei aktivem Debug-Modus Info anzeigen
         if debug_mode:
             small_font = pygame.font.Font(None, 20)
             debug_text = small_font.render("Debug Mode", True, (255, 50, 50))
-            temp_surface.blit(debug_text, (10, 10))
+            surface.blit(debug_text, (offset[0] + 10 * zoom, offset[1] + 10 * zoom))
+    
+    def population_fitness(self, entities=None) -> np.ndarray:
+        """Berechnet die Fitness aller Entities vektorisiert (Reihenfolge wie ``entities``)"""
+        if entities is None:
+            entities = self.entities
+        rows = np.fromiter((entity._row for entity in entities), dtype=np.intp, count=len(entities))
+        food_eaten = np.fromiter((entity.food_eaten for entity in entities), dtype=float, count=len(entities))
+        children = np.fromiter((entity.children for entity in entities), dtype=float, count=len(entities))
+        return self.entity_state.fitness(food_eaten, children, rows)
+    
+    def _breed_genomes(self, parents, count):
+        """Erzeugt ``count`` mutierte Nachkommen-Genome aus den Eltern
+        
+        Arbeitet auf der (Population × Merkmale)-Genommatrix: Eltern werden
+        vektorisiert gezogen, die Mutation läuft maskenbasiert in einem
+        Durchlauf (Rate = effektive Mutationsrate des jeweiligen Elternteils).
+        """
+        rng = self.rng
+        genes = np.stack([parent.dna.genes for parent in parents])
+        hormones = np.stack([parent.dna.hormone_levels for parent in parents])
+        mutation_index = DNA.TRAIT_INDEX[('reproduction', 'mutation_rate')]
+        rates = np.array([parent.dna.effective_values()[mutation_index] for parent in parents])
+        
+        choice = rng.randint(0, len(parents), count)
+        child_genes = genes[choice]
+        child_hormones = hormones[choice]
+        child_rates = rates[choice][:, None]
         
-        # Skalierte und verschobene Version auf die Hauptsurface zeichnen
-        scaled_surface = pygame.transform.scale(temp_surface, 
-                                             (int(self.width * self.zoom), 
-                                              int(self.height * self.zoom)))
-        surface.blit(scaled_surface, 
-                    (self.camera_offset[0], self.camera_offset[1]))
+        for matrix in (child_genes, child_hormones):
+            mask = rng.random_sample(matrix.shape) < child_rates
+            mutated = np.clip(matrix + rng.uniform(-0.05, 0.05, matrix.shape), 0.0, 1.0)
+            np.copyto(matrix, mutated, where=mask)
+        return child_genes, child_hormones
     
     def next_generation(self) -> None:
         """Erstellt die nächste Generation von Kreaturen"""
-        # Sortiere Kreaturen nach Fitness
-        self.entities.sort(key=lambda x: x.fitness, reverse=True)
+        entities = self.entities
         
-        # Behalte die besten 20% für die nächste Generation
-        survivors_count = max(2, int(len(self.entities) * 0.2))
-        survivors = self.entities[:survivors_count]
+        # Behalte die besten 20% für die nächste Generation (Top-k per argpartition)
+        survivors_count = min(len(entities), max(2, int(len(entities) * 0.2)))
+        fitness = self.population_fitness(entities)
+        if self.metrics is not None:
+            self.metrics.generation(self, fitness)
+        if survivors_count < len(entities):
+            top = np.argpartition(-fitness, survivors_count - 1)[:survivors_count]
+        else:
+            top = np.arange(len(entities))
+        top = top[np.argsort(-fitness[top], kind='stable')]
+        survivors = [entities[i] for i in top]
+        survivor_set = set(survivors)
         
-        # Erstelle neue Generation
-        new_generation = []
+        # Erstelle neue Generation, beginnend mit den Überlebenden
+        new_generation = list(survivors)
         
-        # Füge Überlebende hinzu
-        new_generation.extend(survivors)
+        # Fülle den Rest mit Nachkommen auf (Genome zuerst, dann die Entities)
+        children_count = self.population_size - len(new_generation)
+        if children_count > 0 and survivors:
+            child_genes, child_hormones = self._breed_genomes(survivors, children_count)
+            positions = self.rng.uniform(0, 1, (children_count, 2)) * (self.width, self.height)
+            dnas = [DNA.from_genome(genes, hormones) for genes, hormones in zip(child_genes, child_hormones)]
+            new_generation.extend(self._create_entities(dnas, positions))
         
-        # Fülle den Rest mit Nachkommen auf
-        while len(new_generation) < self.population_size:
-            # Wähle zufällige Eltern aus den Überlebenden
-            parent = random.choice(survivors)
-            
-            # Erstelle Kind mit mutierter DNA
-            child_dna = parent.dna.copy()
-            mutation_rate = parent.dna['reproduction']['mutation_rate']  # Korrekte Kategorie
-            child_dna.mutate(mutation_rate)
-            
-            # Erstelle neue Kreatur mit der mutierten DNA
-            child = Entity(
-                self.space,
-                x=random.uniform(0, self.width),
-                y=random.uniform(0, self.height),
-                dna=child_dna,
-                simulation=self
-            )
-            new_generation.append(child)
+        # Nicht übernommene Entities aus dem räumlichen Index nehmen
+        for entity in entities:
+            if entity in survivor_set:
+                continue
+            self.entity_grid.discard(entity)
         
-        # Aktualisiere die Population
+        # Aktualisiere die Population (entfernt die Körper der übrigen Entities aus der Physik)
         self.entities = new_generation
+        self._sync_entity_grid()
+        self._brain_batch = None
         self.generation += 1 
\ No newline at end of file
@@ -0,0 +1,148 @@
+import math
+import numpy as np
+from typing import Dict, Hashable, Iterator, List, Tuple
+
+
+class SpatialHashGrid:
+    """Uniformes Gitter als räumlicher Index für Objekte in der Welt
+
+    Jedes Objekt liegt in genau einer Zelle. Einfügen, Entfernen und
+    Verschieben sind O(1), Abfragen durchsuchen nur die Zellen, die den
+    Suchkreis überdecken.
+    """
+
+    def __init__(self, cell_size: float = 50.0):
+        """Initialisiert ein leeres Gitter mit der angegebenen Zellgröße"""
+        if cell_size <= 0:
+            raise ValueError("cell_size muss größer als 0 sein")
+        self.cell_size = cell_size
+        # Zelle -> geordnete Menge der Objekte (dict als Insertion-Order-Set)
+        self.cells: Dict[Tuple[int, int], Dict[Hashable, None]] = {}
+        # Objekt -> Zelle, in der es aktuell liegt
+        self._item_cells: Dict[Hashable, Tuple[int, int]] = {}
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Berechnet die Zellkoordinaten einer Weltposition"""
+        return (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+
+    def insert(self, item: Hashable, x: float, y: float) -> None:
+        """Fügt ein Objekt an der angegebenen Position ein"""
+        if item in self._item_cells:
+            self.move(item, x, y)
+            return
+        cell = self._cell(x, y)
+        self.cells.setdefault(cell, {})[item] = None
+        self._item_cells[item] = cell
+
+    def remove(self, item: Hashable) -> None:
+        """Entfernt ein Objekt aus dem Gitter"""
+        cell = self._item_cells.pop(item)
+        bucket = self.cells[cell]
+        del bucket[item]
+        if not bucket:
+            del self.cells[cell]
+
+    def discard(self, item: Hashable) -> None:
+        """Entfernt ein Objekt, falls es im Gitter liegt"""
+        if item in self._item_cells:
+            self.remove(item)
+
+    def move(self, item: Hashable, x: float, y: float) -> None:
+        """Aktualisiert die Position eines Objekts (nur bei Zellwechsel teuer)"""
+        cell = self._cell(x, y)
+        old_cell = self._item_cells[item]
+        if cell == old_cell:
+            return
+        bucket = self.cells[old_cell]
+        del bucket[item]
+        if not bucket:
+            del self.cells[old_cell]
+        self.cells.setdefault(cell, {})[item] = None
+        self._item_cells[item] = cell
+
+    def query(self, x: float, y: float, radius: float) -> Iterator[Hashable]:
+        """Liefert alle Objekte aus den Zellen, die den Suchkreis überdecken
+
+        Das Ergebnis ist eine Kandidatenmenge; die exakte Abstandsprüfung
+        übernimmt der Aufrufer, da nur er die aktuellen Positionen kennt.
+        """
+        min_cx, min_cy = self._cell(x - radius, y - radius)
+        max_cx, max_cy = self._cell(x + radius, y + radius)
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def query_list(self, x: float, y: float, radius: float) -> List[Hashable]:
+        """Wie ``query``, aber als Liste (sicher gegen Änderungen während der Iteration)"""
+        return list(self.query(x, y, radius))
+
+    def clear(self) -> None:
+        """Entfernt alle Objekte"""
+        self.cells.clear()
+        self._item_cells.clear()
+
+    def __len__(self) -> int:
+        return len(self._item_cells)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._item_cells
+
+
+def count_within_radius(positions, radii, cell_size=None) -> np.ndarray:
+    """Zählt für jeden Punkt die anderen Punkte innerhalb seines Radius
+
+    ``positions`` ist ein (N×2)-Array, ``radii`` ein Radius pro Punkt (oder
+    ein Skalar). Die Punkte werden nach Gitterzelle sortiert; für jede
+    Nachbarzelle werden die Kandidaten per ``searchsorted`` bestimmt und alle
+    Abstände vektorisiert geprüft. Ohne ``cell_size`` wird der größte Radius
+    verwendet, sodass die 3×3-Nachbarschaft jeden Suchkreis abdeckt.
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+    n = len(positions)
+    radii = np.broadcast_to(np.asarray(radii, dtype=float), (n,))
+    counts = np.zeros(n, dtype=np.int64)
+    if n < 2:
+        return counts
+
+    max_radius = float(radii.max())
+    if cell_size is None:
+        cell_size = max_radius
+    if cell_size <= 0:
+        return counts
+    reach = int(math.ceil(max_radius / cell_size))
+
+    # Zellkoordinaten und ein eindeutiger Schlüssel pro Zelle (mit Rand für Nachbarn)
+    cells = np.floor(positions / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0) - reach
+    height = int(cells[:, 1].max()) + reach + 1
+    keys = cells[:, 0] * height + cells[:, 1]
+
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    sorted_positions = positions[order]
+    radii_sq = radii * radii
+
+    for dx in range(-reach, reach + 1):
+        for dy in range(-reach, reach + 1):
+            neighbor_keys = keys + dx * height + dy
+            start = np.searchsorted(sorted_keys, neighbor_keys, side='left')
+            stop = np.searchsorted(sorted_keys, neighbor_keys, side='right')
+            sizes = stop - start
+            total = int(sizes.sum())
+            if total == 0:
+                continue
+
+            # Kandidatenpaare (Anfragepunkt, Index in der sortierten Liste) aufzählen
+            queries = np.repeat(np.arange(n), sizes)
+            offsets = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+            candidates = np.repeat(start, sizes) + offsets
+
+            delta = sorted_positions[candidates] - positions[queries]
+            dist_sq = np.einsum('ij,ij->i', delta, delta)
+            hits = (dist_sq <= radii_sq[queries]) & (order[candidates] != queries)
+            counts += np.bincount(queries[hits], minlength=n)
+
+    return counts
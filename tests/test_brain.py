@@ -0,0 +1,54 @@
+import pytest
+import numpy as np
+from PyLife.brain import Brain, BrainBatch
+
+@pytest.fixture
+def brains():
+    """Erstellt einige zufällige Brains"""
+    return [Brain(input_size=8, hidden_size=16, output_size=2) for _ in range(5)]
+
+class TestBrainBatch:
+    def test_stacked_shapes(self, brains):
+        """Testet die Form der gestapelten Gewichte"""
+        batch = BrainBatch(brains)
+        assert len(batch) == 5
+        assert batch.weights_ih.shape == (5, 16, 8)
+        assert batch.weights_ho.shape == (5, 2, 16)
+        assert batch.bias_h.shape == (5, 16)
+        assert batch.bias_o.shape == (5, 2)
+
+    def test_matches_single_forward(self, brains):
+        """Testet, dass die gebatchte Auswertung der Einzelauswertung entspricht"""
+        inputs = np.random.uniform(-1, 1, (5, 8))
+        outputs = BrainBatch(brains).forward(inputs)
+        
+        assert outputs.shape == (5, 2)
+        for i, brain in enumerate(brains):
+            expected = brain.forward(inputs[i:i + 1])
+            assert np.allclose(outputs[i:i + 1], expected)
+
+    def test_empty_batch(self):
+        """Testet eine leere Population"""
+        batch = BrainBatch([])
+        assert len(batch) == 0
+        assert batch.forward(np.zeros((0, 8))).shape[0] == 0
+
+
+class TestBrainInference:
+    def test_infer_matches_forward(self, brains):
+        """Testet, dass ``infer`` wie ``forward`` rechnet, aber nichts für die Visualisierung speichert"""
+        brain = brains[0]
+        inputs = np.random.uniform(-1, 1, (1, 8))
+        output = brain.infer(inputs)
+        assert output.shape == (1, 2)
+        assert not hasattr(brain, 'neuron_values')
+        assert not hasattr(brain, 'layers')
+        assert np.allclose(output, brain.forward(inputs))
+        assert np.allclose(brain.output_values, np.tanh(output[0]))
+
+    def test_infer_reuses_buffers(self, brains):
+        """Testet, dass ``infer`` in vorallokierte Puffer schreibt"""
+        brain = brains[0]
+        first = brain.infer(np.zeros((1, 8)))
+        second = brain.infer(np.ones((1, 8)))
+        assert first is second
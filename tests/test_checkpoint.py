@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+from PyLife.simulation import Simulation
+from PyLife.checkpoint import save_checkpoint, load_checkpoint, STATE_COLUMNS
+
+
+@pytest.fixture
+def simulation():
+    """Erstellt eine laufende Simulation mit Entities, Nahrung, Verdauung und Abfall"""
+    sim = Simulation(800, 600)
+    sim.generation = 7
+    sim.spawn_entities(12)
+    for _ in range(15):
+        sim.spawn_food()
+    for _ in range(5):
+        sim.update(1 / 60)
+    food = sim.spawn_food(400, 300, size=0.2, quality=0.9)
+    sim.entities[0].eat_food(food)
+    sim.spawn_waste(100, 100, 0.5, 0.3)
+    sim.spawn_waste(200, 150, 0.8, 0.1)
+    return sim
+
+
+def positions(objects):
+    """Positionen als (N×2)-Array"""
+    return np.array([tuple(obj.body.position) for obj in objects])
+
+
+class TestCheckpoint:
+    def test_round_trip(self, simulation, tmp_path):
+        """Testet, dass ein geladener Checkpoint denselben Weltzustand enthält"""
+        path = tmp_path / "welt.npz"
+        save_checkpoint(simulation, path)
+        loaded = load_checkpoint(path)
+
+        assert loaded.generation == 7
+        assert (loaded.width, loaded.height) == (800, 600)
+        assert len(loaded.entities) == len(simulation.entities)
+        assert np.allclose(positions(loaded.entities), positions(simulation.entities))
+        for original, restored in zip(simulation.entities, loaded.entities):
+            assert np.array_equal(restored.dna.genes, original.dna.genes)
+            assert np.array_equal(restored.dna.hormone_levels, original.dna.hormone_levels)
+            assert np.array_equal(restored.brain.weights_ho, original.brain.weights_ho)
+            assert restored.body.angle == original.body.angle
+            assert tuple(restored.body.velocity) == tuple(original.body.velocity)
+            assert restored.sensor_range == original.sensor_range
+            assert restored.digesting_food == original.digesting_food
+            for name in STATE_COLUMNS:
+                assert getattr(restored, name) == getattr(original, name)
+        assert loaded.entities[0].digesting_food[-1]['food']['quality'] == 0.9
+
+        assert len(loaded.food) == len(simulation.food)
+        assert np.allclose(positions(loaded.food), positions(simulation.food))
+        assert [f.quality for f in loaded.food] == [f.quality for f in simulation.food]
+
+        assert len(loaded.waste) == 2
+        assert np.array_equal(loaded.waste.x[:2], simulation.waste.x[:2])
+        assert np.array_equal(loaded.waste.shade[:2], simulation.waste.shade[:2])
+
+        # Neue Physik mit genau den geladenen Körpern, Zufallsgenerator fortgesetzt
+        assert loaded.space is not simulation.space
+        assert loaded.lifecycle.is_consistent()
+        assert loaded.rng.uniform() == simulation.rng.uniform()
+        loaded.update(1 / 60)
+
+    def test_overwrite_and_version(self, simulation, tmp_path):
+        """Testet das Überschreiben eines Checkpoints und die Versionsprüfung"""
+        path = tmp_path / "welt.npz"
+        save_checkpoint(simulation, path)
+        simulation.generation += 1
+        save_checkpoint(simulation, path)
+        assert load_checkpoint(path).generation == 8
+        assert [p.name for p in tmp_path.iterdir()] == ["welt.npz"]
+
+        with np.load(path) as archive:
+            data = dict(archive.items())
+        data['version'] = np.array(99)
+        np.savez(tmp_path / "alt.npz", **data)
+        with pytest.raises(ValueError):
+            load_checkpoint(tmp_path / "alt.npz")
+
+    def test_headless_resume(self, tmp_path):
+        """Testet Sichern und Fortsetzen über den Headless-Runner"""
+        from PyLife.headless import main
+        path = tmp_path / "lauf.npz"
+        main(["--ticks", "20", "--ticks-per-generation", "10", "--population", "3",
+              "--food", "5", "--checkpoint", str(path)])
+        assert path.exists()
+
+        report = main(["--ticks", "5", "--resume", str(path)])
+        assert report.ticks == 5
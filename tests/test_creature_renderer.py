@@ -0,0 +1,128 @@
+import pytest
+import pygame
+from PyLife.creature_dna import DNA
+from PyLife.creature_renderer import CreatureRenderer
+
+@pytest.fixture
+def renderer():
+    """Erstellt einen Renderer mit kleinem Cache"""
+    return CreatureRenderer(cache_size=2)
+
+@pytest.fixture
+def dna_dict():
+    """Erstellt effektive DNA-Werte"""
+    return DNA().to_dict()
+
+class TestTextureCache:
+    def test_hit_and_miss(self, renderer, dna_dict):
+        """Testet, dass gleiche Schlüssel aus dem Cache bedient werden"""
+        first = renderer.get_texture(dna_dict, 1.0)
+        second = renderer.get_texture(dna_dict, 0.98)  # gleiche Stufe
+        
+        assert isinstance(first, pygame.Surface)
+        assert second is first
+        stats = renderer.cache_stats()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+
+    def test_state_buckets(self, renderer, dna_dict):
+        """Testet, dass sichtbare Zustandsänderungen (Energie) neu gerendert werden"""
+        full = renderer.get_texture(dna_dict, 1.0)
+        tired = renderer.get_texture(dna_dict, 0.2)
+        assert tired is not full
+        assert renderer.cache_stats()['misses'] == 2
+        
+        # Die Gesundheit ist nicht Teil des Schlüssels
+        fingerprint = CreatureRenderer.dna_fingerprint(dna_dict)
+        assert renderer.texture_key(fingerprint, 0.2) == (fingerprint, renderer._bucket(0.2))
+
+    def test_lru_eviction(self, renderer):
+        """Testet die Verdrängung des am längsten nicht benutzten Eintrags"""
+        dnas = [DNA().to_dict() for _ in range(3)]
+        for i, dna in enumerate(dnas):
+            dna['physical']['size'] = 0.2 + 0.3 * i  # sichtbar verschieden
+        first = renderer.get_texture(dnas[0])
+        renderer.get_texture(dnas[1])
+        renderer.get_texture(dnas[0])  # dnas[0] wieder zuletzt benutzt
+        renderer.get_texture(dnas[2])  # verdrängt dnas[1]
+        
+        stats = renderer.cache_stats()
+        assert stats['size'] == 2
+        assert stats['evictions'] == 1
+        assert renderer.get_texture(dnas[0]) is first
+        
+        renderer.clear_cache()
+        assert renderer.cache_stats()['size'] == 0
+
+    def test_miss_renders_bucket_values(self, dna_dict):
+        """Testet, dass die Textur einer Stufe nicht von der zuerst gerenderten Kreatur abhängt"""
+        small = {category: dict(traits) for category, traits in dna_dict.items()}
+        large = {category: dict(traits) for category, traits in dna_dict.items()}
+        small['physical']['size'] = 0.49
+        large['physical']['size'] = 0.51  # gleiche Quantisierungsstufe wie 0.49
+        
+        first = CreatureRenderer().get_texture(small, 0.9)
+        second = CreatureRenderer().get_texture(large, 1.0)
+        assert first.get_size() == second.get_size()
+        assert pygame.image.tostring(first, 'RGBA') == pygame.image.tostring(second, 'RGBA')
+
+    def test_fingerprint(self, dna_dict):
+        """Testet, dass der Fingerabdruck nur von sichtbaren DNA-Werten abhängt"""
+        copy = {category: dict(traits) for category, traits in dna_dict.items()}
+        assert CreatureRenderer.dna_fingerprint(copy) == CreatureRenderer.dna_fingerprint(dna_dict)
+        
+        # Nicht sichtbare Merkmale ändern den Schlüssel nicht
+        copy['offense']['aggression'] += 0.5
+        assert CreatureRenderer.dna_fingerprint(copy) == CreatureRenderer.dna_fingerprint(dna_dict)
+        
+        copy['physical']['size'] += 0.5
+        assert CreatureRenderer.dna_fingerprint(copy) != CreatureRenderer.dna_fingerprint(dna_dict)
+
+class TestRotationCache:
+    def test_rotation_buckets(self, dna_dict):
+        """Testet, dass nahe Winkel dieselbe vorgedrehte Textur liefern"""
+        renderer = CreatureRenderer(rotation_buckets=8)
+        a = renderer.get_rotated(dna_dict, 0.0)
+        b = renderer.get_rotated(dna_dict, 0.1)
+        c = renderer.get_rotated(dna_dict, 3.14159)
+        
+        assert a is b
+        assert c is not a
+        assert renderer.rotation_bucket(2 * 3.14159265) == 0
+        stats = renderer.cache_stats()
+        assert stats['rotations'] == 2
+        assert stats['rotation_hits'] == 1
+        assert stats['rotation_misses'] == 2
+
+    def test_rotations_evicted_with_texture(self):
+        """Testet, dass gedrehte Varianten mit ihrer Basistextur verdrängt werden"""
+        renderer = CreatureRenderer(cache_size=1, rotation_buckets=8)
+        first, second = DNA().to_dict(), DNA().to_dict()
+        first['physical']['size'], second['physical']['size'] = 0.5, 1.0
+        renderer.get_rotated(first, 0.0)
+        renderer.get_rotated(first, 1.0)
+        renderer.get_rotated(second, 0.0)
+        
+        stats = renderer.cache_stats()
+        assert stats['size'] == 1
+        assert stats['rotations'] == 1
+
+    def test_rotation_byte_budget(self, dna_dict):
+        """Testet, dass einzelne gedrehte Varianten nach Speicherbudget (LRU) verdrängt werden"""
+        renderer = CreatureRenderer(rotation_buckets=8)
+        first = renderer.get_rotated(dna_dict, 0.0)
+        size = first.get_pitch() * first.get_height()
+        renderer.rotation_bytes = 2 * size
+        
+        renderer.get_rotated(dna_dict, 3.14159)  # gleiche Größe wie bei 0°
+        renderer.get_rotated(dna_dict, 0.0)      # 0° wieder zuletzt benutzt
+        renderer.get_rotated(dna_dict, 3.14159 / 2)
+        
+        stats = renderer.cache_stats()
+        assert stats['size'] == 1  # Basistextur bleibt erhalten
+        assert stats['rotation_evictions'] >= 1
+        assert stats['rotation_bytes'] <= renderer.rotation_bytes
+        assert renderer.get_rotated(dna_dict, 0.0) is first
+        
+        renderer.clear_cache()
+        assert renderer.cache_stats()['rotation_bytes'] == 0
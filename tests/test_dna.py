@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+from PyLife.creature_dna import DNA
+
+
+@pytest.fixture
+def dna():
+    """Erstellt eine DNA mit festen Basiswerten und Hormonen"""
+    dna = DNA({
+        category: {trait: 0.5 for trait in traits}
+        for category, traits in DNA.DEFAULT_VALUES.items()
+    })
+    dna.hormones = {hormone: 0.0 for hormone in DNA.HORMONES}
+    return dna
+
+
+class TestGenome:
+    def test_layout(self):
+        """Testet Merkmalsindex und kompilierte Hormonmatrix"""
+        assert len(DNA.TRAITS) == sum(len(traits) for traits in DNA.DEFAULT_VALUES.values())
+        assert DNA.HORMONE_MATRIX.shape == (len(DNA.HORMONES), len(DNA.TRAITS))
+
+        testosterone = DNA.HORMONE_INDEX['testosterone']
+        aggression = DNA.TRAIT_INDEX[('offense', 'aggression')]
+        assert DNA.HORMONE_MATRIX[testosterone, aggression] == 0.5
+
+    def test_effective_traits(self, dna):
+        """Testet Hormonwirkung und Begrenzung der effektiven Werte"""
+        assert dna['offense']['aggression'] == 0.5
+
+        dna.hormones['testosterone'] = 1.0
+        dna.hormones['oxytocin'] = 0.5
+        assert dna['offense']['aggression'] == pytest.approx(0.5 + 0.5 - 0.2)
+        assert dna.get_effective_trait('offense', 'aggression') == pytest.approx(0.8)
+
+        dna.hormones['growth'] = 1.0
+        assert dna['physical']['size'] == 0.9
+        dna.values['physical']['size'] = 0.9
+        assert dna['physical']['size'] == 1.0  # Auf 1 begrenzt
+
+    def test_compatibility_views(self, dna):
+        """Testet die Dict-Sichten auf Basiswerte und Hormone"""
+        assert 'physical' in dna.values
+        assert dict(dna.values['physical']) == {'size': 0.5, 'health': 0.5}
+        assert dict(dna['feeding']) == dna.to_dict()['feeding']
+        with pytest.raises(KeyError):
+            dna['unknown']
+        with pytest.raises(KeyError):
+            dna.values['physical']['unknown'] = 1.0
+
+    def test_copy_is_independent(self, dna):
+        """Testet, dass Kopie und Mutation das Original nicht verändern"""
+        child = dna.copy()
+        assert child.to_dict() == dna.to_dict()
+
+        child.mutate(1.0)
+        assert not np.array_equal(child.genes, dna.genes)
+        assert dna.values['physical']['size'] == 0.5
@@ -235,6 +235,24 @@ class TestEntity:
         entity._update_hormones(1.0)
         assert entity.digestion_efficiency > initial_digestion
 
+    def test_texture_reused_between_frames(self, entity):
+        """Testet, dass die Textur nur bei geändertem Schlüssel neu geholt wird"""
+        surface = pygame.Surface((200, 200))
+        entity.draw(surface)
+        texture = entity.texture
+        entity.draw(surface)
+        assert entity.texture is texture
+        
+        # Die Gesundheit verändert das Aussehen nicht, die Textur bleibt
+        entity.health = entity.max_health * 0.1
+        entity.draw(surface)
+        assert entity.texture is texture
+        
+        # Sichtbare Änderung der Energie erzeugt eine neue Textur
+        entity.energy = entity.max_energy * 0.1
+        entity.draw(surface)
+        assert entity.texture is not texture
+
     def test_draw_highlight(self, entity):
         """Testet die Hervorhebungsfunktion"""
         # Erstelle eine Test-Surface
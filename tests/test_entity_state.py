@@ -0,0 +1,85 @@
+import pytest
+import numpy as np
+from PyLife.entity_state import EntityStateStore, StoreColumn
+
+class Owner:
+    """Minimale Entity mit zwei Spalten"""
+    energy = StoreColumn()
+    health = StoreColumn()
+    
+    def __init__(self, store):
+        self._store = store
+        self._row = store.allocate(self)
+
+@pytest.fixture
+def store():
+    """Erstellt einen kleinen Speicher"""
+    return EntityStateStore(capacity=2)
+
+class TestEntityStateStore:
+    def test_allocate_and_grow(self, store):
+        """Testet das Anlegen von Zeilen über die Kapazität hinaus"""
+        owners = [Owner(store) for _ in range(5)]
+        assert len(store) == 5
+        assert store.capacity >= 5
+        assert [o._row for o in owners] == [0, 1, 2, 3, 4]
+        
+        owners[3].energy = 42
+        assert store.energy[3] == 42
+
+    def test_release_swaps_last_row(self, store):
+        """Testet das Swap-Remove beim Freigeben"""
+        a, b, c = Owner(store), Owner(store), Owner(store)
+        a.energy, b.energy, c.energy = 1, 2, 3
+        
+        store.release(a)
+        assert len(store) == 2
+        assert c._row == 0
+        assert c.energy == 3
+        assert b.energy == 2
+        
+        # Die freigegebene Entity behält ihre Werte in einem eigenen Speicher
+        assert a.energy == 1
+        assert a._store is not store
+        
+        # Doppeltes Freigeben ist wirkungslos
+        store.release(a)
+        assert len(store) == 2
+
+    def test_energy_kernel(self, store):
+        """Testet den vektorisierten Energie- und Hungerkernel"""
+        owners = [Owner(store) for _ in range(3)]
+        n = len(owners)
+        store.energy[:n] = 100
+        store.hunger[:n] = [0, 50, 100]
+        store.max_hunger[:n] = 100
+        store.base_speed[:n] = 100
+        store.size_factor[:n] = 1
+        store.speed[:n] = 0
+        
+        store.update_energy(1.0)
+        
+        # Mit mehr Hunger wird mehr Energie verbraucht
+        loss = 100 - store.energy[:n]
+        assert np.all(loss > 0)
+        assert loss[0] < loss[1] < loss[2]
+        assert np.all(store.hunger[:n] <= 100)
+
+    def test_health_kernel(self, store):
+        """Testet, dass nur Entities ohne Energie Gesundheit verlieren"""
+        a, b = Owner(store), Owner(store)
+        a.energy, b.energy = 0, 10
+        a.health, b.health = 0.2, 50
+        
+        store.update_health(1.0)
+        assert a.health == 0
+        assert b.health == 50
+        assert list(store.dead_rows()) == [0]
+
+    def test_kernel_on_single_row(self, store):
+        """Testet einen Kernel auf einer einzelnen Zeile"""
+        a, b = Owner(store), Owner(store)
+        store.reproduction_cooldown[:2] = 5
+        store.tick_cooldowns(1.0, slice(b._row, b._row + 1))
+        assert store.reproduction_cooldown[a._row] == 5
+        assert store.reproduction_cooldown[b._row] == 4
@@ -2,7 +2,7 @@ import pytest
 import numpy as np
 import pymunk
 import pygame
-from PyLife.world_food import Food
+from PyLife.world_food import Food, FoodAtlas
 
 @pytest.fixture
 def space():
@@ -92,4 +92,25 @@ class TestFood:
         food.draw(surface)
         
         # Überprüfe, ob die Surface nicht leer ist
-        assert not surface.get_rect().collidepoint(100, 100) 
\ No newline at end of file
+        assert not surface.get_rect().collidepoint(100, 100) 
+
+class TestFoodAtlas:
+    def test_sprites_are_shared(self, space):
+        """Testet, dass gleiche Größen-/Qualitätsstufen ein Sprite teilen"""
+        atlas = FoodAtlas()
+        foods = [Food(space, 20 + 10 * i, 50, size=0.5, quality=0.9) for i in range(10)]
+        foods.append(Food(space, 150, 50, size=1.0, quality=0.2))
+
+        surface = pygame.Surface((200, 100))
+        surface.fill((0, 0, 0))
+        atlas.draw(surface, foods)
+        assert len(atlas) == 2
+        assert atlas.renders == 2
+        assert surface.get_at((150, 50)) != (0, 0, 0)
+
+        # Zweiter Frame rendert nichts neu, Zoomwechsel verwirft den Atlas
+        atlas.draw(surface, foods)
+        assert atlas.renders == 2
+        atlas.draw(surface, foods, zoom=0.5)
+        assert atlas.renders == 4
+        assert atlas.sprite(1.0, 0.2, 0.5).get_width() == 2 * (int(np.ceil(7.5)) + 1)
@@ -0,0 +1,50 @@
+import pytest
+from PyLife.headless import HeadlessRunner, run_headless
+
+@pytest.fixture
+def runner():
+    """Erstellt einen kleinen Headless-Runner"""
+    return HeadlessRunner(width=400, height=300, population=4, food=10,
+                          ticks_per_generation=5)
+
+class TestHeadless:
+    def test_run_ticks(self, runner):
+        """Testet einen Lauf über eine feste Anzahl Ticks"""
+        report = runner.run(ticks=12)
+        assert report.ticks == 12
+        assert report.generations == 2
+        assert len(report.generation_times) == 2
+        assert report.ticks_per_second > 0
+
+    def test_run_generations(self, runner):
+        """Testet einen Lauf über eine feste Anzahl Generationen"""
+        report = runner.run(generations=2)
+        assert report.generations == 2
+        assert report.ticks == 10
+        assert runner.simulation.generation == 3
+        assert len(runner.simulation.entities) == 4
+
+    def test_extinction_reseeds_population(self, runner):
+        """Testet, dass eine ausgestorbene Population neu besiedelt wird"""
+        runner.simulation.entities.clear()
+        runner.run(generations=1)
+        assert len(runner.simulation.entities) > 0
+
+    def test_run_for_budget(self, runner):
+        """Testet Ticks nach Zeitbudget samt Generationswechsel"""
+        assert runner.run_for(0.0) == 1
+        ticks = runner.run_for(0.05)
+        assert ticks >= 1
+        assert runner.simulation.generation == 1 + (ticks + 1) // 5
+
+    def test_requires_single_limit(self, runner):
+        """Testet, dass genau eine Abbruchbedingung angegeben werden muss"""
+        with pytest.raises(ValueError):
+            runner.run()
+        with pytest.raises(ValueError):
+            runner.run(ticks=1, generations=1)
+
+    def test_run_headless(self):
+        """Testet den Python-Einstiegspunkt"""
+        report = run_headless(ticks=3, width=300, height=300, population=2, food=2)
+        assert report.ticks == 3
@@ -0,0 +1,84 @@
+import pytest
+from PyLife.simulation import Simulation
+
+
+@pytest.fixture
+def simulation():
+    """Erstellt eine kleine Simulation mit Entities und Nahrung"""
+    simulation = Simulation(400, 300)
+    simulation.population_size = 10
+    for _ in range(10):
+        simulation.spawn_entity()
+    for _ in range(5):
+        simulation.spawn_food()
+    return simulation
+
+
+class TestWorldLifecycle:
+    def test_counts(self, simulation):
+        """Testet die Zählung der Objekte und Körper"""
+        counts = simulation.lifecycle.counts()
+        assert counts['entities'] == 10
+        assert counts['food'] == 5
+        assert counts['static'] == 4  # Wände
+        assert counts['bodies'] == 19
+        assert simulation.lifecycle.is_consistent()
+
+    def test_removal_detaches_bodies(self, simulation):
+        """Testet, dass entfernte Objekte die Physik verlassen"""
+        entity = simulation.entities[0]
+        food = simulation.food[0]
+        simulation.remove_entity(entity)
+        simulation.remove_food(food)
+        simulation.spawn_waste(100, 100, 1.0, 0.5)
+
+        assert entity.body not in simulation.space.bodies
+        assert food.body not in simulation.space.bodies
+        assert simulation.lifecycle.is_consistent()
+
+    def test_no_leak_across_generations(self, simulation):
+        """Testet, dass Generationswechsel keine Körper im Space zurücklassen"""
+        bodies = len(simulation.space.bodies)
+        for _ in range(5):
+            simulation.update(1 / 60)
+            simulation.next_generation()
+            assert simulation.lifecycle.is_consistent()
+
+        # Gleiche Population, Nahrung wird höchstens weniger
+        counts = simulation.lifecycle.counts()
+        assert counts['bodies'] == simulation.lifecycle.expected_bodies()
+        assert counts['entities'] == 10
+        assert counts['bodies'] <= bodies
+
+
+class TestObjectPools:
+    def test_food_is_reused(self, simulation):
+        """Testet, dass entfernte Nahrung wiederverwendet und neu aufgesetzt wird"""
+        lifecycle = simulation.lifecycle
+        food = simulation.food[0]
+        simulation.remove_food(food)
+        assert len(lifecycle.food_pool) == 1
+
+        simulation.spawn_food(50, 60)
+        reused = simulation.food[-1]
+        assert reused is food
+        assert tuple(reused.body.position) == (50, 60)
+        assert reused.shape.radius == reused.radius
+        assert reused in simulation.food_grid
+        assert lifecycle.is_consistent()
+
+        stats = lifecycle.pool_stats()['food']
+        assert stats['allocations'] == 5
+        assert stats['hits'] == 1
+        assert stats['hit_rate'] == pytest.approx(1 / 6)
+
+    def test_swap_remove(self, simulation):
+        """Testet das Entfernen in O(1) mit Nachrücken des letzten Elements"""
+        first, second, third, fourth, last = simulation.food
+        simulation.remove_food(second)
+        assert simulation.food == [first, last, third, fourth]
+
+        simulation.remove_food(last)
+        assert simulation.food == [first, fourth, third]
+        with pytest.raises(ValueError):
+            simulation.remove_food(last)
@@ -0,0 +1,100 @@
+import csv
+import io
+import json
+import pytest
+import numpy as np
+from PyLife.simulation import Simulation
+from PyLife.headless import HeadlessRunner
+from PyLife.metrics import jsonl_sink, csv_sink, TRAIT_NAMES
+
+
+@pytest.fixture
+def simulation():
+    """Erstellt eine kleine Simulation mit Entities und Nahrung"""
+    sim = Simulation(400, 300)
+    sim.spawn_entities(6)
+    for _ in range(8):
+        sim.spawn_food()
+    return sim
+
+
+class TestSinks:
+    def test_jsonl_sink_buffers(self):
+        """Testet, dass die Senke erst blockweise und beim Schließen schreibt"""
+        file = io.StringIO()
+        sink = jsonl_sink(file, buffer_size=3)
+        next(sink)
+        sink.send({'a': 1})
+        sink.send({'a': 2})
+        assert file.getvalue() == ""
+        sink.send({'a': 3})
+        assert len(file.getvalue().splitlines()) == 3
+        sink.send({'a': 4})
+        sink.close()
+        assert [json.loads(line)['a'] for line in file.getvalue().splitlines()] == [1, 2, 3, 4]
+
+    def test_csv_sink_header(self):
+        """Testet die Kopfzeile und die Zeilen der CSV-Senke"""
+        file = io.StringIO()
+        sink = csv_sink(file)
+        next(sink)
+        sink.send({'a': 1, 'b': 2.5})
+        sink.send({'a': 3, 'b': 4.5})
+        sink.close()
+        assert list(csv.DictReader(io.StringIO(file.getvalue()))) == [
+            {'a': '1', 'b': '2.5'}, {'a': '3', 'b': '4.5'}
+        ]
+
+
+class TestMetrics:
+    def test_generation_and_sample_records(self, simulation, tmp_path):
+        """Testet Generations- und Stichproben-Datensätze aus der Simulation"""
+        path = tmp_path / "verlauf.jsonl"
+        simulation.start_metrics(path, sample_interval=4)
+        for _ in range(10):
+            simulation.update(1 / 60)
+        fitness = simulation.population_fitness()
+        genes = np.array([entity.dna.genes for entity in simulation.entities])
+        population = len(simulation.entities)
+        simulation.next_generation()
+        simulation.stop_metrics()
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record['kind'] for record in records] == ['sample', 'sample', 'generation']
+        assert [record['tick'] for record in records] == [4, 8, 10]
+
+        record = records[-1]
+        assert record['generation'] == 1
+        assert record['population'] == population
+        assert record['ticks'] == 10
+        assert record['tick_ms_mean'] > 0
+        assert record['tick_ms_max'] >= record['tick_ms_mean']
+        assert record['fitness_mean'] == pytest.approx(fitness.mean())
+        assert record['fitness_max'] == pytest.approx(fitness.max())
+        assert record['food'] == len(simulation.food)
+        name = TRAIT_NAMES[0]
+        assert record[f'{name}.mean'] == pytest.approx(genes[:, 0].mean())
+        assert record[f'{name}.var'] == pytest.approx(genes[:, 0].var())
+
+    def test_extinction_record_is_valid_json(self, tmp_path):
+        """Testet, dass ein Datensatz ohne Population gültiges JSON mit null-Werten ist"""
+        path = tmp_path / "verlauf.jsonl"
+        runner = HeadlessRunner(width=400, height=300, population=4, food=10,
+                                ticks_per_generation=5, metrics=path)
+        runner.simulation.entities = []
+        runner.run(generations=1)
+        line = path.read_text().splitlines()[0]
+        record = json.loads(line, parse_constant=lambda name: pytest.fail(f"{name} in JSON"))
+        assert record['population'] == 0
+        assert record['fitness_mean'] is None
+        assert record[f'{TRAIT_NAMES[0]}.var'] is None
+
+    def test_headless_csv(self, tmp_path):
+        """Testet den Export über den Headless-Runner als CSV"""
+        path = tmp_path / "verlauf.csv"
+        runner = HeadlessRunner(width=400, height=300, population=4, food=10,
+                                ticks_per_generation=5, metrics=path)
+        runner.run(generations=3)
+        rows = list(csv.DictReader(path.open()))
+        assert [int(row['generation']) for row in rows] == [1, 2, 3]
+        assert runner.simulation.metrics is None
@@ -0,0 +1,56 @@
+import pytest
+import numpy as np
+from PyLife.neural_network import NeuralNetwork, LAYER_SIZES
+
+@pytest.fixture
+def network():
+    """Erstellt ein Netz mit NumPy-Backend"""
+    return NeuralNetwork(backend='numpy')
+
+class TestNeuralNetwork:
+    def test_default_backend(self):
+        """Testet, dass standardmäßig kein TensorFlow-Modell erstellt wird"""
+        network = NeuralNetwork()
+        assert network.backend == 'numpy'
+        assert network.model is None
+
+    def test_weight_layout(self, network):
+        """Testet das Keras-kompatible Gewichtslayout"""
+        shapes = [w.shape for w in network.get_weights()]
+        assert shapes == [(LAYER_SIZES[0], LAYER_SIZES[1]), (LAYER_SIZES[1],),
+                          (LAYER_SIZES[1], LAYER_SIZES[2]), (LAYER_SIZES[2],)]
+
+    def test_predict(self, network):
+        """Testet die Vorhersage (ReLU-Hidden-Layer, tanh-Ausgabe)"""
+        inputs = np.random.uniform(-1, 1, 8)
+        output = network.predict(inputs)
+        assert output.shape == (4,)
+        assert np.all(np.abs(output) <= 1)
+        
+        kernel_h, bias_h, kernel_o, bias_o = network.get_weights()
+        expected = np.tanh(np.maximum(0, inputs @ kernel_h + bias_h) @ kernel_o + bias_o)
+        assert np.allclose(output, expected)
+
+    def test_mutate(self, network):
+        """Testet, dass Mutation die Gewichte verändert"""
+        before = network.get_weights()
+        network.mutate(mutation_rate=1.0)
+        after = network.get_weights()
+        assert any(not np.array_equal(b, a) for b, a in zip(before, after))
+        
+        # Ohne Mutationsrate bleibt alles gleich
+        network.mutate(mutation_rate=0.0)
+        assert all(np.array_equal(a, c) for a, c in zip(after, network.get_weights()))
+
+    def test_crossover(self, network):
+        """Testet, dass das Kind nur Gewichte der Eltern enthält"""
+        other = NeuralNetwork(backend='numpy')
+        child = network.crossover(other)
+        assert child.backend == 'numpy'
+        for w1, w2, wc in zip(network.get_weights(), other.get_weights(), child.get_weights()):
+            assert np.all((wc == w1) | (wc == w2))
+
+    def test_unknown_backend(self):
+        """Testet die Validierung des Backends"""
+        with pytest.raises(ValueError):
+            NeuralNetwork(backend='torch')
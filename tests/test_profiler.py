@@ -0,0 +1,61 @@
+import pytest
+from PyLife.profiler import TickProfiler
+from PyLife.simulation import Simulation
+
+
+@pytest.fixture
+def profiler():
+    """Erstellt einen Profiler mit kleinem Fenster"""
+    return TickProfiler(window=3)
+
+
+class TestTickProfiler:
+    def test_empty(self, profiler):
+        """Testet, dass ohne Messung keine Statistik vorliegt"""
+        assert profiler.ticks == 0
+        assert profiler.stats() == {}
+
+    def test_laps_and_window(self, profiler):
+        """Testet Rundenzeiten und das rollende Fenster"""
+        for _ in range(5):
+            profiler.begin()
+            profiler.lap('physics')
+            profiler.lap('brains')
+            profiler.end()
+
+        assert profiler.ticks == 3
+        stats = profiler.stats()
+        assert list(stats) == list(TickProfiler.PHASES) + ['total']
+        for values in stats.values():
+            assert 0 <= values['mean'] <= values['p95'] <= values['max']
+        assert stats['hormones']['max'] == 0.0
+
+        profiler.reset()
+        assert profiler.ticks == 0
+
+
+class TestSimulationProfiling:
+    def test_disabled_by_default(self):
+        """Testet, dass die Messung standardmäßig aus ist"""
+        sim = Simulation(400, 300)
+        sim.update(1 / 60)
+        assert sim.profiler is None
+        assert sim.profile_stats() == {}
+
+    def test_update_phases(self):
+        """Testet, dass update alle Phasen misst"""
+        sim = Simulation(400, 300)
+        for _ in range(3):
+            sim.spawn_entity()
+            sim.spawn_food()
+        sim.enable_profiling(window=10)
+        for _ in range(4):
+            sim.update(1 / 60)
+
+        assert sim.profiler.ticks == 4
+        stats = sim.profile_stats()
+        assert stats['total']['mean'] > 0
+        assert stats['brains']['mean'] > 0
+
+        sim.disable_profiling()
+        assert sim.profile_stats() == {}
@@ -0,0 +1,124 @@
+import pytest
+import numpy as np
+import pygame
+from PyLife.simulation import Simulation
+from PyLife.replay import ReplayPlayer
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """Zeichnet einige Ticks einer kleinen Welt auf und merkt sich die Zustände"""
+    sim = Simulation(800, 600)
+    sim.spawn_entities(6)
+    for _ in range(10):
+        sim.spawn_food()
+    path = tmp_path / "lauf.replay"
+    sim.start_recording(path)
+
+    snapshots = []
+    for tick in range(300):
+        if tick == 100:
+            sim.spawn_entities(2)
+            sim.spawn_waste(300, 300, 1.0, 0.5)
+        if tick == 200:
+            sim.remove_entity(sim.entities[0])
+        sim.update(1 / 60)
+        snapshots.append({
+            'positions': [tuple(e.body.position) for e in sim.entities],
+            'energy': [e.energy for e in sim.entities],
+            'food': [tuple(f.body.position) for f in sim.food],
+            'waste': len(sim.waste),
+        })
+    sim.stop_recording()
+    return sim, path, snapshots
+
+
+class TestReplay:
+    def test_frames_match_simulation(self, recording):
+        """Testet, dass jeder Tick den Zustand der Simulation enthält"""
+        sim, path, snapshots = recording
+        player = ReplayPlayer(path)
+        assert len(player) == 300
+        assert len(player.dna) == 8  # 6 + 2 gespawnte Entities
+
+        for tick in (0, 150, 299, 42):
+            frame = player.frame(tick)
+            snapshot = snapshots[tick]
+            assert frame['tick'] == tick
+            n = frame['entity_count']
+            assert n == len(snapshot['positions'])
+            entities = frame['entities'][:n]
+            assert np.allclose(np.column_stack([entities['x'], entities['y']]),
+                               snapshot['positions'], atol=1e-2)
+            assert np.allclose(entities['energy'], snapshot['energy'], rtol=1e-5)
+            assert np.allclose(np.column_stack([frame['food']['x'], frame['food']['y']])[:frame['food_count']],
+                               np.array(snapshot['food']).reshape(-1, 2), atol=1e-2)
+            assert frame['waste_count'] == snapshot['waste']
+
+        # Die entfernte Entity fehlt ab Tick 200
+        assert 0 in player.frame(150)['entities']['id'][:8]
+        assert 0 not in player.frame(250)['entities']['id'][:7]
+
+    def test_player_draws_without_simulating(self, recording):
+        """Testet die Wiedergabe über Simulation.draw"""
+        sim, path, snapshots = recording
+        player = ReplayPlayer(path)
+        surface = pygame.Surface((800, 600))
+        player.draw(surface, tick=250)
+        assert len(player.simulation.entities) == 7
+        assert len(player.simulation.food) == len(snapshots[250]['food'])
+        position = player.simulation.entities[0].body.position
+        assert np.allclose(tuple(position), snapshots[250]['positions'][0], atol=1e-2)
+
+        # Zurückspringen nutzt dieselben Entity-Objekte
+        first = player.simulation.entities[0]
+        player.draw(surface, tick=120)
+        player.draw(surface, tick=250)
+        assert player.simulation.entities[0] is first
+        assert player.simulation.lifecycle.is_consistent()
+
+    def test_pooled_food_is_reread(self, tmp_path):
+        """Testet, dass wiederverwendete Nahrung mit ihren neuen Werten aufgezeichnet wird"""
+        sim = Simulation(800, 600)
+        path = tmp_path / "pool.replay"
+        recorder = sim.start_recording(path)
+        food = sim.spawn_food(100, 100, size=0.2, quality=0.1)
+        recorder.record(sim)
+        sim.remove_food(food)
+        reused = sim.spawn_food(200, 200, size=0.9, quality=0.95)
+        assert reused is food  # Objekt kommt aus dem Pool
+        recorder.record(sim)
+        sim.stop_recording()
+
+        frame = ReplayPlayer(path).frame(1)
+        assert frame['food_count'] == 1
+        item = frame['food'][0]
+        assert (item['x'], item['y']) == pytest.approx((200, 200))
+        assert (item['size'], item['quality']) == pytest.approx((0.9, 0.95))
+
+    def test_frames_sized_to_world(self, tmp_path):
+        """Testet, dass Datensätze nur die Objekte des Ticks enthalten und nichts abschneiden"""
+        from PyLife.replay import HEADER_DTYPE, frame_dtype
+        sim = Simulation(800, 600)
+        sim.spawn_entities(3)
+        path = tmp_path / "klein.replay"
+        recorder = sim.start_recording(path)
+        recorder.record(sim)
+        for _ in range(2100):
+            sim.spawn_food()
+        recorder.record(sim)
+        sim.stop_recording()
+
+        assert path.stat().st_size == (HEADER_DTYPE.itemsize + frame_dtype(3, 0, 0).itemsize
+                                       + frame_dtype(3, 2100, 0).itemsize)
+        player = ReplayPlayer(path)
+        assert player.frame(0)['food_count'] == 0
+        assert len(player.frame(1)['food']) == 2100
+        assert player.frame(-1)['entity_count'] == 3
+
+    def test_rejects_other_files(self, tmp_path):
+        """Testet die Prüfung des Dateikopfs"""
+        path = tmp_path / "kaputt.replay"
+        path.write_bytes(b"keine Replay-Datei" * 4)
+        with pytest.raises(ValueError):
+            ReplayPlayer(path)
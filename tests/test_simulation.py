@@ -17,7 +17,7 @@ class TestSimulation:
         assert simulation.space is not None
         assert simulation.entities == []
         assert simulation.food == []
-        assert simulation.waste == []
+        assert len(simulation.waste) == 0
         assert simulation.selected_entity is None
         assert simulation.generation == 1
         assert simulation.zoom == 1.0
@@ -38,6 +38,29 @@ class TestSimulation:
         assert entity.body.position.y <= simulation.height
         assert hasattr(entity, 'brain')  # Überprüfe Brain-Initialisierung
 
+    def test_spawn_entities(self, simulation):
+        """Testet das Spawnen vieler Entities in einem Durchgang"""
+        simulation.spawn_entity()
+        entities = simulation.spawn_entities(50)
+        assert len(entities) == 50
+        assert simulation.entities[1:] == entities
+        assert len(simulation.entity_state) == 51
+        assert simulation.lifecycle.is_consistent()
+        assert len({id(entity.brain) for entity in entities}) == 50
+        assert not np.array_equal(entities[0].brain.weights_ih, entities[1].brain.weights_ih)
+        for entity in entities:
+            assert 0 <= entity.body.position.x <= simulation.width
+            assert 0 <= entity.body.position.y <= simulation.height
+
+        # Vorgegebene DNA und Positionen
+        dnas = [entity.dna.copy() for entity in entities[:2]]
+        placed = simulation.spawn_entities(2, dnas=dnas, positions=[(10, 20), (30, 40)])
+        assert placed[0].dna is dnas[0]
+        assert tuple(placed[1].body.position) == (30, 40)
+        assert simulation.query_entities(10, 20, 1) == [placed[0]]
+        with pytest.raises(ValueError):
+            simulation.spawn_entities(3, dnas=dnas)
+
     def test_spawn_food(self, simulation):
         """Testet das Spawnen von Nahrung"""
         initial_count = len(simulation.food)
@@ -53,6 +76,37 @@ class TestSimulation:
         assert hasattr(food, 'energy_value')
         assert hasattr(food, 'quality')
 
+    def test_food_grid(self, simulation):
+        """Testet den räumlichen Index für Nahrung"""
+        simulation.spawn_food(100, 100)
+        simulation.spawn_food(500, 400)
+        near, far = simulation.food
+        
+        assert len(simulation.food_grid) == 2
+        assert simulation.query_food(110, 100, 20) == [near]
+        
+        simulation.remove_food(near)
+        assert near not in simulation.food_grid
+        assert simulation.query_food(110, 100, 20) == []
+        assert simulation.query_food(500, 400, 1) == [far]
+
+    def test_nearby_entities(self, simulation):
+        """Testet Nachbarschaftsabfragen über das Entity-Gitter"""
+        simulation.spawn_entity(100, 100)
+        simulation.spawn_entity(150, 100)
+        simulation.spawn_entity(700, 500)
+        first, second, far = simulation.entities
+        first.sensor_range = 80
+        
+        assert first.get_nearby_entities() == [second]
+        assert simulation.query_entities(100, 100, 10) == [first]
+        
+        counts = simulation.count_nearby_entities(radius=80)
+        assert list(counts) == [1, 1, 0]
+        
+        simulation.remove_entity(second)
+        assert first.get_nearby_entities() == []
+
     def test_entity_selection(self, simulation):
         """Testet die Entity-Auswahl"""
         # Spawne eine Entity
@@ -92,6 +146,26 @@ class TestSimulation:
             simulation.handle_zoom(-1, (400, 300))
         assert simulation.zoom >= 0.25  # Minimaler Zoom
 
+    def test_viewport_culling(self, simulation):
+        """Testet, dass nur Entities im sichtbaren Ausschnitt gezeichnet werden"""
+        simulation.spawn_entity()
+        simulation.spawn_entity()
+        inside, outside = simulation.entities
+        inside.body.position = (100, 100)
+        outside.body.position = (700, 500)
+
+        # Zoom 2 ohne Offset: sichtbar ist nur (0, 0) bis (200, 150) plus Rand
+        simulation.zoom = 2.0
+        surface = pygame.Surface((400, 300))
+        x0, y0, x1, y1 = simulation.visible_world_rect(surface, margin=0)
+        assert (x0, y0, x1, y1) == (0, 0, 200, 150)
+
+        drawn = []
+        for entity in simulation.entities:
+            entity.draw = lambda *args, entity=entity: drawn.append(entity)
+        simulation.draw(surface)
+        assert drawn == [inside]
+
     def test_entity_death(self, simulation):
         """Testet das Entfernen toter Entities"""
         # Spawne eine Entity
@@ -108,6 +182,48 @@ class TestSimulation:
         # Entity sollte entfernt worden sein
         assert entity not in simulation.entities
 
+    def test_dead_non_member_ignored(self, simulation):
+        """Testet, dass tote Entities außerhalb der Welt das Update nicht stören"""
+        from PyLife.creature import Entity
+        simulation.spawn_entity()
+        outsider = Entity(simulation.space, 100, 100, simulation=simulation, add_to_space=False)
+        outsider.health = 0
+        simulation.update(1 / 60)
+        assert outsider not in simulation.entities
+        assert len(simulation.entities) == 1
+        assert simulation.lifecycle.is_consistent()
+
+    def test_unattached_entity_unchanged(self, simulation):
+        """Testet, dass Entities außerhalb der Welt keine Zeile im Speicher belegen"""
+        from PyLife.creature import Entity
+        simulation.spawn_entity()
+        outsider = Entity(simulation.space, 100, 100, simulation=simulation, add_to_space=False)
+        vitals = (outsider.energy, outsider.health, outsider.hunger, outsider.age)
+        for _ in range(10):
+            simulation.update(1 / 60)
+        assert (outsider.energy, outsider.health, outsider.hunger, outsider.age) == vitals
+        assert len(simulation.entity_state) == len(simulation.entities) == 1
+
+        # Ersetzte Entities geben ihre Zeile frei
+        simulation.entities = [outsider]
+        assert simulation.entity_state.owners == [outsider]
+        assert outsider._store is simulation.entity_state
+
+    def test_entity_state_rows(self, simulation):
+        """Testet, dass der Zustandsspeicher die Population abbildet"""
+        for _ in range(3):
+            simulation.spawn_entity()
+        assert len(simulation.entity_state) == 3
+        
+        first, second, third = simulation.entities
+        third.energy = 12.5
+        simulation.remove_entity(first)
+        
+        assert len(simulation.entity_state) == 2
+        assert simulation.entity_state.owners[third._row] is third
+        assert third.energy == 12.5
+        assert first not in simulation.entities
+
     def test_food_consumption(self, simulation):
         """Testet die Nahrungsaufnahme"""
         # Spawne eine Entity und Nahrung
@@ -127,6 +243,35 @@ class TestSimulation:
         assert food not in simulation.food
         assert len(entity.digesting_food) > 0
 
+    def test_food_grid_synced_on_query(self, simulation):
+        """Testet, dass das Nahrungsgitter erst bei einer Abfrage abgeglichen wird"""
+        food = simulation.spawn_food(100, 100)
+        food.body.position = (600, 500)  # z.B. weggestoßen
+        simulation.update(1 / 60)
+        assert simulation._food_grid_dirty
+        
+        assert simulation.query_food(600, 500, 10) == [food]
+        assert not simulation._food_grid_dirty
+        assert simulation.query_food(100, 100, 10) == []
+
+    def test_food_eaten_once(self, simulation):
+        """Testet, dass Nahrung bei mehreren Kontakten nur einmal gefressen wird"""
+        simulation.spawn_food(400, 300)
+        simulation.spawn_entity(395, 300)
+        simulation.spawn_entity(405, 300)
+        food = simulation.food[0]
+        food.size = 0.2
+        for entity in simulation.entities:
+            entity.mouth_size = 1.0  # Beide könnten die Nahrung fressen
+
+        simulation.update(1 / 60)
+
+        assert food not in simulation.food
+        assert food not in simulation.food_grid
+        assert food.body not in simulation.space.bodies
+        eaten = sum(len(entity.digesting_food) for entity in simulation.entities)
+        assert eaten == 1
+
     def test_next_generation(self, simulation):
         """Testet die Generationswechsel"""
         # Spawne die initiale Population
@@ -148,6 +293,38 @@ class TestSimulation:
         survivors = [e for e in simulation.entities if e.food_eaten > 0]
         assert len(survivors) > 0
 
+    def test_population_fitness(self, simulation):
+        """Testet die vektorisierte Fitness gegen die Einzelberechnung"""
+        for _ in range(5):
+            simulation.spawn_entity()
+        for i, entity in enumerate(simulation.entities):
+            entity.food_eaten = i * 3
+            entity.children = i
+            entity.energy = entity.max_energy * i / 5
+        
+        fitness = simulation.population_fitness()
+        expected = [entity.fitness for entity in simulation.entities]
+        assert np.allclose(fitness, expected)
+
+    def test_breed_genomes(self, simulation):
+        """Testet Elternwahl und maskenbasierte Mutation auf der Genommatrix"""
+        for _ in range(3):
+            simulation.spawn_entity()
+        parents = simulation.entities
+        
+        genes, hormones = simulation._breed_genomes(parents, 50)
+        assert genes.shape == (50, len(parents[0].dna.genes))
+        assert hormones.shape == (50, len(parents[0].dna.hormone_levels))
+        
+        # Jedes Kind stammt von einem Elternteil ab und weicht höchstens um die
+        # (auf [0, 1] begrenzte) Mutation ab
+        parent_genes = np.stack([parent.dna.genes for parent in parents])[None]
+        low = np.minimum(parent_genes, np.clip(parent_genes - 0.05, 0.0, 1.0))
+        high = np.maximum(parent_genes, np.clip(parent_genes + 0.05, 0.0, 1.0))
+        child_genes = genes[:, None, :]
+        from_parent = np.all((low <= child_genes) & (child_genes <= high), axis=2)
+        assert np.all(from_parent.any(axis=1))
+
     def test_brain_updates(self, simulation):
         """Testet die Gehirn-Updates der Entities"""
         simulation.spawn_entity()
@@ -165,6 +342,85 @@ class TestSimulation:
                 assert not np.array_equal(entity.brain_output, initial_output)
             initial_output = entity.brain_output.copy()
 
+    def test_activations_only_for_selected(self, simulation):
+        """Testet, dass nur die ausgewählte Entity Aktivierungen speichert"""
+        simulation.batched_inference = False
+        simulation.spawn_entities(2)
+        selected, other = simulation.entities
+        simulation.selected_entity = selected
+        simulation.update(1 / 60)
+        assert hasattr(selected.brain, 'neuron_values')
+        assert not hasattr(other.brain, 'neuron_values')
+        assert other.brain_output.shape == (1, 2)
+
+    def test_activations_on_selection(self, simulation):
+        """Testet, dass die Auswahl ohne Tick Aktivierungen für die Netzansicht liefert"""
+        simulation.spawn_entity()
+        entity = simulation.entities[0]
+        simulation.handle_click(tuple(entity.body.position))
+        assert simulation.selected_entity is entity
+        inputs = np.array(entity.brain_input_values())
+        assert np.allclose(entity.brain.input_values, inputs)
+        assert np.allclose(entity.brain.output_values, np.tanh(entity.brain.infer(inputs.reshape(1, -1))))
+
+    def test_fixed_timestep(self, simulation, monkeypatch):
+        """Testet den Zeitspeicher von advance (feste Ticks, Obergrenze pro Frame)"""
+        steps = []
+        monkeypatch.setattr(simulation, 'update', steps.append)
+        step = simulation.fixed_timestep
+        
+        # Viertel-Zeitschritte sammeln sich zu einem Tick
+        assert [simulation.advance(step, 0.25) for _ in range(4)] == [0, 0, 0, 1]
+        # 2,5 Zeitschritte: zwei Ticks, der Rest bleibt im Zeitspeicher
+        assert simulation.advance(step * 2.5) == 2
+        assert simulation.accumulator == pytest.approx(step / 2)
+        assert steps == [step] * 3
+        
+        # Ein langer Frame läuft höchstens max_steps_per_frame Ticks, der Rückstand verfällt
+        simulation.max_steps_per_frame = 4
+        assert simulation.advance(1.0) == 4
+        assert simulation.accumulator < step
+        assert simulation.dropped_time > 0
+        assert simulation.advance(0.0) == 0
+
+    def test_physics_substeps(self, simulation, monkeypatch):
+        """Testet die Unterteilung des Physikschritts"""
+        simulation.spawn_entity()
+        step_sizes = []
+        step = simulation.space.step
+        monkeypatch.setattr(simulation.space, 'step', lambda dt: (step_sizes.append(dt), step(dt)))
+        simulation.physics_substeps = 4
+        simulation.update(1 / 60)
+        assert step_sizes == [pytest.approx(1 / 240)] * 4
+
+    def test_batched_brain_inference(self, simulation):
+        """Testet, dass die gebatchte Auswertung der Einzelauswertung entspricht"""
+        for _ in range(5):
+            simulation.spawn_entity()
+        simulation.selected_entity = simulation.entities[2]
+        
+        outputs = simulation._evaluate_brains(simulation.entities)
+        assert outputs.shape == (5, 2)
+        for i, entity in enumerate(simulation.entities):
+            inputs = np.array(entity.brain_input_values()).reshape(1, -1)
+            assert np.allclose(outputs[i:i + 1], entity.brain.forward(inputs))
+        
+        # Die ausgewählte Entity wurde für die Visualisierung einzeln ausgewertet
+        selected = simulation.selected_entity
+        assert np.allclose(selected.brain.output_values, np.tanh(outputs[2]))
+
+    def test_brain_batch_after_replacing_population(self, simulation):
+        """Testet, dass eine gleich große neue Population mit ihren eigenen Gehirnen ausgewertet wird"""
+        simulation.spawn_entities(4)
+        first, second = simulation.entities[:2], simulation.entities[2:]
+        simulation.entities = first
+        simulation._evaluate_brains(first)
+        simulation.entities = second
+        outputs = simulation._evaluate_brains(second)
+        for i, entity in enumerate(second):
+            inputs = np.array(entity.brain_input_values()).reshape(1, -1)
+            assert np.allclose(outputs[i:i + 1], entity.brain.infer(inputs))
+
     def test_fitness_based_selection(self, simulation):
         """Testet die fitnessbasierte Selektion"""
         # Spawne Entities mit verschiedenen Fitness-Werten
@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+from PyLife.spatial_grid import SpatialHashGrid, count_within_radius
+
+@pytest.fixture
+def grid():
+    """Erstellt ein leeres Gitter"""
+    return SpatialHashGrid(cell_size=10)
+
+class TestSpatialHashGrid:
+    def test_insert_and_query(self, grid):
+        """Testet, dass Objekte in benachbarten Zellen gefunden werden"""
+        grid.insert('a', 5, 5)
+        grid.insert('b', 15, 5)
+        grid.insert('c', 100, 100)
+        
+        found = set(grid.query(8, 5, 5))
+        assert found == {'a', 'b'}
+        assert len(grid) == 3
+
+    def test_remove(self, grid):
+        """Testet das Entfernen von Objekten"""
+        grid.insert('a', 5, 5)
+        grid.remove('a')
+        assert 'a' not in grid
+        assert list(grid.query(5, 5, 10)) == []
+        assert grid.cells == {}
+        
+        # discard ignoriert unbekannte Objekte
+        grid.discard('a')
+        with pytest.raises(KeyError):
+            grid.remove('a')
+
+    def test_move(self, grid):
+        """Testet das Verschieben in eine andere Zelle"""
+        grid.insert('a', 5, 5)
+        grid.move('a', 55, 55)
+        assert list(grid.query(5, 5, 1)) == []
+        assert list(grid.query(55, 55, 1)) == ['a']
+
+    def test_negative_coordinates(self, grid):
+        """Testet Positionen außerhalb des positiven Quadranten"""
+        grid.insert('a', -5, -5)
+        assert list(grid.query(-1, -1, 5)) == ['a']
+
+    def test_invalid_cell_size(self):
+        """Testet die Validierung der Zellgröße"""
+        with pytest.raises(ValueError):
+            SpatialHashGrid(cell_size=0)
+
+
+class TestCountWithinRadius:
+    def test_matches_brute_force(self):
+        """Testet die vektorisierte Zählung gegen alle Paare"""
+        rng = np.random.default_rng(0)
+        positions = rng.uniform(-200, 800, (300, 2))
+        radii = rng.uniform(20, 120, 300)
+        distances = np.linalg.norm(positions[:, None] - positions[None], axis=-1)
+        expected = (distances <= radii[:, None]).sum(axis=1) - 1
+
+        assert np.array_equal(count_within_radius(positions, radii), expected)
+        assert np.array_equal(count_within_radius(positions, radii, cell_size=30), expected)
+
+    def test_scalar_radius_and_small_inputs(self):
+        """Testet skalaren Radius sowie leere und einelementige Eingaben"""
+        positions = [(0, 0), (3, 4), (100, 100)]
+        assert list(count_within_radius(positions, 5.0)) == [1, 1, 0]
+        assert list(count_within_radius([(1, 1)], 10.0)) == [0]
+        assert len(count_within_radius(np.zeros((0, 2)), 10.0)) == 0
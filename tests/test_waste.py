@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+import pygame
+from PyLife.world_waste import WasteField
+
+
+@pytest.fixture
+def field():
+    """Erstellt ein Abfallfeld mit kleiner Startkapazität"""
+    return WasteField(capacity=2)
+
+
+class TestWasteField:
+    def test_add_and_grow(self, field):
+        """Testet das Hinzufügen über die Startkapazität hinaus"""
+        for i in range(5):
+            field.add(10 * i, 20, 1.0, 0.5)
+        assert len(field) == 5
+        assert field.capacity >= 5
+        assert list(field.x[:5]) == [0, 10, 20, 30, 40]
+        assert field.decay_time[0] == 300
+        assert np.allclose(field.radius, 3.0)
+
+    def test_update_culls_decayed(self, field):
+        """Testet Altern und Entfernen zerfallenen Abfalls"""
+        field.add(1, 1, 0.01, 0.5)   # Zerfallszeit 3 Ticks
+        field.add(2, 2, 1.0, 0.5)    # Zerfallszeit 300 Ticks
+        field.add(3, 3, 0.01, 0.5)
+
+        for _ in range(2):
+            assert field.update(1 / 60) == 0
+        assert field.update(1 / 60) == 2
+
+        assert len(field) == 1
+        assert field.x[0] == 2
+        assert field.age[0] == 3
+
+    def test_draw_visible_only(self, field):
+        """Testet das Zeichnen nur des sichtbaren Ausschnitts"""
+        field.add(10, 10, 2.0, 0.5)
+        field.add(500, 500, 2.0, 0.5)
+        assert list(field.visible_rows((0, 0, 100, 100))) == [0]
+
+        surface = pygame.Surface((100, 100))
+        surface.fill((255, 255, 255))
+        field.draw(surface, rect=(0, 0, 100, 100))
+        assert surface.get_at((10, 10)) != (255, 255, 255)
+
+    def test_sprites_shared_and_stable(self, field):
+        """Testet, dass Sprites pro Schlüssel einmal gerendert und wiederverwendet werden"""
+        for i in range(50):
+            field.add(5 + i, 50, 1.0, 0.5)
+        keys = {tuple(key) for key in field.sprite_keys(np.arange(len(field))).tolist()}
+
+        first = pygame.Surface((100, 100))
+        field.draw(first)
+        assert len(field._sprites) == len(keys) <= WasteField.SHADE_LEVELS * WasteField.PATTERN_VARIANTS
+        sprites = dict(field._sprites)
+
+        # Zweiter Frame: gleiche Sprites, identisches Bild (kein Flackern)
+        second = pygame.Surface((100, 100))
+        field.draw(second)
+        assert all(field._sprites[key] is sprite for key, sprite in sprites.items())
+        assert pygame.image.tostring(first, 'RGB') == pygame.image.tostring(second, 'RGB')
+
+        # Neue Zoomstufe verwirft den Cache
+        field.draw(second, zoom=2.0)
+        assert field._sprite_zoom == 2.0
+        assert all(sprite.get_width() > sprites[key].get_width() for key, sprite in field._sprites.items())
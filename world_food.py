@@ -2,6 +2,12 @@ import pygame
 import pymunk
 import numpy as np
 import random
+from typing import Tuple
+from PyLife import collision_types
+
+# Quantisierung der Nahrungs-Sprites im Atlas
+FOOD_SIZE_QUANTUM = 0.05
+FOOD_QUALITY_QUANTUM = 0.05
 
 class Food:
     def __init__(self, space, x, y, size=None, quality=None):
@@ -20,6 +26,8 @@ class Food:
         self.shape = pymunk.Circle(self.body, self.radius)
         self.shape.elasticity = 0.7
         self.shape.friction = 0.5
+        self.shape.collision_type = collision_types.FOOD
+        self.shape.owner = self
         space.add(self.body, self.shape)
         
         # Energie-Wert basierend auf Größe und Qualität
@@ -32,6 +40,31 @@ class Food:
         # Farbe basierend auf Qualität berechnen
         self._calculate_color()
     
+    def reset(self, x, y, size=None, quality=None):
+        """Setzt ein (aus dem Pool wiederverwendetes) Nahrungsobjekt neu auf
+        
+        Körper und Shape bleiben erhalten; Radius, Masse und Bewegungszustand
+        werden neu gesetzt.
+        """
+        self._size = size if size is not None else random.uniform(0.2, 1.0)
+        self.quality = quality if quality is not None else random.uniform(0.0, 1.0)
+        
+        # Physikalische Eigenschaften
+        self.radius = 5 + 10 * self._size
+        self.mass = self.radius * 0.3
+        self.body.moment = pymunk.moment_for_circle(self.mass, 0, self.radius)
+        self.shape.unsafe_set_radius(self.radius)
+        self.body.position = x, y
+        self.body.velocity = (0, 0)
+        self.body.angular_velocity = 0
+        self.body.angle = 0
+        
+        # Abgeleitete Werte
+        self.energy_value = self._size * 50 * self.quality
+        self.glow_radius = int(self.radius * self.quality) if self.quality > 0.5 else 0
+        self.glow_alpha = int(255 * self.quality) if self.quality > 0.5 else 0
+        self._calculate_color()
+    
     def _calculate_color(self):
         """Berechnet die Farbe basierend auf der Qualität"""
         # Grün-Komponente basierend auf Qualität
@@ -70,45 +103,129 @@ class Food:
                 self.glow_radius = int(self.radius * self.quality) if self.quality > 0.5 else 0
                 self.glow_alpha = int(255 * self.quality) if self.quality > 0.5 else 0
     
-    def draw(self, surface):
-        """Zeichnet das Nahrungsobjekt"""
-        # Position auf dem Bildschirm
-        screen_pos = (int(self.body.position.x), int(self.body.position.y))
-        
-        # Glow-Effekt zeichnen wenn Qualität hoch genug
-        if self.quality > 0.5:
-            glow_surface = pygame.Surface((self.glow_radius * 2, self.glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*self.color, self.glow_alpha), 
-                             (self.glow_radius, self.glow_radius), self.glow_radius)
-            surface.blit(glow_surface, (screen_pos[0] - self.glow_radius, 
-                                      screen_pos[1] - self.glow_radius))
-        
-        # Hauptkörper zeichnen
-        pygame.draw.circle(surface, self.color, screen_pos, self.radius)
+    def draw(self, surface, offset=(0, 0), zoom=1.0, atlas=None):
+        """Zeichnet das Nahrungsobjekt
         
-        # Qualitätsindikator (innerer Kreis)
-        inner_radius = max(2, self.radius * 0.3)
-        pygame.draw.circle(surface, (255, 255, 255), screen_pos, inner_radius)
-        
-        # Highlight für 3D-Effekt
-        highlight_pos = (int(screen_pos[0] - self.radius * 0.3), 
-                        int(screen_pos[1] - self.radius * 0.3))
-        highlight_radius = int(self.radius * 0.4)
-        highlight_color = (
-            min(255, self.color[0] + 40),
-            min(255, self.color[1] + 40),
-            min(255, self.color[2] + 40)
-        )
-        pygame.draw.circle(surface, highlight_color, 
-                         highlight_pos, highlight_radius)
-        
-        # Qualitätsmarkierung (kleine Punkte für hochwertige Nahrung)
-        if self.quality > 0.7:
-            dots = int(3 + (self.quality - 0.7) * 5)  # 3-8 Punkte je nach Qualität
-            for i in range(dots):
-                angle = (2 * np.pi * i) / dots
-                dot_x = screen_pos[0] + np.cos(angle) * (self.radius * 0.6)
-                dot_y = screen_pos[1] + np.sin(angle) * (self.radius * 0.6)
-                pygame.draw.circle(surface, (255, 255, 255), 
-                                 (int(dot_x), int(dot_y)), 
-                                 int(self.radius * 0.15)) 
\ No newline at end of file
+        ``offset`` und ``zoom`` bilden Weltkoordinaten auf Bildschirmkoordinaten ab.
+        Das Sprite stammt aus ``atlas`` (Standard: gemeinsamer ``FOOD_ATLAS``).
+        """
+        sprite = (atlas or FOOD_ATLAS).sprite(self._size, self.quality, zoom)
+        half = sprite.get_width() // 2
+        surface.blit(sprite, (int(self.body.position.x * zoom + offset[0]) - half,
+                              int(self.body.position.y * zoom + offset[1]) - half))
+
+
+def _render_food(surface, screen_pos, radius, quality):
+    """Zeichnet Nahrung der Qualität ``quality`` mit Bildschirmradius ``radius``"""
+    color = (0, int(255 * quality), 0)
+    
+    # Glow-Effekt zeichnen wenn Qualität hoch genug
+    if quality > 0.5:
+        glow_radius = max(1, int(radius * quality))
+        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(glow_surface, (*color, int(255 * quality)), 
+                         (glow_radius, glow_radius), glow_radius)
+        surface.blit(glow_surface, (screen_pos[0] - glow_radius, 
+                                  screen_pos[1] - glow_radius))
+    
+    # Hauptkörper zeichnen
+    pygame.draw.circle(surface, color, screen_pos, radius)
+    
+    # Qualitätsindikator (innerer Kreis)
+    inner_radius = max(2, radius * 0.3)
+    pygame.draw.circle(surface, (255, 255, 255), screen_pos, inner_radius)
+    
+    # Highlight für 3D-Effekt
+    highlight_pos = (int(screen_pos[0] - radius * 0.3), 
+                    int(screen_pos[1] - radius * 0.3))
+    highlight_radius = int(radius * 0.4)
+    highlight_color = (
+        min(255, color[0] + 40),
+        min(255, color[1] + 40),
+        min(255, color[2] + 40)
+    )
+    pygame.draw.circle(surface, highlight_color, 
+                     highlight_pos, highlight_radius)
+    
+    # Qualitätsmarkierung (kleine Punkte für hochwertige Nahrung)
+    if quality > 0.7:
+        dots = int(3 + (quality - 0.7) * 5)  # 3-8 Punkte je nach Qualität
+        for i in range(dots):
+            angle = (2 * np.pi * i) / dots
+            dot_x = screen_pos[0] + np.cos(angle) * (radius * 0.6)
+            dot_y = screen_pos[1] + np.sin(angle) * (radius * 0.6)
+            pygame.draw.circle(surface, (255, 255, 255), 
+                             (int(dot_x), int(dot_y)), 
+                             int(radius * 0.15))
+
+
+class FoodAtlas:
+    """Sprite-Atlas für Nahrung
+    
+    Das Aussehen von Nahrung hängt nur von Größe und Qualität ab. Beide werden
+    auf ``size_quantum``/``quality_quantum`` gerundet; pro Stufe wird ein
+    Sprite (inkl. Glow) einmalig gerendert und danach nur noch geblittet.
+    Die Sprites gelten für eine Zoomstufe und werden bei Zoomwechsel verworfen.
+    """
+    
+    def __init__(self, size_quantum=FOOD_SIZE_QUANTUM, quality_quantum=FOOD_QUALITY_QUANTUM):
+        self.size_quantum = size_quantum
+        self.quality_quantum = quality_quantum
+        self._sprites = {}  # (Größenstufe, Qualitätsstufe) -> Surface
+        self._zoom = None
+        self.renders = 0  # Anzahl gerenderter Sprites
+    
+    def __len__(self):
+        return len(self._sprites)
+    
+    def key(self, size, quality) -> Tuple[int, int]:
+        """Gibt den Atlas-Schlüssel für Größe und Qualität zurück"""
+        return (int(round(size / self.size_quantum)), int(round(quality / self.quality_quantum)))
+    
+    def _render(self, key, zoom):
+        """Rendert das Sprite einer Atlas-Stufe"""
+        size = key[0] * self.size_quantum
+        quality = min(1.0, max(0.0, key[1] * self.quality_quantum))
+        radius = (5 + 10 * size) * zoom
+        half = int(np.ceil(radius)) + 1
+        sprite = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
+        _render_food(sprite, (half, half), radius, quality)
+        self.renders += 1
+        return sprite
+    
+    def _check_zoom(self, zoom):
+        """Verwirft alle Sprites, wenn sich die Zoomstufe geändert hat"""
+        if zoom != self._zoom:
+            self._sprites.clear()
+            self._zoom = zoom
+    
+    def sprite(self, size, quality, zoom=1.0):
+        """Gibt das Sprite für Größe und Qualität zurück (rendert es bei Bedarf)"""
+        self._check_zoom(zoom)
+        key = self.key(size, quality)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = self._render(key, zoom)
+        return sprite
+    
+    def draw(self, surface, foods, offset=(0, 0), zoom=1.0):
+        """Zeichnet alle ``foods`` mit einem einzigen ``Surface.blits``-Aufruf"""
+        self._check_zoom(zoom)
+        sprites = self._sprites
+        size_quantum = self.size_quantum
+        quality_quantum = self.quality_quantum
+        off_x, off_y = offset
+        blits = []
+        for food in foods:
+            key = (int(round(food._size / size_quantum)), int(round(food.quality / quality_quantum)))
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = sprites[key] = self._render(key, zoom)
+            half = sprite.get_width() // 2
+            pos = food.body.position
+            blits.append((sprite, (int(pos.x * zoom + off_x) - half, int(pos.y * zoom + off_y) - half)))
+        surface.blits(blits, doreturn=False)
+
+
+# Gemeinsamer Atlas für ``Food.draw`` ohne eigenen Atlas
+FOOD_ATLAS = FoodAtlas()
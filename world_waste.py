@@ -1,75 +1,181 @@
 import pygame
-import pymunk
 import numpy as np
 
-class Waste:
-    def __init__(self, space, x, y, size, quality):
-        """Initialisiert ein Abfall-Objekt"""
-        self.size = size  # Größe des Abfalls
-        self.quality = quality  # Ursprüngliche Qualität der Nahrung
-        self.age = 0  # Alter des Abfalls
-        self.decay_time = int(300 * size)  # Zeit bis zum Verschwinden
-        
-        # Physikalische Eigenschaften
-        self.radius = 3 * size  # Basis-Radius für Kollision
-        self.mass = 0.05 * size
-        
-        # Physik-Body erstellen
-        moment = pymunk.moment_for_circle(self.mass, 0, self.radius)
-        self.body = pymunk.Body(self.mass, moment, pymunk.Body.STATIC)
-        self.body.position = x, y
+
+class WasteField:
+    """Abfall als vektorisiertes Partikelsystem
+
+    Jedes Abfallstück ist eine Zeile in NumPy-Arrays (Position, Größe,
+    Qualität, Alter, Zerfallszeit, Farbton). Abfall braucht keine
+    Starrkörperphysik und liegt daher nicht im ``pymunk.Space``; Altern und
+    Entfernen laufen als eine vektorisierte Operation pro Tick. Die aktiven
+    Zeilen sind immer ``[0, count)``. Gezeichnet wird aus einem Cache
+    vorgerenderter Sprites (siehe ``draw``).
+    """
+
+    COLUMNS = ('x', 'y', 'size', 'quality', 'age', 'decay_time', 'shade', 'variant')
+
+    # Grundfarbe (Braun); ``shade`` verschiebt alle Kanäle um bis zu ±20
+    BASE_COLOR = (139, 69, 19)
+
+    # Sprites werden für gerundete Größen/Farbtöne einmalig gerendert und geteilt
+    SIZE_QUANTUM = 0.05
+    SHADE_LEVELS = 5
+    PATTERN_VARIANTS = 4  # Verschiedene Punktmuster pro Größe und Farbton
+
+    def __init__(self, capacity=64):
+        """Initialisiert ein leeres Abfallfeld"""
+        self.capacity = max(1, capacity)
+        self.count = 0
+        for name in self.COLUMNS:
+            setattr(self, name, np.zeros(self.capacity))
         
-        # Shape erstellen
-        self.shape = pymunk.Circle(self.body, self.radius)
-        self.shape.friction = 0.3
-        self.shape.elasticity = 0.1
+        # Sprite-Cache: (Größe, Farbton, Variante) -> Surface für ``_sprite_zoom``
+        self._sprites = {}
+        self._sprite_zoom = None
+
+    def _grow(self):
+        """Verdoppelt die Kapazität aller Spalten"""
+        new_capacity = self.capacity * 2
+        for name in self.COLUMNS:
+            column = np.zeros(new_capacity)
+            column[:self.capacity] = getattr(self, name)
+            setattr(self, name, column)
+        self.capacity = new_capacity
+
+    def add(self, x, y, size, quality) -> int:
+        """Fügt ein Abfallstück hinzu und gibt seine Zeile zurück"""
+        if self.count >= self.capacity:
+            self._grow()
+        row = self.count
+        self.x[row] = x
+        self.y[row] = y
+        self.size[row] = size
+        self.quality[row] = quality
+        self.age[row] = 0
+        self.decay_time[row] = int(300 * size)  # Zeit bis zum Verschwinden
+        self.shade[row] = np.random.uniform(-20, 20)
+        self.variant[row] = np.random.randint(self.PATTERN_VARIANTS)
+        self.count += 1
+        return row
+
+    def update(self, dt) -> int:
+        """Lässt allen Abfall altern und entfernt zerfallenen Abfall
+
+        Das Alter zählt (wie bisher) in Ticks. Gibt die Anzahl der
+        entfernten Stücke zurück.
+        """
+        n = self.count
+        if n == 0:
+            return 0
+        self.age[:n] += 1
+        alive = self.age[:n] < self.decay_time[:n]
+        remaining = int(np.count_nonzero(alive))
+        if remaining != n:
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                column[:remaining] = column[:n][alive]
+            self.count = remaining
+        return n - remaining
+
+    def to_arrays(self) -> dict:
+        """Gibt Kopien der aktiven Zeilen aller Spalten zurück (``COLUMNS`` -> Array)"""
+        return {name: getattr(self, name)[:self.count].copy() for name in self.COLUMNS}
+
+    @classmethod
+    def from_arrays(cls, arrays) -> 'WasteField':
+        """Erstellt ein Abfallfeld aus Spalten-Arrays (Gegenstück zu ``to_arrays``)"""
+        count = len(arrays['x'])
+        field = cls(capacity=count)
+        for name in cls.COLUMNS:
+            getattr(field, name)[:count] = arrays[name]
+        field.count = count
+        return field
+
+    def clear(self):
+        """Entfernt allen Abfall"""
+        self.count = 0
+
+    @property
+    def radius(self) -> np.ndarray:
+        """Radien aller aktiven Abfallstücke"""
+        return 3 * self.size[:self.count]
+
+    def __len__(self):
+        return self.count
+
+    def visible_rows(self, rect) -> np.ndarray:
+        """Gibt die Zeilen zurück, deren Mittelpunkt im Rechteck (x0, y0, x1, y1) liegt"""
+        n = self.count
+        x0, y0, x1, y1 = rect
+        x = self.x[:n]
+        y = self.y[:n]
+        return np.flatnonzero((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1))
+
+    def _bake_sprite(self, size_bucket, shade_bucket, variant, zoom):
+        """Rendert ein Abfall-Sprite einmalig (Muster deterministisch pro Schlüssel)"""
+        world_radius = 3 * size_bucket * self.SIZE_QUANTUM
+        radius = world_radius * zoom
+        variation = -20 + 40 * shade_bucket / (self.SHADE_LEVELS - 1)
+        base_r, base_g, base_b = self.BASE_COLOR
+        color = (
+            min(255, max(0, int(base_r + variation))),
+            min(255, max(0, int(base_g + variation))),
+            min(255, max(0, int(base_b + variation)))
+        )
+        pattern_color = (
+            max(0, color[0] - 20),
+            max(0, color[1] - 20),
+            max(0, color[2] - 20)
+        )
         
-        # Zur Physik-Engine hinzufügen
-        space.add(self.body, self.shape)
+        half = int(np.ceil(radius)) + 1
+        sprite = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
         
-        # Farbe (Brauntöne)
-        brown_variation = np.random.uniform(-20, 20)
-        self.color = (
-            min(255, max(0, int(139 + brown_variation))),  # Basis: Braun
-            min(255, max(0, int(69 + brown_variation))),
-            min(255, max(0, int(19 + brown_variation)))
-        )
-    
-    def update(self, dt):
-        """Aktualisiert den Zustand des Abfalls"""
-        self.age += 1
+        # Hauptkörper des Abfalls
+        pygame.draw.circle(sprite, color, (half, half), int(radius))
         
-        # Abfall verschwindet nach einiger Zeit
-        if self.age >= self.decay_time:
-            return False
-        return True
+        # Textur/Muster für mehr Detail (feste Punkte statt Neuwürfeln pro Frame)
+        rng = np.random.default_rng((size_bucket, shade_bucket, variant))
+        dots = int(world_radius * 2)
+        angles = rng.uniform(0, 2 * np.pi, dots)
+        distances = rng.uniform(0, radius * 0.8, dots)
+        dot_radius = max(1, int(radius * 0.1))
+        for dot_x, dot_y in zip(half + np.cos(angles) * distances,
+                                half + np.sin(angles) * distances):
+            pygame.draw.circle(sprite, pattern_color, (int(dot_x), int(dot_y)), dot_radius)
+        return sprite
     
-    def is_depleted(self):
-        """Prüft, ob der Abfall verschwunden ist"""
-        return self.age >= self.decay_time
+    def sprite_keys(self, rows) -> np.ndarray:
+        """Berechnet die Sprite-Schlüssel (Größe, Farbton, Variante) der Zeilen als (N×3)-Array"""
+        size_bucket = np.rint(self.size[rows] / self.SIZE_QUANTUM).astype(np.int64)
+        shade_bucket = np.rint((self.shade[rows] + 20) / 40 * (self.SHADE_LEVELS - 1)).astype(np.int64)
+        return np.stack([size_bucket, shade_bucket, self.variant[rows].astype(np.int64)], axis=1)
     
-    def draw(self, screen):
-        """Zeichnet den Abfall"""
-        pos = self.body.position
+    def draw(self, screen, offset=(0, 0), zoom=1.0, rect=None):
+        """Zeichnet den Abfall (nur im Rechteck ``rect`` in Weltkoordinaten, falls gesetzt)
         
-        # Hauptkörper des Abfalls
-        pygame.draw.circle(screen, self.color,
-                         (int(pos.x), int(pos.y)),
-                         int(self.radius))
+        Alle Stücke werden mit einem einzigen ``Surface.blits``-Aufruf aus
+        vorgerenderten Sprites gezeichnet. ``offset`` und ``zoom`` bilden
+        Weltkoordinaten auf Bildschirmkoordinaten ab.
+        """
+        rows = np.arange(self.count) if rect is None else self.visible_rows(rect)
+        if len(rows) == 0:
+            return
         
-        # Textur/Muster für mehr Detail
-        pattern_color = (
-            max(0, self.color[0] - 20),
-            max(0, self.color[1] - 20),
-            max(0, self.color[2] - 20)
-        )
+        # Sprites gelten für eine Zoomstufe
+        if zoom != self._sprite_zoom:
+            self._sprites.clear()
+            self._sprite_zoom = zoom
+        sprites = self._sprites
         
-        # Zufällige Punkte für Textur
-        for _ in range(int(self.radius * 2)):
-            angle = np.random.uniform(0, 2 * np.pi)
-            r = np.random.uniform(0, self.radius * 0.8)
-            x = pos.x + np.cos(angle) * r
-            y = pos.y + np.sin(angle) * r
-            pygame.draw.circle(screen, pattern_color,
-                             (int(x), int(y)),
-                             max(1, int(self.radius * 0.1))) 
\ No newline at end of file
+        screen_x = (self.x[rows] * zoom + offset[0]).tolist()
+        screen_y = (self.y[rows] * zoom + offset[1]).tolist()
+        blits = []
+        for key, pos_x, pos_y in zip(map(tuple, self.sprite_keys(rows).tolist()), screen_x, screen_y):
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = sprites[key] = self._bake_sprite(*key, zoom)
+            half = sprite.get_width() // 2
+            blits.append((sprite, (int(pos_x) - half, int(pos_y) - half)))
+        screen.blits(blits, doreturn=False)